@@ -86,6 +86,31 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local-memory caches are per process. Point this at Redis / Memcached in
+# production so every worker shares the cached catalog pages.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "goalstox",
+    }
+}
+
+# Seconds a rendered catalog page (PMS / AIF listings) stays cached
+CATALOG_CACHE_TIMEOUT = 60 * 60
+# Seconds a worker trusts its cached catalog version before re-reading the
+# CatalogVersion row, i.e. how long other processes' writes can go unseen
+CATALOG_VERSION_TTL = 5
+# Deploy identifier (e.g. the commit) in catalog page-cache keys and ETags.
+# None uses the newest modification time of the project's code and templates.
+CATALOG_RELEASE = None
+
+# Annual risk-free rate used for Sharpe ratios (fund analytics)
+FUNDDETAILS_RISK_FREE_RATE = 0.065
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -136,6 +161,26 @@ AUTH_USER_MODEL = "users.CustomUser"
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "noreply@goalstox.com"
+
+# OTP emails / SMS are queued and sent by `python manage.py run_otp_worker`
+OTP_OUTBOX_MAX_ATTEMPTS = 5
+OTP_OUTBOX_BACKOFF_SECONDS = 5
+# Days FAILED deliveries are kept for inspection; sent ones are deleted at once
+OTP_OUTBOX_FAILED_RETENTION_DAYS = 7
+# Where new OTPs are echoed for development (otps/sinks.py); none in production
+OTP_DEBUG_SINKS = ["console", "file"] if DEBUG else []
+# OTPPurpose -> "db" (default) or "cache": where live OTPs are stored
+# (otps/cache_store.py). "cache" needs CACHES shared by all workers, e.g.
+# {"LOGIN": "cache"} once CACHES points at Redis / Memcached.
+OTP_STORE_BACKENDS = {}
+# Write cache-store audit records from a background thread
+OTP_AUDIT_ASYNC = True
+# Per purpose: (scope, max requests, window seconds) for sending / verifying
+# OTPs, scope "email" or "ip" (otps/ratelimit.py)
+OTP_RATE_LIMITS = {
+    "send": [("email", 3, 60), ("email", 10, 60 * 60), ("ip", 30, 60 * 60)],
+    "verify": [("email", 10, 10 * 60), ("ip", 50, 10 * 60)],
+}
 # Session should expire when browser is closed
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 
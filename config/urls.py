@@ -24,6 +24,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("homepage.urls", namespace="homepage")),
     path("users/", include(("users.urls", "users"), namespace="users")),
+    path("funds/", include("funddetails.urls", namespace="funddetails")),
 ]
 
 urlpatterns += staticfiles_urlpatterns()
@@ -1,3 +1,84 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import (
+    MutualFundNAV,
+    MutualFundScheme,
+    SchemeAnalytics,
+    SchemePeerRank,
+    SchemeReturnSnapshot,
+)
+
+
+@admin.register(SchemeReturnSnapshot)
+class SchemeReturnSnapshotAdmin(admin.ModelAdmin):
+    list_display = (
+        "scheme_type",
+        "scheme_id",
+        "as_of",
+        "one_year_return",
+        "three_year_return",
+        "aum",
+    )
+    list_filter = ("scheme_type", "as_of")
+    search_fields = ("scheme_id",)
+    ordering = ("-as_of",)
+
+
+@admin.register(MutualFundScheme)
+class MutualFundSchemeAdmin(admin.ModelAdmin):
+    list_display = (
+        "amfi_code",
+        "scheme_name",
+        "amc_name",
+        "category",
+        "latest_nav",
+        "latest_nav_date",
+        "is_active",
+    )
+    list_filter = ("is_active", "category")
+    search_fields = ("scheme_name", "amc_name", "=amfi_code", "isin_growth")
+    readonly_fields = ("latest_nav", "latest_nav_date", "created_at", "updated_at")
+
+
+@admin.register(MutualFundNAV)
+class MutualFundNAVAdmin(admin.ModelAdmin):
+    list_display = ("scheme", "nav_date", "nav")
+    list_select_related = ("scheme",)
+    raw_id_fields = ("scheme",)
+    search_fields = ("=scheme__amfi_code",)
+    # Tens of millions of rows: skip the unfiltered COUNT(*)
+    show_full_result_count = False
+
+
+@admin.register(SchemeAnalytics)
+class SchemeAnalyticsAdmin(admin.ModelAdmin):
+    list_display = (
+        "scheme_type",
+        "scheme_id",
+        "end_date",
+        "cagr_1y",
+        "cagr_3y",
+        "max_drawdown",
+        "volatility",
+        "sharpe_ratio",
+    )
+    list_filter = ("scheme_type",)
+    search_fields = ("scheme_id",)
+    readonly_fields = [field.name for field in SchemeAnalytics._meta.fields]
+
+
+@admin.register(SchemePeerRank)
+class SchemePeerRankAdmin(admin.ModelAdmin):
+    list_display = (
+        "scheme_type",
+        "scheme_id",
+        "peer_group",
+        "horizon",
+        "scheme_return",
+        "percentile",
+        "quartile",
+        "alpha",
+    )
+    list_filter = ("scheme_type", "horizon", "quartile", "peer_group")
+    search_fields = ("scheme_id",)
+    readonly_fields = [field.name for field in SchemePeerRank._meta.fields]
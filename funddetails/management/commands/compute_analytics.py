@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from funddetails.services.analytics import (
+    DEFAULT_BATCH_SIZE,
+    RISK_FREE_RATE,
+    compute_scheme_analytics,
+)
+from homepage.models.schemes import SchemeType
+from homepage.services.catalog_cache import bump_catalog_version
+
+
+class Command(BaseCommand):
+    help = "Recompute rolling returns, drawdown, volatility and Sharpe for every scheme"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            dest="scheme_types",
+            action="append",
+            choices=[choice.lower() for choice in SchemeType.values],
+            help="Only this scheme type (repeatable). Defaults to all.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Schemes loaded per query (default {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--risk-free-rate",
+            type=float,
+            default=RISK_FREE_RATE,
+            help=f"Annual risk-free rate as a fraction (default {RISK_FREE_RATE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        scheme_types = [t.upper() for t in options["scheme_types"] or SchemeType.values]
+
+        for scheme_type in scheme_types:
+            written = compute_scheme_analytics(
+                scheme_type,
+                batch_size=options["batch_size"],
+                risk_free_rate=options["risk_free_rate"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"{scheme_type}: analytics written for {written} schemes"))
+
+        bump_catalog_version()
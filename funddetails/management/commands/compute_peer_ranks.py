@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from funddetails.services.peer_ranks import PEER_GROUP_FIELDS, compute_peer_ranks
+from homepage.services.catalog_cache import bump_catalog_version
+
+
+class Command(BaseCommand):
+    help = "Rank PMS / AIF schemes within their category on every return horizon"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            dest="scheme_types",
+            action="append",
+            choices=[scheme_type.lower() for scheme_type in PEER_GROUP_FIELDS],
+            help="Only this scheme type (repeatable). Defaults to PMS and AIF.",
+        )
+
+    def handle(self, *args, **options):
+        scheme_types = [t.upper() for t in options["scheme_types"] or PEER_GROUP_FIELDS]
+
+        for scheme_type in scheme_types:
+            written = compute_peer_ranks(scheme_type)
+            self.stdout.write(self.style.SUCCESS(f"{scheme_type}: {written} peer ranks written"))
+
+        bump_catalog_version()
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from funddetails.services.nav_import import (
+    DEFAULT_CHUNK_SIZE,
+    NAVImportError,
+    load_nav_file,
+)
+
+
+class Command(BaseCommand):
+    help = "Load mutual fund NAVs from AMFI-style semicolon delimited NAV files"
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="NAV files (daily NAVAll.txt or history reports)")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Rows per bulk upsert (default {DEFAULT_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        for path in options["paths"]:
+            try:
+                result = load_nav_file(path, chunk_size=options["chunk_size"])
+            except NAVImportError as e:
+                raise CommandError(str(e))
+
+            for error in result.errors:
+                self.stderr.write(f"{path} {error}")
+
+            self.stdout.write(self.style.SUCCESS(f"{path}: {result.summary()}"))
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchemeReturnSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheme_type', models.CharField(choices=[('PMS', 'PMS'), ('AIF', 'AIF')], max_length=10)),
+                ('scheme_id', models.BigIntegerField(help_text='Primary key in the PMS / AIF scheme table')),
+                ('as_of', models.DateField(help_text='Date the returns were reported for')),
+                ('aum', models.DecimalField(blank=True, decimal_places=2, max_digits=20, null=True)),
+                ('one_month_return', models.FloatField(blank=True, null=True)),
+                ('one_month_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('three_month_return', models.FloatField(blank=True, null=True)),
+                ('three_month_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('six_month_return', models.FloatField(blank=True, null=True)),
+                ('six_month_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('one_year_return', models.FloatField(blank=True, null=True)),
+                ('one_year_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('three_year_return', models.FloatField(blank=True, null=True)),
+                ('three_year_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('five_year_return', models.FloatField(blank=True, null=True)),
+                ('five_year_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('si_return', models.FloatField(blank=True, null=True)),
+                ('si_benchmark_return', models.FloatField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Scheme Return Snapshot',
+                'verbose_name_plural': 'Scheme Return Snapshots',
+                'ordering': ['scheme_type', 'scheme_id', 'as_of'],
+                'indexes': [models.Index(fields=['as_of', 'scheme_type'], name='funddetails_as_of_2e82fc_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scheme_type', 'scheme_id', 'as_of'), name='unique_scheme_snapshot_per_date')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('funddetails', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MutualFundScheme',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amfi_code', models.PositiveIntegerField(unique=True)),
+                ('scheme_name', models.CharField(max_length=300)),
+                ('amc_name', models.CharField(blank=True, max_length=200, null=True)),
+                ('category', models.CharField(blank=True, max_length=200, null=True)),
+                ('isin_growth', models.CharField(blank=True, max_length=20, null=True)),
+                ('isin_reinvestment', models.CharField(blank=True, max_length=20, null=True)),
+                ('latest_nav', models.DecimalField(blank=True, decimal_places=4, max_digits=16, null=True)),
+                ('latest_nav_date', models.DateField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Mutual Fund Scheme',
+                'verbose_name_plural': 'Mutual Fund Schemes',
+                'ordering': ['scheme_name'],
+                'indexes': [models.Index(fields=['category'], name='funddetails_categor_dceb44_idx'), models.Index(fields=['amc_name'], name='funddetails_amc_nam_2e6c1e_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='MutualFundNAV',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nav_date', models.DateField()),
+                ('nav', models.DecimalField(decimal_places=4, max_digits=16)),
+                ('scheme', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='navs', to='funddetails.mutualfundscheme')),
+            ],
+            options={
+                'verbose_name': 'Mutual Fund NAV',
+                'verbose_name_plural': 'Mutual Fund NAVs',
+                'ordering': ['scheme', 'nav_date'],
+                'constraints': [models.UniqueConstraint(fields=('scheme', 'nav_date'), name='unique_nav_per_scheme_date')],
+            },
+        ),
+    ]
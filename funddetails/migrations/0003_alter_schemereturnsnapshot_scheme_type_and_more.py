@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('funddetails', '0002_mutualfundscheme_mutualfundnav'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='schemereturnsnapshot',
+            name='scheme_type',
+            field=models.CharField(choices=[('PMS', 'PMS'), ('AIF', 'AIF'), ('MF', 'Mutual Fund')], max_length=10),
+        ),
+        migrations.CreateModel(
+            name='SchemeAnalytics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheme_type', models.CharField(choices=[('PMS', 'PMS'), ('AIF', 'AIF'), ('MF', 'Mutual Fund')], max_length=10)),
+                ('scheme_id', models.BigIntegerField(help_text='Primary key in the PMS / AIF / mutual fund scheme table')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('observations', models.PositiveIntegerField()),
+                ('cagr_1y', models.FloatField(blank=True, null=True)),
+                ('cagr_3y', models.FloatField(blank=True, null=True)),
+                ('cagr_since_start', models.FloatField(blank=True, null=True)),
+                ('rolling_1y_mean', models.FloatField(blank=True, null=True)),
+                ('rolling_1y_min', models.FloatField(blank=True, null=True)),
+                ('rolling_1y_max', models.FloatField(blank=True, null=True)),
+                ('rolling_1y_positive_pct', models.FloatField(blank=True, null=True)),
+                ('rolling_3y_mean', models.FloatField(blank=True, null=True)),
+                ('rolling_3y_min', models.FloatField(blank=True, null=True)),
+                ('rolling_3y_max', models.FloatField(blank=True, null=True)),
+                ('rolling_3y_positive_pct', models.FloatField(blank=True, null=True)),
+                ('max_drawdown', models.FloatField(blank=True, null=True)),
+                ('volatility', models.FloatField(blank=True, help_text='Annualised', null=True)),
+                ('sharpe_ratio', models.FloatField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Scheme Analytics',
+                'verbose_name_plural': 'Scheme Analytics',
+                'ordering': ['scheme_type', 'scheme_id'],
+                'constraints': [models.UniqueConstraint(fields=('scheme_type', 'scheme_id'), name='unique_analytics_per_scheme')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('funddetails', '0003_alter_schemereturnsnapshot_scheme_type_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchemePeerRank',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheme_type', models.CharField(choices=[('PMS', 'PMS'), ('AIF', 'AIF'), ('MF', 'Mutual Fund')], max_length=10)),
+                ('scheme_id', models.BigIntegerField(help_text='Primary key in the PMS / AIF scheme table')),
+                ('peer_group', models.CharField(help_text='category for PMS, aif_category for AIF', max_length=255)),
+                ('horizon', models.CharField(choices=[('1m', '1 Month'), ('3m', '3 Months'), ('6m', '6 Months'), ('1y', '1 Year'), ('3y', '3 Years'), ('5y', '5 Years'), ('si', 'Since Inception')], max_length=2)),
+                ('scheme_return', models.FloatField()),
+                ('percentile', models.FloatField()),
+                ('quartile', models.PositiveSmallIntegerField()),
+                ('peer_count', models.PositiveIntegerField()),
+                ('alpha', models.FloatField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Scheme Peer Rank',
+                'verbose_name_plural': 'Scheme Peer Ranks',
+                'ordering': ['scheme_type', 'peer_group', 'horizon', '-percentile'],
+                'indexes': [models.Index(fields=['scheme_type', 'peer_group', 'horizon', 'quartile', '-percentile'], name='peer_rank_quartile_idx'), models.Index(fields=['scheme_type', 'peer_group', 'horizon', '-alpha'], name='peer_rank_alpha_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scheme_type', 'scheme_id', 'horizon'), name='unique_peer_rank_per_horizon')],
+            },
+        ),
+    ]
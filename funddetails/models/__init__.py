@@ -0,0 +1,13 @@
+from .analytics import SchemeAnalytics
+from .mutual_funds import MutualFundNAV, MutualFundScheme
+from .peer_ranks import PeerHorizon, SchemePeerRank
+from .snapshots import SchemeReturnSnapshot
+
+__all__ = [
+    "MutualFundScheme",
+    "MutualFundNAV",
+    "SchemeReturnSnapshot",
+    "SchemeAnalytics",
+    "PeerHorizon",
+    "SchemePeerRank",
+]
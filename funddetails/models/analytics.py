@@ -0,0 +1,55 @@
+from django.db import models
+
+from homepage.models.schemes import SchemeType
+
+
+class SchemeAnalytics(models.Model):
+    """
+    Precomputed risk / return analytics for one scheme.
+    Rebuilt in bulk by ``manage.py compute_analytics``; views only read it.
+    Returns, drawdown and volatility are percentages like the scheme return columns.
+    """
+
+    scheme_type = models.CharField(max_length=10, choices=SchemeType.choices)
+    scheme_id = models.BigIntegerField(help_text="Primary key in the PMS / AIF / mutual fund scheme table")
+
+    # ===== Series coverage =====
+    start_date = models.DateField()
+    end_date = models.DateField()
+    observations = models.PositiveIntegerField()
+
+    # ===== Point-to-point CAGR to end_date =====
+    cagr_1y = models.FloatField(blank=True, null=True)
+    cagr_3y = models.FloatField(blank=True, null=True)
+    cagr_since_start = models.FloatField(blank=True, null=True)
+
+    # ===== Rolling CAGR over every window ending in the series =====
+    rolling_1y_mean = models.FloatField(blank=True, null=True)
+    rolling_1y_min = models.FloatField(blank=True, null=True)
+    rolling_1y_max = models.FloatField(blank=True, null=True)
+    rolling_1y_positive_pct = models.FloatField(blank=True, null=True)
+    rolling_3y_mean = models.FloatField(blank=True, null=True)
+    rolling_3y_min = models.FloatField(blank=True, null=True)
+    rolling_3y_max = models.FloatField(blank=True, null=True)
+    rolling_3y_positive_pct = models.FloatField(blank=True, null=True)
+
+    # ===== Risk =====
+    max_drawdown = models.FloatField(blank=True, null=True)
+    volatility = models.FloatField(blank=True, null=True, help_text="Annualised")
+    sharpe_ratio = models.FloatField(blank=True, null=True)
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Scheme Analytics"
+        verbose_name_plural = "Scheme Analytics"
+        ordering = ["scheme_type", "scheme_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scheme_type", "scheme_id"],
+                name="unique_analytics_per_scheme",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_type} #{self.scheme_id} analytics to {self.end_date}"
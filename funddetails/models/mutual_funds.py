@@ -0,0 +1,64 @@
+from django.db import models
+
+
+class MutualFundScheme(models.Model):
+    """
+    Mutual fund scheme master, keyed by the AMFI scheme code.
+    Rows are created by ``manage.py load_navs`` as codes first appear in a NAV file.
+    """
+
+    amfi_code = models.PositiveIntegerField(unique=True)
+    scheme_name = models.CharField(max_length=300)
+    amc_name = models.CharField(max_length=200, blank=True, null=True)
+    category = models.CharField(max_length=200, blank=True, null=True)
+
+    isin_growth = models.CharField(max_length=20, blank=True, null=True)
+    isin_reinvestment = models.CharField(max_length=20, blank=True, null=True)
+
+    # ===== Latest NAV (denormalised from MutualFundNAV) =====
+    latest_nav = models.DecimalField(max_digits=16, decimal_places=4, blank=True, null=True)
+    latest_nav_date = models.DateField(blank=True, null=True)
+
+    is_active = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Mutual Fund Scheme"
+        verbose_name_plural = "Mutual Fund Schemes"
+        ordering = ["scheme_name"]
+        indexes = [
+            models.Index(fields=["category"]),
+            models.Index(fields=["amc_name"]),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_name} ({self.amfi_code})"
+
+
+class MutualFundNAV(models.Model):
+    """Daily net asset value of a mutual fund scheme"""
+
+    scheme = models.ForeignKey(
+        MutualFundScheme,
+        on_delete=models.CASCADE,
+        related_name="navs",
+    )
+    nav_date = models.DateField()
+    nav = models.DecimalField(max_digits=16, decimal_places=4)
+
+    class Meta:
+        verbose_name = "Mutual Fund NAV"
+        verbose_name_plural = "Mutual Fund NAVs"
+        ordering = ["scheme", "nav_date"]
+        constraints = [
+            # Also serves per-scheme date-range scans
+            models.UniqueConstraint(
+                fields=["scheme", "nav_date"],
+                name="unique_nav_per_scheme_date",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_id} @ {self.nav_date}: {self.nav}"
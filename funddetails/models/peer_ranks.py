@@ -0,0 +1,65 @@
+from django.db import models
+
+from homepage.models.schemes import SchemeType
+
+
+class PeerHorizon(models.TextChoices):
+    """Return horizons of BaseScheme that schemes are ranked on"""
+    ONE_MONTH = "1m", "1 Month"
+    THREE_MONTH = "3m", "3 Months"
+    SIX_MONTH = "6m", "6 Months"
+    ONE_YEAR = "1y", "1 Year"
+    THREE_YEAR = "3y", "3 Years"
+    FIVE_YEAR = "5y", "5 Years"
+    SINCE_INCEPTION = "si", "Since Inception"
+
+
+class SchemePeerRank(models.Model):
+    """
+    Where a PMS / AIF scheme sits among its category peers on one horizon.
+    Rebuilt in full by ``manage.py compute_peer_ranks``.
+
+    Quartile 1 is the best performing quarter; percentile 100 is the best
+    return in the peer group. Alpha is the return minus its benchmark return.
+    """
+
+    scheme_type = models.CharField(max_length=10, choices=SchemeType.choices)
+    scheme_id = models.BigIntegerField(help_text="Primary key in the PMS / AIF scheme table")
+    peer_group = models.CharField(
+        max_length=255,
+        help_text="category for PMS, aif_category for AIF",
+    )
+    horizon = models.CharField(max_length=2, choices=PeerHorizon.choices)
+
+    scheme_return = models.FloatField()
+    percentile = models.FloatField()
+    quartile = models.PositiveSmallIntegerField()
+    peer_count = models.PositiveIntegerField()
+    alpha = models.FloatField(blank=True, null=True)
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Scheme Peer Rank"
+        verbose_name_plural = "Scheme Peer Ranks"
+        ordering = ["scheme_type", "peer_group", "horizon", "-percentile"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scheme_type", "scheme_id", "horizon"],
+                name="unique_peer_rank_per_horizon",
+            ),
+        ]
+        indexes = [
+            # "Top quartile 3Y in AIF Cat III, best first" is one range scan
+            models.Index(
+                fields=["scheme_type", "peer_group", "horizon", "quartile", "-percentile"],
+                name="peer_rank_quartile_idx",
+            ),
+            models.Index(
+                fields=["scheme_type", "peer_group", "horizon", "-alpha"],
+                name="peer_rank_alpha_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_type} #{self.scheme_id} {self.horizon}: Q{self.quartile}"
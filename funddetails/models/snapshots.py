@@ -0,0 +1,53 @@
+from django.db import models
+
+from homepage.models.schemes import SchemeType
+
+
+class SchemeReturnSnapshot(models.Model):
+    """
+    Point-in-time copy of a PMS / AIF scheme's reported returns.
+    One row per (scheme type, scheme id, as-of date), appended by every import
+    so the history survives the overwrite of the latest values on BaseScheme.
+    """
+
+    scheme_type = models.CharField(max_length=10, choices=SchemeType.choices)
+    scheme_id = models.BigIntegerField(help_text="Primary key in the PMS / AIF scheme table")
+    as_of = models.DateField(help_text="Date the returns were reported for")
+
+    aum = models.DecimalField(max_digits=20, decimal_places=2, blank=True, null=True)
+
+    # ===== Returns =====
+    one_month_return = models.FloatField(blank=True, null=True)
+    one_month_benchmark_return = models.FloatField(blank=True, null=True)
+    three_month_return = models.FloatField(blank=True, null=True)
+    three_month_benchmark_return = models.FloatField(blank=True, null=True)
+    six_month_return = models.FloatField(blank=True, null=True)
+    six_month_benchmark_return = models.FloatField(blank=True, null=True)
+    one_year_return = models.FloatField(blank=True, null=True)
+    one_year_benchmark_return = models.FloatField(blank=True, null=True)
+    three_year_return = models.FloatField(blank=True, null=True)
+    three_year_benchmark_return = models.FloatField(blank=True, null=True)
+    five_year_return = models.FloatField(blank=True, null=True)
+    five_year_benchmark_return = models.FloatField(blank=True, null=True)
+    si_return = models.FloatField(blank=True, null=True)
+    si_benchmark_return = models.FloatField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Scheme Return Snapshot"
+        verbose_name_plural = "Scheme Return Snapshots"
+        ordering = ["scheme_type", "scheme_id", "as_of"]
+        constraints = [
+            # Also serves per-scheme date-range scans
+            models.UniqueConstraint(
+                fields=["scheme_type", "scheme_id", "as_of"],
+                name="unique_scheme_snapshot_per_date",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["as_of", "scheme_type"]),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_type} #{self.scheme_id} @ {self.as_of}"
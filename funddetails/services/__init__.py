@@ -0,0 +1 @@
+# Fund details services package
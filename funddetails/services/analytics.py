@@ -0,0 +1,264 @@
+"""
+Vectorised risk / return analytics for scheme NAV and return series.
+
+A scheme's history is loaded into two NumPy arrays (dates and index levels)
+and every metric is a handful of whole-array passes: rolling CAGR windows
+are located with ``searchsorted`` instead of a Python loop per date, and
+drawdown uses a running maximum. ``compute_scheme_analytics`` runs this for
+every scheme of a type, loading series one batch of schemes per query and
+upserting the results into SchemeAnalytics.
+
+Mutual funds use their daily NAVs. PMS / AIF schemes have no NAV, so their
+index is chained from the monthly ``one_month_return`` of the return
+snapshots: the latest snapshot of each calendar month, over the most recent
+run of consecutive months (a missing month cannot be chained across).
+"""
+
+import logging
+from itertools import groupby
+
+import numpy as np
+from django.conf import settings
+
+from funddetails.models import (
+    MutualFundNAV,
+    MutualFundScheme,
+    SchemeAnalytics,
+    SchemeReturnSnapshot,
+)
+from homepage.models.schemes import SCHEME_MODELS, SchemeType
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DAYS_PER_YEAR = 365.25
+DEFAULT_BATCH_SIZE = 200
+RISK_FREE_RATE = getattr(settings, "FUNDDETAILS_RISK_FREE_RATE", 0.065)
+
+# Label -> window length in years
+ROLLING_HORIZONS = (
+    ("1y", 1),
+    ("3y", 3),
+)
+
+ANALYTICS_FIELDS = [
+    "start_date",
+    "end_date",
+    "observations",
+    "cagr_since_start",
+    *[f"cagr_{label}" for label, _ in ROLLING_HORIZONS],
+    *[
+        f"rolling_{label}_{stat}"
+        for label, _ in ROLLING_HORIZONS
+        for stat in ("mean", "min", "max", "positive_pct")
+    ],
+    "max_drawdown",
+    "volatility",
+    "sharpe_ratio",
+]
+
+
+# ======================================================
+# SERIES METRICS
+# ======================================================
+def compute_series_analytics(dates, levels, risk_free_rate=RISK_FREE_RATE):
+    """
+    Compute every SchemeAnalytics metric for one series.
+
+    Args:
+        dates (np.ndarray): Ascending datetime64[D] observation dates
+        levels (np.ndarray): NAV / index level per date (float64, > 0)
+        risk_free_rate (float, optional): Annual rate for the Sharpe ratio
+
+    Returns:
+        dict: SchemeAnalytics field values, or None for fewer than two points
+            or a non-positive level
+    """
+    observations = len(levels)
+    if observations < 2 or (levels <= 0).any():
+        return None
+
+    days = (dates - dates[0]).astype(np.int64)
+    log_levels = np.log(levels)
+    span_years = days[-1] / DAYS_PER_YEAR
+
+    metrics = {
+        "start_date": dates[0].item(),
+        "end_date": dates[-1].item(),
+        "observations": observations,
+        "cagr_since_start": None,
+        "max_drawdown": _percent(max_drawdown(levels)),
+        "volatility": None,
+        "sharpe_ratio": None,
+    }
+
+    cagr = None
+    if span_years > 0:
+        cagr = np.expm1((log_levels[-1] - log_levels[0]) / span_years)
+        metrics["cagr_since_start"] = _percent(cagr)
+
+    for label, years in ROLLING_HORIZONS:
+        windows = rolling_cagr(days, log_levels, years)
+        has_windows = windows.size > 0
+        # The latest window ends on the last observation
+        metrics[f"cagr_{label}"] = _percent(windows[-1]) if has_windows else None
+        metrics[f"rolling_{label}_mean"] = _percent(windows.mean()) if has_windows else None
+        metrics[f"rolling_{label}_min"] = _percent(windows.min()) if has_windows else None
+        metrics[f"rolling_{label}_max"] = _percent(windows.max()) if has_windows else None
+        metrics[f"rolling_{label}_positive_pct"] = (
+            _percent(np.count_nonzero(windows > 0) / windows.size) if has_windows else None
+        )
+
+    if observations > 2 and span_years > 0:
+        # Annualise by the series' own observation frequency (trading days, months, ...)
+        periods_per_year = (observations - 1) / span_years
+        volatility = np.diff(log_levels).std(ddof=1) * np.sqrt(periods_per_year)
+        metrics["volatility"] = _percent(volatility)
+        # Compare the rounded figure so float noise on a flat series gives no Sharpe
+        if metrics["volatility"] > 0 and cagr is not None:
+            metrics["sharpe_ratio"] = round(float((cagr - risk_free_rate) / volatility), 4)
+
+    return metrics
+
+
+def rolling_cagr(days, log_levels, years):
+    """
+    CAGR of every ``years`` long window ending on an observation.
+
+    Each window starts at the last observation on or before its target start
+    date, found for all windows at once with ``searchsorted``.
+
+    Args:
+        days (np.ndarray): Ascending day offsets of the observations
+        log_levels (np.ndarray): Natural log of the level per observation
+        years (int): Window length
+
+    Returns:
+        np.ndarray: Window CAGRs as fractions, oldest window first
+    """
+    starts = np.searchsorted(days, days - years * DAYS_PER_YEAR, side="right") - 1
+    ends = np.flatnonzero(starts >= 0)
+    if not ends.size:
+        return np.empty(0)
+
+    starts = starts[ends]
+    elapsed_years = (days[ends] - days[starts]) / DAYS_PER_YEAR
+    return np.expm1((log_levels[ends] - log_levels[starts]) / elapsed_years)
+
+
+def max_drawdown(levels):
+    """Largest peak-to-trough fall as a (negative) fraction"""
+    return (levels / np.maximum.accumulate(levels) - 1).min()
+
+
+def _percent(value):
+    return round(float(value) * 100, 4)
+
+
+# ======================================================
+# SERIES LOADING
+# ======================================================
+def iter_nav_series(scheme_ids):
+    """Yield ``(scheme_id, dates, levels)`` per mutual fund from one NAV query"""
+    rows = (
+        MutualFundNAV.objects
+        .filter(scheme_id__in=scheme_ids)
+        .order_by("scheme_id", "nav_date")
+        .values_list("scheme_id", "nav_date", "nav")
+    )
+    for scheme_id, group in groupby(rows.iterator(chunk_size=10000), key=lambda row: row[0]):
+        _, dates, navs = zip(*group)
+        yield scheme_id, np.array(dates, dtype="datetime64[D]"), np.array(navs, dtype=np.float64)
+
+
+def iter_snapshot_series(scheme_type, scheme_ids):
+    """Yield ``(scheme_id, dates, levels)`` per PMS / AIF scheme, chaining monthly returns"""
+    rows = (
+        SchemeReturnSnapshot.objects
+        .filter(scheme_type=scheme_type, scheme_id__in=scheme_ids, one_month_return__isnull=False)
+        .order_by("scheme_id", "as_of")
+        .values_list("scheme_id", "as_of", "one_month_return")
+    )
+    for scheme_id, group in groupby(rows.iterator(), key=lambda row: row[0]):
+        _, dates, returns = zip(*group)
+        dates, returns = monthly_run(
+            np.array(dates, dtype="datetime64[D]"), np.array(returns, dtype=np.float64)
+        )
+        yield scheme_id, dates, np.cumprod(1 + returns / 100)
+
+
+def monthly_run(dates, returns):
+    """
+    One monthly return per calendar month, over the latest run of
+    consecutive months.
+
+    Each snapshot's ``one_month_return`` covers the month before it, so
+    chaining two snapshots of one month would count that month twice, and
+    chaining across a missing month would skip its return.
+
+    Args:
+        dates (np.ndarray): Ascending datetime64[D] snapshot dates
+        returns (np.ndarray): One-month return (%) per snapshot
+
+    Returns:
+        tuple: (dates, returns) of the latest snapshot per month since the
+            last missing month
+    """
+    months = dates.astype("datetime64[M]").astype(np.int64)
+    # Later snapshots of a month replace earlier ones
+    latest = np.append(months[1:] != months[:-1], True)
+    dates, returns, months = dates[latest], returns[latest], months[latest]
+
+    gaps = np.flatnonzero(np.diff(months) > 1)
+    start = gaps[-1] + 1 if gaps.size else 0
+    return dates[start:], returns[start:]
+
+
+def scheme_ids_for(scheme_type):
+    if scheme_type == SchemeType.MF:
+        return list(MutualFundScheme.objects.filter(is_active=True).order_by("id").values_list("id", flat=True))
+    return list(SCHEME_MODELS[scheme_type].objects.order_by("id").values_list("id", flat=True))
+
+
+# ======================================================
+# BATCH JOB
+# ======================================================
+def compute_scheme_analytics(scheme_type, batch_size=DEFAULT_BATCH_SIZE, risk_free_rate=RISK_FREE_RATE):
+    """
+    Recompute and store analytics for every scheme of ``scheme_type``.
+
+    Args:
+        scheme_type (str): SchemeType value
+        batch_size (int, optional): Schemes loaded and written per batch
+        risk_free_rate (float, optional): Annual rate for the Sharpe ratio
+
+    Returns:
+        int: Number of schemes with analytics written
+    """
+    scheme_ids = scheme_ids_for(scheme_type)
+    written = 0
+
+    for start in range(0, len(scheme_ids), batch_size):
+        batch = scheme_ids[start:start + batch_size]
+        if scheme_type == SchemeType.MF:
+            series = iter_nav_series(batch)
+        else:
+            series = iter_snapshot_series(scheme_type, batch)
+
+        results = []
+        for scheme_id, dates, levels in series:
+            metrics = compute_series_analytics(dates, levels, risk_free_rate=risk_free_rate)
+            if metrics is not None:
+                results.append(SchemeAnalytics(scheme_type=scheme_type, scheme_id=scheme_id, **metrics))
+
+        if results:
+            SchemeAnalytics.objects.bulk_create(
+                results,
+                update_conflicts=True,
+                unique_fields=["scheme_type", "scheme_id"],
+                update_fields=ANALYTICS_FIELDS + ["computed_at"],
+            )
+            written += len(results)
+
+    logger.info(f"Analytics computed for {written} {scheme_type} schemes")
+    return written
@@ -0,0 +1,322 @@
+"""
+Bulk loading of mutual fund NAVs from AMFI-style NAV files.
+
+AMFI publishes NAVs as semicolon delimited text: a header row, then data rows
+interleaved with bare "category" and "fund house" lines. Files are streamed
+through the csv module and every data row becomes a small
+``(amfi_code, nav_date, nav)`` tuple. Rows are written in chunks; each chunk
+costs one existing-NAV lookup and one upsert that only carries rows that are
+new or whose NAV changed, so re-loading an overlapping history file is cheap
+and memory stays flat however large the file is.
+"""
+
+import csv
+import logging
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+
+from funddetails.models import MutualFundNAV, MutualFundScheme
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.search import index_mutual_funds
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+NAV_QUANTUM = Decimal("0.0001")
+DATE_FORMATS = ("%d-%b-%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y")
+
+# Column positions of the daily NAVAll.txt layout, used when a file has no header:
+# Scheme Code;ISIN Div Payout/ ISIN Growth;ISIN Div Reinvestment;Scheme Name;Net Asset Value;Date
+DEFAULT_COLUMNS = {
+    "code": 0,
+    "isin_growth": 1,
+    "isin_reinvestment": 2,
+    "name": 3,
+    "nav": 4,
+    "date": 5,
+}
+
+# Lower-cased header prefix -> column key
+HEADER_PREFIXES = (
+    ("scheme code", "code"),
+    ("scheme name", "name"),
+    ("isin div payout", "isin_growth"),
+    ("isin div reinvestment", "isin_reinvestment"),
+    ("net asset value", "nav"),
+    ("date", "date"),
+)
+
+
+class NAVImportError(Exception):
+    """Raised when a NAV file cannot be loaded at all"""
+
+
+class NAVLoadResult:
+    """Running counters for one NAV load"""
+
+    def __init__(self):
+        self.rows = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.skipped = 0
+        self.schemes_created = 0
+        self.errors = []
+
+    def skip(self, line_number, reason):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line_number}: {reason}")
+
+    def summary(self):
+        return (
+            f"{self.rows} NAV rows read: {self.inserted} inserted, "
+            f"{self.updated} updated, {self.unchanged} unchanged, "
+            f"{self.skipped} skipped, {self.schemes_created} new schemes"
+        )
+
+
+def load_nav_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Load an AMFI NAV file (daily dump or history report) into MutualFundNAV.
+
+    Args:
+        path (str | Path): Semicolon delimited NAV file
+        chunk_size (int, optional): Rows written per upsert. Defaults to 5000.
+
+    Returns:
+        NAVLoadResult: Inserted / updated / unchanged / skipped counters
+    """
+    result = NAVLoadResult()
+
+    # amfi_code -> pk for every known scheme; bounded by the scheme count
+    scheme_ids = dict(MutualFundScheme.objects.values_list("amfi_code", "id"))
+    pending_schemes = {}
+    latest = {}
+    chunk = []
+
+    for code, nav_date, nav, scheme in iter_nav_rows(path, result):
+        result.rows += 1
+        if scheme is not None and code not in scheme_ids:
+            pending_schemes[code] = scheme
+        chunk.append((code, nav_date, nav))
+
+        if len(chunk) >= chunk_size:
+            _write_chunk(chunk, scheme_ids, pending_schemes, latest, result)
+            chunk = []
+
+    if chunk:
+        _write_chunk(chunk, scheme_ids, pending_schemes, latest, result)
+
+    _update_latest_navs(latest)
+    if result.schemes_created:
+        # New schemes are searchable; drop cached search responses
+        bump_catalog_version()
+
+    logger.info(f"NAV load from {path}: {result.summary()}")
+    return result
+
+
+def iter_nav_rows(path, result):
+    """
+    Yield ``(amfi_code, nav_date, nav, scheme)`` for every valid data row.
+
+    ``scheme`` is a tuple of (name, isin_growth, isin_reinvestment, amc, category)
+    on a code's first row in the file and None afterwards.
+    Malformed rows are counted on ``result`` and skipped.
+    """
+    columns = DEFAULT_COLUMNS
+    amc_name = category = None
+    dates = {}
+    seen_codes = set()
+
+    try:
+        handle = open(path, newline="", encoding="utf-8-sig", errors="replace")
+    except OSError as e:
+        raise NAVImportError(f"Cannot open {path}: {e}")
+
+    with handle:
+        for line_number, row in enumerate(csv.reader(handle, delimiter=";"), start=1):
+            if not row or not row[0].strip():
+                continue
+
+            if len(row) == 1:
+                # Section line: "Open Ended Schemes(Equity Scheme - Large Cap Fund)" or a fund house
+                text = row[0].strip()
+                if "Schemes(" in text:
+                    category = text[text.index("(") + 1:].rstrip(")").strip()
+                else:
+                    amc_name = text
+                continue
+
+            first = row[0].strip()
+            if not first.isdigit():
+                if first.lower().startswith("scheme code"):
+                    columns = _header_columns(row)
+                continue
+
+            try:
+                nav_date = dates.get(row[columns["date"]])
+                if nav_date is None:
+                    nav_date = dates[row[columns["date"]]] = _parse_date(row[columns["date"]])
+                nav = Decimal(row[columns["nav"]].strip()).quantize(NAV_QUANTUM)
+            except (IndexError, ValueError, InvalidOperation):
+                result.skip(line_number, "missing or invalid NAV / date")
+                continue
+
+            if not nav.is_finite() or nav <= 0:
+                result.skip(line_number, "missing or invalid NAV / date")
+                continue
+
+            code = int(first)
+            scheme = None
+            if code not in seen_codes:
+                seen_codes.add(code)
+                scheme = (
+                    _column(row, columns, "name"),
+                    _column(row, columns, "isin_growth"),
+                    _column(row, columns, "isin_reinvestment"),
+                    amc_name,
+                    category,
+                )
+            yield code, nav_date, nav, scheme
+
+
+def _header_columns(header):
+    columns = {}
+    for index, title in enumerate(header):
+        title = title.strip().lower()
+        for prefix, key in HEADER_PREFIXES:
+            if title.startswith(prefix) and key not in columns:
+                columns[key] = index
+                break
+
+    missing = {"code", "nav", "date"} - columns.keys()
+    if missing:
+        raise NAVImportError(f"NAV header is missing columns: {', '.join(sorted(missing))}")
+    return columns
+
+
+def _write_chunk(chunk, scheme_ids, pending_schemes, latest, result):
+    """Create unseen schemes, then upsert the chunk's new / changed NAVs"""
+    if pending_schemes:
+        _create_schemes(pending_schemes, scheme_ids, result)
+
+    # (scheme pk, date) -> nav; a repeated key keeps the last value in the file
+    navs = {}
+    for code, nav_date, nav in chunk:
+        scheme_id = scheme_ids[code]
+        navs[(scheme_id, nav_date)] = nav
+
+        current = latest.get(scheme_id)
+        if current is None or nav_date >= current[0]:
+            latest[scheme_id] = (nav_date, nav)
+
+    scheme_keys = [key[0] for key in navs]
+    date_keys = [key[1] for key in navs]
+
+    # One range scan over the chunk's (scheme, date) rectangle, backed by the
+    # unique (scheme, nav_date) index; a range avoids SQL parameter limits
+    existing = {}
+    stored = MutualFundNAV.objects.filter(
+        scheme_id__gte=min(scheme_keys),
+        scheme_id__lte=max(scheme_keys),
+        nav_date__gte=min(date_keys),
+        nav_date__lte=max(date_keys),
+    ).values_list("scheme_id", "nav_date", "nav")
+    for scheme_id, nav_date, nav in stored.iterator(chunk_size=len(navs)):
+        key = (scheme_id, nav_date)
+        if key in navs:
+            existing[key] = nav
+
+    changed = []
+    for (scheme_id, nav_date), nav in navs.items():
+        previous = existing.get((scheme_id, nav_date))
+        if previous is None:
+            result.inserted += 1
+        elif previous != nav:
+            result.updated += 1
+        else:
+            result.unchanged += 1
+            continue
+        changed.append(MutualFundNAV(scheme_id=scheme_id, nav_date=nav_date, nav=nav))
+
+    if changed:
+        with transaction.atomic():
+            MutualFundNAV.objects.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=["scheme", "nav_date"],
+                update_fields=["nav"],
+            )
+
+
+def _create_schemes(pending_schemes, scheme_ids, result):
+    MutualFundScheme.objects.bulk_create(
+        [
+            MutualFundScheme(
+                amfi_code=code,
+                scheme_name=name or str(code),
+                isin_growth=isin_growth,
+                isin_reinvestment=isin_reinvestment,
+                amc_name=amc_name,
+                category=category,
+            )
+            for code, (name, isin_growth, isin_reinvestment, amc_name, category) in pending_schemes.items()
+        ],
+        ignore_conflicts=True,
+    )
+    created = dict(
+        MutualFundScheme.objects
+        .filter(amfi_code__in=list(pending_schemes))
+        .values_list("amfi_code", "id")
+    )
+    result.schemes_created += len(created)
+    scheme_ids.update(created)
+    # bulk_create skips the post_save search sync
+    index_mutual_funds(MutualFundScheme.objects.filter(id__in=list(created.values())))
+    pending_schemes.clear()
+
+
+def _update_latest_navs(latest, batch_size=500):
+    """Move each scheme's latest NAV forward when the file carried a newer one"""
+    scheme_ids = list(latest)
+    for start in range(0, len(scheme_ids), batch_size):
+        schemes = MutualFundScheme.objects.filter(
+            id__in=scheme_ids[start:start + batch_size]
+        ).only("id", "latest_nav", "latest_nav_date")
+
+        stale = []
+        for scheme in schemes:
+            nav_date, nav = latest[scheme.id]
+            if scheme.latest_nav_date is None or nav_date > scheme.latest_nav_date or (
+                nav_date == scheme.latest_nav_date and nav != scheme.latest_nav
+            ):
+                scheme.latest_nav_date = nav_date
+                scheme.latest_nav = nav
+                stale.append(scheme)
+
+        if stale:
+            MutualFundScheme.objects.bulk_update(stale, ["latest_nav", "latest_nav_date"])
+
+
+def _parse_date(text):
+    text = text.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised date: {text}")
+
+
+def _column(row, columns, key):
+    index = columns.get(key)
+    if index is None or index >= len(row):
+        return None
+    value = row[index].strip()
+    return value if value and value != "-" else None
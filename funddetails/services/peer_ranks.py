@@ -0,0 +1,155 @@
+"""
+Category peer ranking of PMS / AIF schemes.
+
+Every active scheme of a type is loaded with one query into NumPy arrays
+(peer group code, return and benchmark return per horizon). Each horizon is
+then ranked for all peer groups at once: one lexsort by (group, return),
+after which run boundaries give tie-aware ranks without a per-group loop.
+The ranks replace the type's SchemePeerRank rows in one transaction, so
+listing a quartile is an index range scan rather than a Python sort.
+"""
+
+import logging
+
+import numpy as np
+from django.db import transaction
+
+from funddetails.models import PeerHorizon, SchemePeerRank
+from homepage.models.schemes import SCHEME_MODELS, SchemeType
+
+logger = logging.getLogger(__name__)
+
+# Horizon -> (return column, benchmark column) on BaseScheme
+HORIZON_FIELDS = {
+    PeerHorizon.ONE_MONTH: ("one_month_return", "one_month_benchmark_return"),
+    PeerHorizon.THREE_MONTH: ("three_month_return", "three_month_benchmark_return"),
+    PeerHorizon.SIX_MONTH: ("six_month_return", "six_month_benchmark_return"),
+    PeerHorizon.ONE_YEAR: ("one_year_return", "one_year_benchmark_return"),
+    PeerHorizon.THREE_YEAR: ("three_year_return", "three_year_benchmark_return"),
+    PeerHorizon.FIVE_YEAR: ("five_year_return", "five_year_benchmark_return"),
+    PeerHorizon.SINCE_INCEPTION: ("si_return", "si_benchmark_return"),
+}
+
+# Scheme column that defines the peer group
+PEER_GROUP_FIELDS = {
+    SchemeType.PMS: "category",
+    SchemeType.AIF: "aif_category",
+}
+
+
+def rank_within_groups(group_codes, values):
+    """
+    Percentile and quartile of every value within its group.
+
+    Percentile runs from 0 (worst) to 100 (best); quartile 1 is the
+    top quarter (percentile 75 and above). Ties share their midpoint rank.
+    NaN values are not ranked.
+
+    Args:
+        group_codes (np.ndarray): Integer peer group per scheme
+        values (np.ndarray): Float return per scheme, NaN when missing
+
+    Returns:
+        tuple: (indices of ranked schemes, percentile, quartile, peer count)
+    """
+    valid = np.flatnonzero(~np.isnan(values))
+    if not valid.size:
+        empty = np.empty(0)
+        return valid, empty, empty.astype(np.int64), empty.astype(np.int64)
+
+    order = valid[np.lexsort((values[valid], group_codes[valid]))]
+    groups = group_codes[order]
+    sorted_values = values[order]
+    positions = np.arange(order.size)
+
+    new_group = np.r_[True, groups[1:] != groups[:-1]]
+    group_start = np.maximum.accumulate(np.where(new_group, positions, 0))
+    group_sizes = np.diff(np.r_[np.flatnonzero(new_group), order.size])
+    peer_count = np.repeat(group_sizes, group_sizes)
+
+    # Equal (group, value) runs share the midpoint rank of the run
+    new_run = new_group | np.r_[True, sorted_values[1:] != sorted_values[:-1]]
+    run_start = np.maximum.accumulate(np.where(new_run, positions, 0))
+    last_in_run = np.r_[new_run[1:], True]
+    run_end = np.minimum.accumulate(np.where(last_in_run, positions, order.size)[::-1])[::-1]
+    rank = (run_start + run_end) / 2 - group_start
+
+    percentile = np.where(peer_count > 1, rank / np.maximum(peer_count - 1, 1) * 100, 100.0)
+    quartile = np.clip(4 - (percentile // 25).astype(np.int64), 1, 4)
+    return order, percentile, quartile, peer_count
+
+
+def compute_peer_ranks(scheme_type):
+    """
+    Rebuild SchemePeerRank for every active scheme of ``scheme_type``.
+
+    Schemes without a peer group are not ranked.
+
+    Args:
+        scheme_type (str): SchemeType.PMS or SchemeType.AIF
+
+    Returns:
+        int: Number of rank rows written
+    """
+    group_field = PEER_GROUP_FIELDS[scheme_type]
+    value_fields = [field for pair in HORIZON_FIELDS.values() for field in pair]
+
+    rows = list(
+        SCHEME_MODELS[scheme_type].objects
+        .active()
+        .exclude(**{f"{group_field}__isnull": True})
+        .exclude(**{group_field: ""})
+        .values_list("id", group_field, *value_fields)
+    )
+    if not rows:
+        with transaction.atomic():
+            SchemePeerRank.objects.filter(scheme_type=scheme_type).delete()
+        return 0
+
+    columns = list(zip(*rows))
+    scheme_ids = np.array(columns[0], dtype=np.int64)
+    group_names, group_codes = np.unique(np.array(columns[1], dtype=object), return_inverse=True)
+    # None -> NaN, so missing returns drop out of the ranking and alpha
+    values = np.array(columns[2:], dtype=np.float64)
+
+    ranks = []
+    for index, horizon in enumerate(HORIZON_FIELDS):
+        returns, benchmarks = values[2 * index], values[2 * index + 1]
+        alpha = returns - benchmarks
+
+        order, percentile, quartile, peer_count = rank_within_groups(group_codes, returns)
+        for position, scheme_index in enumerate(order):
+            scheme_alpha = alpha[scheme_index]
+            ranks.append(
+                SchemePeerRank(
+                    scheme_type=scheme_type,
+                    scheme_id=int(scheme_ids[scheme_index]),
+                    peer_group=group_names[group_codes[scheme_index]],
+                    horizon=horizon,
+                    scheme_return=float(returns[scheme_index]),
+                    percentile=round(float(percentile[position]), 2),
+                    quartile=int(quartile[position]),
+                    peer_count=int(peer_count[position]),
+                    alpha=None if np.isnan(scheme_alpha) else round(float(scheme_alpha), 4),
+                )
+            )
+
+    with transaction.atomic():
+        SchemePeerRank.objects.filter(scheme_type=scheme_type).delete()
+        SchemePeerRank.objects.bulk_create(ranks, batch_size=1000)
+
+    logger.info(f"Peer ranks computed for {scheme_type}: {len(ranks)} rows")
+    return len(ranks)
+
+
+def peer_quartile(scheme_type, peer_group, horizon, quartile=1):
+    """
+    Ranks in one peer group quartile, best first, served by the
+    (scheme_type, peer_group, horizon, quartile, -percentile) index.
+    """
+    return SchemePeerRank.objects.filter(
+        scheme_type=scheme_type,
+        peer_group=peer_group,
+        horizon=horizon,
+        quartile=quartile,
+    ).order_by("-percentile")
@@ -0,0 +1,79 @@
+"""
+Storage and retrieval of scheme return snapshots.
+
+Imports append one row per scheme and as-of date in bulk; charts read a
+scheme's whole history back with a single range query and get it as
+parallel arrays (one list of dates, one list per series).
+"""
+
+from funddetails.models import SchemeReturnSnapshot
+
+# Scheme columns copied into each snapshot
+SNAPSHOT_FIELDS = (
+    "aum",
+    "one_month_return",
+    "one_month_benchmark_return",
+    "three_month_return",
+    "three_month_benchmark_return",
+    "six_month_return",
+    "six_month_benchmark_return",
+    "one_year_return",
+    "one_year_benchmark_return",
+    "three_year_return",
+    "three_year_benchmark_return",
+    "five_year_return",
+    "five_year_benchmark_return",
+    "si_return",
+    "si_benchmark_return",
+)
+
+
+def append_return_snapshots(scheme_type, values_by_scheme_id, as_of):
+    """
+    Bulk upsert one snapshot per scheme for ``as_of``.
+    Re-importing the same date overwrites that date's rows.
+
+    Args:
+        scheme_type (str): SchemeType value
+        values_by_scheme_id (dict): scheme id -> {snapshot field: value}
+        as_of (date): Date the values were reported for
+
+    Returns:
+        int: Number of snapshots written
+    """
+    fields = sorted({field for values in values_by_scheme_id.values() for field in values})
+    if not fields:
+        return 0
+
+    snapshots = [
+        SchemeReturnSnapshot(scheme_type=scheme_type, scheme_id=scheme_id, as_of=as_of, **values)
+        for scheme_id, values in values_by_scheme_id.items()
+    ]
+    SchemeReturnSnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=["scheme_type", "scheme_id", "as_of"],
+        update_fields=fields,
+    )
+    return len(snapshots)
+
+
+def get_return_history(scheme_type, scheme_id, fields, start=None, end=None):
+    """
+    Fetch a scheme's snapshot history as parallel arrays.
+
+    Returns:
+        tuple: (list of dates, {field: list of values})
+    """
+    queryset = SchemeReturnSnapshot.objects.filter(scheme_type=scheme_type, scheme_id=scheme_id)
+    if start:
+        queryset = queryset.filter(as_of__gte=start)
+    if end:
+        queryset = queryset.filter(as_of__lte=end)
+
+    rows = list(queryset.order_by("as_of").values_list("as_of", *fields))
+    if not rows:
+        return [], {field: [] for field in fields}
+
+    columns = list(zip(*rows))
+    return list(columns[0]), {field: list(column) for field, column in zip(fields, columns[1:])}
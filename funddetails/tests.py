@@ -1,3 +1,126 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+
+from funddetails.models import SchemeReturnSnapshot
+from funddetails.services.analytics import (
+    DAYS_PER_YEAR,
+    compute_series_analytics,
+    iter_snapshot_series,
+    max_drawdown,
+    rolling_cagr,
+)
+from funddetails.services.peer_ranks import rank_within_groups
+from homepage.models.schemes import SchemeType
+
+
+# ======================================================
+# ANALYTICS – SERIES METRICS
+# ======================================================
+class SeriesMetricsTests(SimpleTestCase):
+    def test_rolling_cagr_matches_a_loop(self):
+        rng = np.random.default_rng(7)
+        days = np.cumsum(rng.integers(1, 40, size=80))
+        levels = np.cumprod(1 + rng.normal(0.005, 0.03, size=80))
+
+        expected = []
+        for end in range(len(days)):
+            # Last observation on or before the window start
+            earlier = [start for start in range(end + 1) if days[start] <= days[end] - DAYS_PER_YEAR]
+            if earlier:
+                start = earlier[-1]
+                years = (days[end] - days[start]) / DAYS_PER_YEAR
+                expected.append((levels[end] / levels[start]) ** (1 / years) - 1)
+
+        np.testing.assert_allclose(rolling_cagr(days, np.log(levels), 1), expected)
+
+    def test_max_drawdown_is_the_deepest_fall_from_a_peak(self):
+        self.assertAlmostEqual(max_drawdown(np.array([100, 120, 90, 130, 65.0])), -0.5)
+
+    def test_doubling_in_a_year(self):
+        dates = np.array(["2024-01-01", "2024-07-01", "2025-01-01"], dtype="datetime64[D]")
+
+        metrics = compute_series_analytics(dates, np.array([1.0, 1.5, 2.0]), risk_free_rate=0.0)
+
+        cagr = 2 ** (DAYS_PER_YEAR / 366) - 1
+        self.assertEqual(metrics["observations"], 3)
+        self.assertAlmostEqual(metrics["cagr_since_start"], round(cagr * 100, 4))
+        self.assertAlmostEqual(metrics["cagr_1y"], round(cagr * 100, 4))
+        self.assertEqual(metrics["max_drawdown"], 0.0)
+        self.assertIsNone(metrics["cagr_3y"])
+
+
+# ======================================================
+# ANALYTICS – SNAPSHOT SERIES
+# ======================================================
+class SnapshotSeriesTests(TestCase):
+    def series(self, *snapshots):
+        SchemeReturnSnapshot.objects.bulk_create(
+            SchemeReturnSnapshot(scheme_type=SchemeType.PMS, scheme_id=1, as_of=as_of, one_month_return=value)
+            for as_of, value in snapshots
+        )
+        [(_, dates, levels)] = iter_snapshot_series(SchemeType.PMS, [1])
+        return [day.item() for day in dates], levels
+
+    def test_latest_snapshot_of_a_month_wins(self):
+        dates, levels = self.series(
+            (date(2026, 1, 31), 1.0),
+            (date(2026, 2, 10), 5.0),
+            (date(2026, 2, 28), 2.0),
+            (date(2026, 3, 31), -1.0),
+        )
+
+        self.assertEqual(dates, [date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31)])
+        np.testing.assert_allclose(levels, [1.01, 1.01 * 1.02, 1.01 * 1.02 * 0.99])
+
+    def test_series_restarts_after_a_missing_month(self):
+        dates, levels = self.series(
+            (date(2025, 11, 30), 3.0),
+            (date(2026, 1, 31), 1.0),
+            (date(2026, 2, 28), 2.0),
+        )
+
+        self.assertEqual(dates, [date(2026, 1, 31), date(2026, 2, 28)])
+        np.testing.assert_allclose(levels, [1.01, 1.01 * 1.02])
+
+
+# ======================================================
+# PEER RANKS
+# ======================================================
+class PeerRankTests(SimpleTestCase):
+    def test_ties_share_the_midpoint_rank_within_their_group(self):
+        groups = np.array([0, 1, 0, 0, 0, 0])
+        returns = np.array([20.0, 5.0, 10.0, np.nan, 30.0, 20.0])
+
+        order, percentile, quartile, peer_count = rank_within_groups(groups, returns)
+        ranked = {
+            int(index): (float(pct), int(quarter), int(count))
+            for index, pct, quarter, count in zip(order, percentile, quartile, peer_count)
+        }
+
+        # Group 0 ascending: 10, 20, 20, 30 -> ranks 0, 1.5, 1.5, 3 of 3
+        self.assertEqual(ranked, {
+            2: (0.0, 4, 4),
+            0: (50.0, 2, 4),
+            5: (50.0, 2, 4),
+            4: (100.0, 1, 4),
+            1: (100.0, 1, 1),
+        })
+
+    def test_percentiles_match_a_loop(self):
+        rng = np.random.default_rng(3)
+        groups = rng.integers(0, 5, size=200)
+        returns = rng.integers(-5, 6, size=200).astype(np.float64)
+        returns[rng.random(200) < 0.1] = np.nan
+
+        order, percentile, _, peer_count = rank_within_groups(groups, returns)
+
+        for index, pct, count in zip(order, percentile, peer_count):
+            peers = returns[(groups == groups[index]) & ~np.isnan(returns)]
+            below = np.count_nonzero(peers < returns[index])
+            equal = np.count_nonzero(peers == returns[index])
+            expected = (below + (equal - 1) / 2) / (len(peers) - 1) * 100
+            self.assertEqual(count, len(peers))
+            self.assertAlmostEqual(pct, expected)
+        self.assertEqual(len(order), np.count_nonzero(~np.isnan(returns)))
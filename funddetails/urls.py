@@ -0,0 +1,24 @@
+# funddetails/urls.py
+from django.urls import path
+
+from funddetails.views import scheme_analytics, scheme_peer_quartile, scheme_return_history
+
+app_name = "funddetails"
+
+urlpatterns = [
+    path(
+        "history/<str:scheme_type>/<int:scheme_id>/",
+        scheme_return_history,
+        name="scheme_return_history",
+    ),
+    path(
+        "analytics/<str:scheme_type>/<int:scheme_id>/",
+        scheme_analytics,
+        name="scheme_analytics",
+    ),
+    path(
+        "peers/<str:scheme_type>/",
+        scheme_peer_quartile,
+        name="scheme_peer_quartile",
+    ),
+]
@@ -1,3 +1,153 @@
-from django.shortcuts import render
+from datetime import date
 
-# Create your views here.
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_GET
+
+from homepage.models.schemes import SCHEME_MODELS, SchemeType
+from homepage.services.catalog_cache import cache_catalog_page
+from funddetails.models import PeerHorizon, SchemeAnalytics
+from funddetails.services.analytics import ANALYTICS_FIELDS
+from funddetails.services.peer_ranks import peer_quartile
+from funddetails.services.snapshots import SNAPSHOT_FIELDS, get_return_history
+
+# URL segment -> SchemeType
+HISTORY_SCHEME_TYPES = {
+    "pms": SchemeType.PMS,
+    "aif": SchemeType.AIF,
+}
+
+ANALYTICS_SCHEME_TYPES = {
+    **HISTORY_SCHEME_TYPES,
+    "mf": SchemeType.MF,
+}
+
+DEFAULT_HISTORY_FIELDS = (
+    "one_year_return",
+    "one_year_benchmark_return",
+    "three_year_return",
+    "three_year_benchmark_return",
+)
+
+
+# ======================================================
+# RETURN HISTORY (for trend charts)
+# ======================================================
+@require_GET
+@cache_catalog_page
+def scheme_return_history(request, scheme_type, scheme_id):
+    """
+    GET /funds/history/<pms|aif>/<scheme_id>/?fields=...&from=YYYY-MM-DD&to=YYYY-MM-DD
+
+    Returns the scheme's snapshots as parallel arrays:
+    {"dates": [...], "series": {"one_year_return": [...], ...}}
+    """
+    if scheme_type not in HISTORY_SCHEME_TYPES:
+        raise Http404("Unknown scheme type")
+
+    raw_fields = request.GET.get("fields")
+    if raw_fields:
+        fields = [name.strip() for name in raw_fields.split(",") if name.strip()]
+    else:
+        fields = list(DEFAULT_HISTORY_FIELDS)
+
+    unknown = [name for name in fields if name not in SNAPSHOT_FIELDS]
+    if unknown:
+        return JsonResponse({"error": f"Unknown fields: {', '.join(unknown)}"}, status=400)
+
+    try:
+        start = date.fromisoformat(request.GET["from"]) if request.GET.get("from") else None
+        end = date.fromisoformat(request.GET["to"]) if request.GET.get("to") else None
+    except ValueError:
+        return JsonResponse({"error": "from / to must be YYYY-MM-DD dates"}, status=400)
+
+    dates, series = get_return_history(
+        HISTORY_SCHEME_TYPES[scheme_type], scheme_id, fields, start=start, end=end
+    )
+
+    return JsonResponse({
+        "scheme_type": HISTORY_SCHEME_TYPES[scheme_type],
+        "scheme_id": scheme_id,
+        "dates": dates,
+        "series": series,
+    })
+
+
+# ======================================================
+# PRECOMPUTED ANALYTICS
+# ======================================================
+@require_GET
+@cache_catalog_page
+def scheme_analytics(request, scheme_type, scheme_id):
+    """
+    GET /funds/analytics/<pms|aif|mf>/<scheme_id>/
+
+    Rolling returns, drawdown, volatility and Sharpe as stored by
+    ``manage.py compute_analytics``; nothing is computed per request.
+    """
+    if scheme_type not in ANALYTICS_SCHEME_TYPES:
+        raise Http404("Unknown scheme type")
+
+    analytics = (
+        SchemeAnalytics.objects
+        .filter(scheme_type=ANALYTICS_SCHEME_TYPES[scheme_type], scheme_id=scheme_id)
+        .values(*ANALYTICS_FIELDS, "computed_at")
+        .first()
+    )
+    if analytics is None:
+        raise Http404("No analytics for this scheme")
+
+    return JsonResponse({
+        "scheme_type": ANALYTICS_SCHEME_TYPES[scheme_type],
+        "scheme_id": scheme_id,
+        **analytics,
+    })
+
+
+# ======================================================
+# CATEGORY PEER QUARTILES
+# ======================================================
+@require_GET
+@cache_catalog_page
+def scheme_peer_quartile(request, scheme_type):
+    """
+    GET /funds/peers/<pms|aif>/?group=CAT3&horizon=3y&quartile=1
+
+    Schemes in one quartile of a peer group (PMS category / AIF category),
+    best first, as stored by ``manage.py compute_peer_ranks``.
+    """
+    if scheme_type not in HISTORY_SCHEME_TYPES:
+        raise Http404("Unknown scheme type")
+
+    group = request.GET.get("group")
+    horizon = request.GET.get("horizon", PeerHorizon.THREE_YEAR)
+    if not group:
+        return JsonResponse({"error": "group is required"}, status=400)
+    if horizon not in PeerHorizon.values:
+        return JsonResponse({"error": f"horizon must be one of {', '.join(PeerHorizon.values)}"}, status=400)
+    try:
+        quartile = int(request.GET.get("quartile", 1))
+    except ValueError:
+        quartile = 0
+    if not 1 <= quartile <= 4:
+        return JsonResponse({"error": "quartile must be 1 to 4"}, status=400)
+
+    scheme_type = HISTORY_SCHEME_TYPES[scheme_type]
+    ranks = list(
+        peer_quartile(scheme_type, group, horizon, quartile)
+        .values("scheme_id", "scheme_return", "percentile", "alpha", "peer_count")
+    )
+    names = dict(
+        SCHEME_MODELS[scheme_type].objects
+        .filter(id__in=[rank["scheme_id"] for rank in ranks])
+        .values_list("id", "ia_name")
+    )
+    for rank in ranks:
+        rank["name"] = names.get(rank["scheme_id"])
+
+    return JsonResponse({
+        "scheme_type": scheme_type,
+        "group": group,
+        "horizon": horizon,
+        "quartile": quartile,
+        "schemes": ranks,
+    })
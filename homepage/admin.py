@@ -1,7 +1,18 @@
 # Register your models here.
-from django.contrib import admin
+import os
+import tempfile
+from pathlib import Path
+
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+
+from .forms import SchemeImportForm
 from .models.providers import PMSProvider, AIFProvider
-from .models.schemes import PMSScheme, AIFScheme
+from .models.schemes import PMSScheme, AIFScheme, SchemeType
+from .services.scheme_import import SchemeImportError, import_scheme_file
 
 
 # =========================
@@ -42,12 +53,81 @@ class AIFProviderAdmin(admin.ModelAdmin):
 # SCHEMES
 # =========================
 
+class SchemeImportAdminMixin:
+    """
+    Adds an "Import from sheet" page to a scheme changelist.
+    Uploads are handed to the same bulk importer as `manage.py import_schemes`.
+    """
+
+    scheme_type = None
+    change_list_template = "admin/homepage/scheme_change_list.html"
+
+    def get_urls(self):
+        opts = self.model._meta
+        return [
+            path(
+                "import/",
+                self.admin_site.admin_view(self.import_view),
+                name=f"{opts.app_label}_{opts.model_name}_import",
+            ),
+        ] + super().get_urls()
+
+    def import_view(self, request):
+        if not (self.has_add_permission(request) and self.has_change_permission(request)):
+            raise PermissionDenied
+
+        opts = self.model._meta
+        form = SchemeImportForm(request.POST or None, request.FILES or None)
+
+        if request.method == "POST" and form.is_valid():
+            try:
+                result = self._run_import(
+                    form.cleaned_data["file"],
+                    sheets=form.cleaned_data["sheets"],
+                    as_of=form.cleaned_data["as_of"],
+                    deactivate_missing=form.cleaned_data["deactivate_missing"],
+                )
+            except SchemeImportError as e:
+                messages.error(request, str(e))
+            else:
+                messages.success(request, result.summary())
+                for error in result.errors:
+                    messages.warning(request, error)
+                return redirect(reverse(f"admin:{opts.app_label}_{opts.model_name}_changelist"))
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": opts,
+            "form": form,
+            "title": f"Import {opts.verbose_name_plural}",
+        }
+        return TemplateResponse(request, "admin/homepage/scheme_import.html", context)
+
+    def _run_import(self, upload, **options):
+        # Large uploads are already spooled to disk; small ones are written out
+        # so openpyxl can stream them in read-only mode.
+        if hasattr(upload, "temporary_file_path"):
+            return import_scheme_file(
+                upload.temporary_file_path(), self.scheme_type, source_name=upload.name, **options
+            )
+
+        with tempfile.NamedTemporaryFile(suffix=Path(upload.name).suffix.lower(), delete=False) as tmp:
+            for chunk in upload.chunks():
+                tmp.write(chunk)
+        try:
+            return import_scheme_file(tmp.name, self.scheme_type, source_name=upload.name, **options)
+        finally:
+            os.remove(tmp.name)
+
+
 @admin.register(PMSScheme)
-class PMSSchemeAdmin(admin.ModelAdmin):
+class PMSSchemeAdmin(SchemeImportAdminMixin, admin.ModelAdmin):
+    scheme_type = SchemeType.PMS
     list_display = (
         "ia_name",
         "provider",
         "scheme_priority",
+        "effective_priority",
         "is_shortlisted",
         "open_for_investment",
         "is_active",
@@ -68,12 +148,14 @@ class PMSSchemeAdmin(admin.ModelAdmin):
 
 
 @admin.register(AIFScheme)
-class AIFSchemeAdmin(admin.ModelAdmin):
+class AIFSchemeAdmin(SchemeImportAdminMixin, admin.ModelAdmin):
+    scheme_type = SchemeType.AIF
     list_display = (
         "ia_name",
         "provider",
         "aif_category",
         "scheme_priority",
+        "effective_priority",
         "is_shortlisted",
         "open_for_investment",
         "is_active",
@@ -2,6 +2,8 @@
 from django import forms
 from django.core.validators import RegexValidator
 
+from homepage.services.scheme_import import SUPPORTED_EXTENSIONS
+
 MOBILE_VALIDATOR = RegexValidator(
     regex=r"^[0-9+\-\s]{8,15}$",
     message="Enter a valid mobile number (8–15 digits, +, - and spaces allowed)."
@@ -57,4 +59,37 @@ class ContactForm(forms.Form):
     def clean_query(self): return self.cleaned_data["query"].strip()
     def clean_source_url(self):
         src = (self.cleaned_data.get("source_url") or "").strip()
-        return src[:512]
\ No newline at end of file
+        return src[:512]
+
+class SchemeImportForm(forms.Form):
+    file = forms.FileField(
+        label="Scheme sheet",
+        help_text="Excel workbook (.xlsx) or CSV. Every sheet is imported unless sheet names are given.",
+    )
+    sheets = forms.CharField(
+        label="Sheet names",
+        required=False,
+        help_text="Optional, comma separated",
+    )
+    as_of = forms.DateField(
+        label="Returns as of",
+        required=False,
+        help_text="Date the sheet's returns are reported for (YYYY-MM-DD). Defaults to today.",
+    )
+    deactivate_missing = forms.BooleanField(
+        label="Deactivate missing schemes",
+        required=False,
+        help_text="Mark active schemes of the uploaded sheets that are no longer listed as inactive.",
+    )
+
+    def clean_file(self):
+        upload = self.cleaned_data["file"]
+        if not upload.name.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise forms.ValidationError(
+                f"Upload one of: {', '.join(SUPPORTED_EXTENSIONS)}"
+            )
+        return upload
+
+    def clean_sheets(self):
+        raw = self.cleaned_data.get("sheets") or ""
+        return [name.strip() for name in raw.split(",") if name.strip()]
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from homepage.models.schemes import SCHEME_MODELS
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.scheme_fees import DEFAULT_BATCH_SIZE, backfill_parsed_fields
+
+
+class Command(BaseCommand):
+    help = "Parse min. investment and fee text of existing PMS / AIF schemes into their numeric columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            dest="scheme_types",
+            action="append",
+            choices=[scheme_type.lower() for scheme_type in SCHEME_MODELS],
+            help="Only this scheme type (repeatable). Defaults to PMS and AIF.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Schemes per bulk update (default {DEFAULT_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        scheme_types = [t.upper() for t in options["scheme_types"] or SCHEME_MODELS]
+
+        for scheme_type in scheme_types:
+            checked, updated = backfill_parsed_fields(scheme_type, batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"{scheme_type}: {updated} of {checked} schemes updated"))
+
+        bump_catalog_version()
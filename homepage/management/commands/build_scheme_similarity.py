@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from homepage.models.schemes import SCHEME_MODELS
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.similarity import DEFAULT_BLOCK_SIZE, DEFAULT_NEIGHBOURS, build_scheme_similarity
+
+
+class Command(BaseCommand):
+    help = "Rebuild the similar-scheme lists shown on scheme pages (run after imports)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            dest="scheme_types",
+            action="append",
+            choices=[scheme_type.lower() for scheme_type in SCHEME_MODELS],
+            help="Only this scheme type (repeatable). Defaults to PMS and AIF.",
+        )
+        parser.add_argument(
+            "--neighbours",
+            type=int,
+            default=DEFAULT_NEIGHBOURS,
+            help=f"Similar schemes kept per scheme (default {DEFAULT_NEIGHBOURS})",
+        )
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=DEFAULT_BLOCK_SIZE,
+            help=f"Schemes per distance block (default {DEFAULT_BLOCK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["neighbours"] < 1:
+            raise CommandError("--neighbours must be at least 1")
+        if options["block_size"] < 1:
+            raise CommandError("--block-size must be at least 1")
+
+        scheme_types = [t.upper() for t in options["scheme_types"] or SCHEME_MODELS]
+
+        for scheme_type in scheme_types:
+            built = build_scheme_similarity(
+                scheme_type,
+                k=options["neighbours"],
+                block_size=options["block_size"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"{scheme_type}: similar schemes built for {built} schemes"))
+
+        bump_catalog_version()
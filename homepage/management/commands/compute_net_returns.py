@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from homepage.models.schemes import SCHEME_MODELS
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.catalog_entries import refresh_catalog_entries
+from homepage.services.net_returns import DEFAULT_BATCH_SIZE, compute_net_returns
+
+
+class Command(BaseCommand):
+    help = "Compute net-of-fee returns for every PMS / AIF scheme from its returns and parsed fees"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            dest="scheme_types",
+            action="append",
+            choices=[scheme_type.lower() for scheme_type in SCHEME_MODELS],
+            help="Only this scheme type (repeatable). Defaults to PMS and AIF.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Schemes per bulk update (default {DEFAULT_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        scheme_types = [t.upper() for t in options["scheme_types"] or SCHEME_MODELS]
+
+        for scheme_type in scheme_types:
+            written = compute_net_returns(scheme_type, batch_size=options["batch_size"])
+            refresh_catalog_entries(scheme_type)
+            self.stdout.write(self.style.SUCCESS(f"{scheme_type}: net returns computed for {written} schemes"))
+
+        bump_catalog_version()
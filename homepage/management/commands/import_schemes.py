@@ -0,0 +1,67 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from homepage.models.schemes import SCHEME_MODELS
+from homepage.services.scheme_import import (
+    DEFAULT_BATCH_SIZE,
+    SchemeImportError,
+    import_scheme_file,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import PMS / AIF schemes from an Excel workbook or CSV file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the .xlsx / .csv file")
+        parser.add_argument(
+            "--type",
+            dest="scheme_type",
+            required=True,
+            choices=[scheme_type.lower() for scheme_type in SCHEME_MODELS],
+            help="Scheme table to load the rows into",
+        )
+        parser.add_argument(
+            "--sheet",
+            dest="sheets",
+            action="append",
+            help="Only import this sheet (repeatable). Defaults to every sheet.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows per bulk upsert (default {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--as-of",
+            type=date.fromisoformat,
+            help="Date (YYYY-MM-DD) the sheet's returns are reported for. Defaults to today.",
+        )
+        parser.add_argument(
+            "--deactivate-missing",
+            action="store_true",
+            help="Deactivate active schemes of the imported sheets that the file no longer lists",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        try:
+            result = import_scheme_file(
+                options["path"],
+                options["scheme_type"].upper(),
+                batch_size=options["batch_size"],
+                sheets=options["sheets"],
+                as_of=options["as_of"],
+                deactivate_missing=options["deactivate_missing"],
+            )
+        except (SchemeImportError, OSError) as e:
+            raise CommandError(str(e))
+
+        for error in result.errors:
+            self.stderr.write(error)
+
+        self.stdout.write(self.style.SUCCESS(result.summary()))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents for schemes, mutual funds and providers"
+
+    def handle(self, *args, **options):
+        written = rebuild_search_index()
+        bump_catalog_version()
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt: {written} documents"))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.catalog_entries import rebuild_catalog_entries
+
+
+class Command(BaseCommand):
+    help = "Rebuild the combined PMS / AIF catalog read model from the scheme tables"
+
+    def handle(self, *args, **options):
+        written = rebuild_catalog_entries()
+        bump_catalog_version()
+        self.stdout.write(self.style.SUCCESS(f"Catalog rebuilt: {written} entries"))
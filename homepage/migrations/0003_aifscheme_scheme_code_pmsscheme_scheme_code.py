@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:21
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+# Mirrors homepage.services.scheme_import: cells the importer reads as empty
+EMPTY_VALUES = {"", "-", "--", "na", "n/a", "nil", "none", "null"}
+
+
+def _name(value):
+    value = (value or "").strip()
+    return "" if value.lower() in EMPTY_VALUES else value
+
+
+def backfill_scheme_code(apps, schema_editor):
+    """
+    Give existing schemes the key the importer derives for sheets without a
+    scheme_code column, so the first import updates them instead of adding copies.
+    """
+    for scheme_name in ("PMSScheme", "AIFScheme"):
+        Scheme = apps.get_model("homepage", scheme_name)
+        taken = set(Scheme.objects.exclude(scheme_code=None).values_list("scheme_code", flat=True))
+        pending = []
+        rows = (
+            Scheme.objects
+            .filter(scheme_code=None)
+            .order_by("id")
+            .values_list("id", "provider_id", "ia_name", "strategy_name")
+        )
+        for pk, shortname, ia_name, strategy_name in rows.iterator():
+            name, strategy = _name(ia_name), _name(strategy_name)
+            if not name and not strategy:
+                continue
+            code = slugify(f"{shortname} {name} {strategy}")[:120]
+            # Duplicates keep no key; the oldest row is the one the import updates
+            if code in taken:
+                continue
+            taken.add(code)
+            pending.append(Scheme(id=pk, scheme_code=code))
+        Scheme.objects.bulk_update(pending, ["scheme_code"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0002_contactinquiry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aifscheme',
+            name='scheme_code',
+            field=models.CharField(blank=True, help_text='Stable key used to upsert this scheme from the Excel sheets', max_length=120, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='scheme_code',
+            field=models.CharField(blank=True, help_text='Stable key used to upsert this scheme from the Excel sheets', max_length=120, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_scheme_code, migrations.RunPython.noop),
+    ]
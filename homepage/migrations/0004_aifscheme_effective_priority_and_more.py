@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:22
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_effective_priority(apps, schema_editor):
+    for scheme_name, provider_name in (("PMSScheme", "PMSProvider"), ("AIFScheme", "AIFProvider")):
+        Scheme = apps.get_model("homepage", scheme_name)
+        Provider = apps.get_model("homepage", provider_name)
+        provider_priority = Subquery(
+            Provider.objects.filter(shortname=OuterRef("provider_id")).values("priority")[:1]
+        )
+        Scheme.objects.update(
+            effective_priority=Coalesce(provider_priority, 5) * 10 + Coalesce("scheme_priority", 5)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0003_aifscheme_scheme_code_pmsscheme_scheme_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aifscheme',
+            name='effective_priority',
+            field=models.PositiveSmallIntegerField(default=55, editable=False, help_text='Provider priority x 10 + scheme priority, kept in sync on save'),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='effective_priority',
+            field=models.PositiveSmallIntegerField(default=55, editable=False, help_text='Provider priority x 10 + scheme priority, kept in sync on save'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'open_for_investment', 'effective_priority'], name='homepage_ai_is_acti_344591_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'open_for_investment', 'effective_priority'], name='homepage_pm_is_acti_2c3494_idx'),
+        ),
+        migrations.RunPython(backfill_effective_priority, migrations.RunPython.noop),
+    ]
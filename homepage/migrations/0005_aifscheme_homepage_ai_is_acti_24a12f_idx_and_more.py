@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0004_aifscheme_effective_priority_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'one_year_return'], name='homepage_ai_is_acti_24a12f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'three_year_return'], name='homepage_ai_is_acti_94190c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'si_return'], name='homepage_ai_is_acti_dffb53_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'aum'], name='homepage_ai_is_acti_ae980a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'one_year_return'], name='homepage_pm_is_acti_81a483_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'three_year_return'], name='homepage_pm_is_acti_714afa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'si_return'], name='homepage_pm_is_acti_83bdbc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'aum'], name='homepage_pm_is_acti_982856_idx'),
+        ),
+    ]
@@ -0,0 +1,163 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE homepage_searchdocument_fts USING fts5(
+        title, strategy, managers, provider_name, kind,
+        content='homepage_searchdocument',
+        content_rowid='id',
+        tokenize="unicode61 remove_diacritics 2 tokenchars '_'",
+        prefix='1 2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER homepage_searchdocument_fts_insert AFTER INSERT ON homepage_searchdocument BEGIN
+        INSERT INTO homepage_searchdocument_fts (rowid, title, strategy, managers, provider_name, kind)
+        VALUES (new.id, new.title, new.strategy, new.managers, new.provider_name, new.kind);
+    END
+    """,
+    """
+    CREATE TRIGGER homepage_searchdocument_fts_delete AFTER DELETE ON homepage_searchdocument BEGIN
+        INSERT INTO homepage_searchdocument_fts (homepage_searchdocument_fts, rowid, title, strategy, managers, provider_name, kind)
+        VALUES ('delete', old.id, old.title, old.strategy, old.managers, old.provider_name, old.kind);
+    END
+    """,
+    """
+    CREATE TRIGGER homepage_searchdocument_fts_update AFTER UPDATE ON homepage_searchdocument BEGIN
+        INSERT INTO homepage_searchdocument_fts (homepage_searchdocument_fts, rowid, title, strategy, managers, provider_name, kind)
+        VALUES ('delete', old.id, old.title, old.strategy, old.managers, old.provider_name, old.kind);
+        INSERT INTO homepage_searchdocument_fts (rowid, title, strategy, managers, provider_name, kind)
+        VALUES (new.id, new.title, new.strategy, new.managers, new.provider_name, new.kind);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS homepage_searchdocument_fts_update",
+    "DROP TRIGGER IF EXISTS homepage_searchdocument_fts_delete",
+    "DROP TRIGGER IF EXISTS homepage_searchdocument_fts_insert",
+    "DROP TABLE IF EXISTS homepage_searchdocument_fts",
+]
+
+# Must match POSTGRES_DOCUMENT in homepage/services/search.py
+POSTGRES_FORWARD = [
+    """
+    CREATE INDEX homepage_searchdocument_tsv ON homepage_searchdocument USING GIN (
+        to_tsvector('simple'::regconfig,
+            coalesce(title, '') || ' ' || coalesce(strategy, '') || ' ' ||
+            coalesce(managers, '') || ' ' || coalesce(provider_name, ''))
+    )
+    """,
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS homepage_searchdocument_tsv",
+]
+
+
+def create_search_index(apps, schema_editor):
+    statements = {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def backfill_search_documents(apps, schema_editor):
+    """Index existing providers, schemes and funds, as rebuild_search_index does"""
+    SearchDocument = apps.get_model("homepage", "SearchDocument")
+    documents = []
+    for scheme_type in ("PMS", "AIF"):
+        Provider = apps.get_model("homepage", f"{scheme_type}Provider")
+        Scheme = apps.get_model("homepage", f"{scheme_type}Scheme")
+        documents += [
+            SearchDocument(
+                kind=f"{scheme_type}_PROVIDER",
+                object_id=pk,
+                title=name,
+                provider_name=shortname,
+                provider_key=shortname,
+                rank=priority,
+                is_active=is_active,
+            )
+            for pk, name, shortname, priority, is_active in Provider.objects.values_list(
+                "id", "name", "shortname", "priority", "is_active"
+            ).iterator()
+        ]
+        documents += [
+            SearchDocument(
+                kind=scheme_type,
+                object_id=pk,
+                title=(ia_name or strategy or product or str(pk))[:300],
+                strategy=strategy,
+                managers=managers,
+                provider_name=provider_name,
+                provider_key=shortname,
+                rank=effective_priority,
+                is_active=is_active and provider_active,
+            )
+            for (
+                pk, ia_name, strategy, product, managers, provider_name,
+                shortname, effective_priority, is_active, provider_active,
+            ) in Scheme.objects.values_list(
+                "id", "ia_name", "strategy_name", "product_name", "fund_managers", "provider__name",
+                "provider_id", "effective_priority", "is_active", "provider__is_active",
+            ).iterator()
+        ]
+
+    MutualFundScheme = apps.get_model("funddetails", "MutualFundScheme")
+    documents += [
+        SearchDocument(
+            kind="MF",
+            object_id=pk,
+            title=scheme_name[:300],
+            strategy=category,
+            provider_name=amc_name,
+            is_active=is_active,
+        )
+        for pk, scheme_name, category, amc_name, is_active in MutualFundScheme.objects.values_list(
+            "id", "scheme_name", "category", "amc_name", "is_active"
+        ).iterator()
+    ]
+    # Catalog documents first: SQLite scores the earliest rowids first
+    SearchDocument.objects.bulk_create(documents, batch_size=1000)
+
+
+def drop_search_index(apps, schema_editor):
+    statements = {"sqlite": SQLITE_REVERSE, "postgresql": POSTGRES_REVERSE}
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0005_aifscheme_homepage_ai_is_acti_24a12f_idx_and_more'),
+        ('funddetails', '0002_mutualfundscheme_mutualfundnav'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('PMS', 'PMS Scheme'), ('AIF', 'AIF Scheme'), ('MF', 'Mutual Fund'), ('PMS_PROVIDER', 'PMS Provider'), ('AIF_PROVIDER', 'AIF Provider')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('title', models.CharField(max_length=300)),
+                ('strategy', models.CharField(blank=True, max_length=255, null=True)),
+                ('managers', models.TextField(blank=True, null=True)),
+                ('provider_name', models.CharField(blank=True, max_length=200, null=True)),
+                ('provider_key', models.CharField(blank=True, help_text="Provider shortname, used to refresh a provider's schemes", max_length=50, null=True)),
+                ('rank', models.PositiveSmallIntegerField(default=0, help_text='Tie-breaker, lower first')),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'indexes': [models.Index(fields=['kind', 'provider_key'], name='homepage_se_kind_ba042b_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
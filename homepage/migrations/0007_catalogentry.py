@@ -0,0 +1,97 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:48
+
+from django.db import migrations, models
+
+ENTRY_SOURCE_FIELDS = {
+    "name": "ia_name",
+    "strategy_name": "strategy_name",
+    "category": "category",
+    "aum": "aum",
+    "min_inv_amount": "min_inv_amount",
+    "date_of_inception": "date_of_inception",
+    "one_month_return": "one_month_return",
+    "three_month_return": "three_month_return",
+    "six_month_return": "six_month_return",
+    "one_year_return": "one_year_return",
+    "three_year_return": "three_year_return",
+    "five_year_return": "five_year_return",
+    "si_return": "si_return",
+    "provider_shortname": "provider_id",
+    "provider_name": "provider__name",
+    "provider_is_whitelisted": "provider__is_whitelisted",
+    "effective_priority": "effective_priority",
+    "is_shortlisted": "is_shortlisted",
+    "scheme_updated_at": "updated_at",
+}
+
+
+def backfill_catalog_entries(apps, schema_editor):
+    CatalogEntry = apps.get_model("homepage", "CatalogEntry")
+    for scheme_type, scheme_name in (("PMS", "PMSScheme"), ("AIF", "AIFScheme")):
+        Scheme = apps.get_model("homepage", scheme_name)
+        source = dict(ENTRY_SOURCE_FIELDS)
+        if scheme_type == "AIF":
+            source["aif_category"] = "aif_category"
+        rows = Scheme.objects.values_list(
+            "id", "is_active", "open_for_investment", "provider__is_active", *source.values()
+        )
+        CatalogEntry.objects.bulk_create(
+            (
+                CatalogEntry(
+                    scheme_type=scheme_type,
+                    scheme_id=pk,
+                    is_listed=is_active and open_for_investment and provider_active,
+                    **dict(zip(source, values)),
+                )
+                for pk, is_active, open_for_investment, provider_active, *values in rows.iterator()
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0006_searchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheme_type', models.CharField(choices=[('PMS', 'PMS'), ('AIF', 'AIF'), ('MF', 'Mutual Fund')], max_length=10)),
+                ('scheme_id', models.BigIntegerField(help_text='Primary key in the PMS / AIF scheme table')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('strategy_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('category', models.CharField(blank=True, max_length=255, null=True)),
+                ('aif_category', models.CharField(blank=True, max_length=255, null=True)),
+                ('aum', models.DecimalField(blank=True, decimal_places=2, max_digits=20, null=True)),
+                ('min_inv_amount', models.CharField(blank=True, max_length=50, null=True)),
+                ('date_of_inception', models.DateField(blank=True, null=True)),
+                ('one_month_return', models.FloatField(blank=True, null=True)),
+                ('three_month_return', models.FloatField(blank=True, null=True)),
+                ('six_month_return', models.FloatField(blank=True, null=True)),
+                ('one_year_return', models.FloatField(blank=True, null=True)),
+                ('three_year_return', models.FloatField(blank=True, null=True)),
+                ('five_year_return', models.FloatField(blank=True, null=True)),
+                ('si_return', models.FloatField(blank=True, null=True)),
+                ('provider_shortname', models.CharField(max_length=50)),
+                ('provider_name', models.CharField(max_length=200)),
+                ('provider_is_whitelisted', models.BooleanField(default=False)),
+                ('effective_priority', models.PositiveSmallIntegerField()),
+                ('is_shortlisted', models.BooleanField(default=False)),
+                ('is_listed', models.BooleanField(default=True, help_text='Scheme and provider active, scheme open for investment')),
+                ('scheme_updated_at', models.DateTimeField()),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Catalog Entry',
+                'verbose_name_plural': 'Catalog Entries',
+                'ordering': ['effective_priority', 'id'],
+                'indexes': [models.Index(fields=['is_listed', 'effective_priority', 'id'], name='homepage_ca_is_list_aedd3f_idx'), models.Index(fields=['is_listed', 'scheme_type', 'effective_priority', 'id'], name='homepage_ca_is_list_4fc6ab_idx'), models.Index(fields=['is_listed', 'one_year_return'], name='homepage_ca_is_list_50e3da_idx'), models.Index(fields=['is_listed', 'three_year_return'], name='homepage_ca_is_list_f01729_idx'), models.Index(fields=['is_listed', 'si_return'], name='homepage_ca_is_list_9149fa_idx'), models.Index(fields=['is_listed', 'aum'], name='homepage_ca_is_list_4fb61f_idx'), models.Index(fields=['provider_shortname', 'scheme_type'], name='homepage_ca_provide_8ca439_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scheme_type', 'scheme_id'), name='unique_catalog_entry')],
+            },
+        ),
+        migrations.RunPython(backfill_catalog_entries, migrations.RunPython.noop),
+    ]
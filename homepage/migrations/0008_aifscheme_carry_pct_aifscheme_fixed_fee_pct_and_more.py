@@ -0,0 +1,202 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0007_catalogentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aifscheme',
+            name='carry_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='fixed_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='hurdle_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='min_inv_amount_value',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Minimum investment in rupees, parsed from min_inv_amount', max_digits=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='setup_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='total_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, help_text='Setup + fixed fee %, the cost paid regardless of performance', max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='variable_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='carry_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='fixed_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='hurdle_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='min_inv_amount_value',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='setup_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='total_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='variable_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='carry_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='fixed_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='hurdle_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='min_inv_amount_value',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Minimum investment in rupees, parsed from min_inv_amount', max_digits=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='setup_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='total_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, help_text='Setup + fixed fee %, the cost paid regardless of performance', max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='variable_fee_pct',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=8, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'min_inv_amount_value'], name='homepage_ai_is_acti_ee4f33_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'setup_fee_pct'], name='homepage_ai_is_acti_1de437_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'fixed_fee_pct'], name='homepage_ai_is_acti_1ebed6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'variable_fee_pct'], name='homepage_ai_is_acti_b93f9b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'hurdle_pct'], name='homepage_ai_is_acti_aa11f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'carry_pct'], name='homepage_ai_is_acti_53c0b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'total_fee_pct'], name='homepage_ai_is_acti_bda2d3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'min_inv_amount_value'], name='homepage_ca_is_list_13f7d9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'setup_fee_pct'], name='homepage_ca_is_list_a3fd88_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'fixed_fee_pct'], name='homepage_ca_is_list_1f4e62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'variable_fee_pct'], name='homepage_ca_is_list_b4cf48_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'hurdle_pct'], name='homepage_ca_is_list_7015a6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'carry_pct'], name='homepage_ca_is_list_bc5c6d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'total_fee_pct'], name='homepage_ca_is_list_fcc546_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'min_inv_amount_value'], name='homepage_pm_is_acti_0e2b6c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'setup_fee_pct'], name='homepage_pm_is_acti_2656a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'fixed_fee_pct'], name='homepage_pm_is_acti_f19ecc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'variable_fee_pct'], name='homepage_pm_is_acti_325f8c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'hurdle_pct'], name='homepage_pm_is_acti_9b80c8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'carry_pct'], name='homepage_pm_is_acti_53bac9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'total_fee_pct'], name='homepage_pm_is_acti_e44d1e_idx'),
+        ),
+    ]
@@ -0,0 +1,154 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0008_aifscheme_carry_pct_aifscheme_fixed_fee_pct_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_five_year_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_one_month_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_one_year_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_si_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_six_month_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_three_month_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='aifscheme',
+            name='net_three_year_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_five_year_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_one_month_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_one_year_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_si_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_six_month_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_three_month_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogentry',
+            name='net_three_year_return',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_five_year_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_one_month_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_one_year_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_si_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_six_month_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_three_month_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='net_three_year_return',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'net_one_year_return'], name='homepage_ai_is_acti_eded6d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'net_three_year_return'], name='homepage_ai_is_acti_383413_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aifscheme',
+            index=models.Index(fields=['is_active', 'net_si_return'], name='homepage_ai_is_acti_3af66e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'net_one_year_return'], name='homepage_ca_is_list_5a68cd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'net_three_year_return'], name='homepage_ca_is_list_f89b06_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogentry',
+            index=models.Index(fields=['is_listed', 'net_si_return'], name='homepage_ca_is_list_04b8d8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'net_one_year_return'], name='homepage_pm_is_acti_a31e95_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'net_three_year_return'], name='homepage_pm_is_acti_666bbf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pmsscheme',
+            index=models.Index(fields=['is_active', 'net_si_return'], name='homepage_pm_is_acti_b4454f_idx'),
+        ),
+    ]
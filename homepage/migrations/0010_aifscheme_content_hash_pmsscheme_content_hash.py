@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0009_aifscheme_net_five_year_return_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aifscheme',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Fingerprint of the imported values; cleared on manual edits', max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='pmsscheme',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Fingerprint of the imported values; cleared on manual edits', max_length=32, null=True),
+        ),
+    ]
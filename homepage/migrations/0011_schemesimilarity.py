@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0010_aifscheme_content_hash_pmsscheme_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchemeSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheme_type', models.CharField(choices=[('PMS', 'PMS'), ('AIF', 'AIF'), ('MF', 'Mutual Fund')], max_length=10)),
+                ('scheme_id', models.BigIntegerField()),
+                ('similar_scheme_id', models.BigIntegerField()),
+                ('rank', models.PositiveSmallIntegerField(help_text='1 = most similar')),
+                ('distance', models.FloatField(help_text='Euclidean distance between feature vectors')),
+                ('built_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Scheme Similarity',
+                'verbose_name_plural': 'Scheme Similarities',
+                'ordering': ['scheme_type', 'scheme_id', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('scheme_type', 'scheme_id', 'rank'), name='unique_scheme_similarity_rank'), models.UniqueConstraint(fields=('scheme_type', 'scheme_id', 'similar_scheme_id'), name='unique_scheme_similarity_pair')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0011_schemesimilarity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField()),
+                ('changed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Catalog Version',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homepage', '0012_catalogversion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='catalogentry',
+            name='min_inv_amount',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+    ]
@@ -1,11 +1,22 @@
 from .providers import PMSProvider, AIFProvider
-from .schemes import PMSScheme, AIFScheme
+from .schemes import PMSScheme, AIFScheme, SchemeType, SCHEME_MODELS, PROVIDER_MODELS
 from .contactinquiry import ContactInquiry
+from .search import SearchDocument, SearchKind
+from .catalog import CatalogEntry, CatalogVersion
+from .similarity import SchemeSimilarity
 
 __all__ = [
     "PMSProvider",
     "AIFProvider",
     "PMSScheme",
     "AIFScheme",
+    "SchemeType",
+    "SCHEME_MODELS",
+    "PROVIDER_MODELS",
     "ContactInquiry",
+    "SearchDocument",
+    "SearchKind",
+    "CatalogEntry",
+    "CatalogVersion",
+    "SchemeSimilarity",
 ]
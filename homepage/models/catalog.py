@@ -0,0 +1,129 @@
+from django.db import models
+from django.db.models import Value
+
+from .schemes import SchemeType
+
+
+class CatalogEntryQuerySet(models.QuerySet):
+
+    def listed(self):
+        """Publicly listed entries; Value(True) keeps the (is_listed, ...) indexes usable"""
+        return self.filter(is_listed=Value(True))
+
+
+class CatalogEntry(models.Model):
+    """
+    Read-only, denormalised row per PMS / AIF scheme with its provider fields.
+
+    Lets cross-product listings rank, filter and page both scheme types in one
+    index-ordered query. Never edit directly: rows are rewritten from the
+    scheme tables by homepage/services/catalog_entries.py on every scheme /
+    provider save and import.
+    """
+
+    scheme_type = models.CharField(max_length=10, choices=SchemeType.choices)
+    scheme_id = models.BigIntegerField(help_text="Primary key in the PMS / AIF scheme table")
+
+    # ===== Scheme =====
+    name = models.CharField(max_length=255, blank=True, null=True)
+    strategy_name = models.CharField(max_length=255, blank=True, null=True)
+    category = models.CharField(max_length=255, blank=True, null=True)
+    aif_category = models.CharField(max_length=255, blank=True, null=True)
+    aum = models.DecimalField(max_digits=20, decimal_places=2, blank=True, null=True)
+    min_inv_amount = models.CharField(max_length=100, blank=True, null=True)
+    date_of_inception = models.DateField(blank=True, null=True)
+
+    # ===== Returns =====
+    one_month_return = models.FloatField(blank=True, null=True)
+    three_month_return = models.FloatField(blank=True, null=True)
+    six_month_return = models.FloatField(blank=True, null=True)
+    one_year_return = models.FloatField(blank=True, null=True)
+    three_year_return = models.FloatField(blank=True, null=True)
+    five_year_return = models.FloatField(blank=True, null=True)
+    si_return = models.FloatField(blank=True, null=True)
+    net_one_month_return = models.FloatField(blank=True, null=True)
+    net_three_month_return = models.FloatField(blank=True, null=True)
+    net_six_month_return = models.FloatField(blank=True, null=True)
+    net_one_year_return = models.FloatField(blank=True, null=True)
+    net_three_year_return = models.FloatField(blank=True, null=True)
+    net_five_year_return = models.FloatField(blank=True, null=True)
+    net_si_return = models.FloatField(blank=True, null=True)
+
+    # ===== Parsed amounts / fees =====
+    min_inv_amount_value = models.DecimalField(max_digits=16, decimal_places=2, blank=True, null=True)
+    setup_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True)
+    fixed_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True)
+    variable_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True)
+    hurdle_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True)
+    carry_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True)
+    total_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True)
+
+    # ===== Provider =====
+    provider_shortname = models.CharField(max_length=50)
+    provider_name = models.CharField(max_length=200)
+    provider_is_whitelisted = models.BooleanField(default=False)
+
+    # ===== Ranking / visibility =====
+    effective_priority = models.PositiveSmallIntegerField()
+    is_shortlisted = models.BooleanField(default=False)
+    is_listed = models.BooleanField(
+        default=True,
+        help_text="Scheme and provider active, scheme open for investment",
+    )
+
+    scheme_updated_at = models.DateTimeField()
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    objects = CatalogEntryQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Catalog Entry"
+        verbose_name_plural = "Catalog Entries"
+        ordering = ["effective_priority", "id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scheme_type", "scheme_id"],
+                name="unique_catalog_entry",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["is_listed", "effective_priority", "id"]),
+            models.Index(fields=["is_listed", "scheme_type", "effective_priority", "id"]),
+            models.Index(fields=["is_listed", "one_year_return"]),
+            models.Index(fields=["is_listed", "three_year_return"]),
+            models.Index(fields=["is_listed", "si_return"]),
+            models.Index(fields=["is_listed", "net_one_year_return"]),
+            models.Index(fields=["is_listed", "net_three_year_return"]),
+            models.Index(fields=["is_listed", "net_si_return"]),
+            models.Index(fields=["is_listed", "aum"]),
+            models.Index(fields=["is_listed", "min_inv_amount_value"]),
+            models.Index(fields=["is_listed", "setup_fee_pct"]),
+            models.Index(fields=["is_listed", "fixed_fee_pct"]),
+            models.Index(fields=["is_listed", "variable_fee_pct"]),
+            models.Index(fields=["is_listed", "hurdle_pct"]),
+            models.Index(fields=["is_listed", "carry_pct"]),
+            models.Index(fields=["is_listed", "total_fee_pct"]),
+            models.Index(fields=["provider_shortname", "scheme_type"]),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_type} #{self.scheme_id}: {self.name}"
+
+
+class CatalogVersion(models.Model):
+    """
+    The catalog version counter: a single row, bumped by every catalog write.
+
+    Management commands (imports, backfills, similarity builds) run in their
+    own processes, so the counter lives in the database where the web workers
+    see their bumps; homepage/services/catalog_cache.py only caches it briefly.
+    """
+
+    version = models.PositiveBigIntegerField()
+    changed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Catalog Version"
+
+    def __str__(self):
+        return f"Catalog version {self.version}"
@@ -1,6 +1,10 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+# Priority used when a provider / scheme has none set (1 highest, 5 lowest)
+DEFAULT_PRIORITY = 5
+
 
 class BaseProvider(models.Model):
     """
@@ -34,7 +38,7 @@ class BaseProvider(models.Model):
     is_whitelisted = models.BooleanField(default=False, db_index=True)
 
     priority = models.IntegerField(
-        default=5,
+        default=DEFAULT_PRIORITY,
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         help_text="Priority from 1 (highest) to 5 (lowest)"
     )
@@ -55,6 +59,25 @@ class BaseProvider(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored priority so save() only re-ranks schemes on change
+        instance._loaded_priority = instance.__dict__.get("priority")
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "priority" not in update_fields:
+            return
+
+        if self.priority != getattr(self, "_loaded_priority", None):
+            self.schemes.update(
+                effective_priority=self.priority * 10 + Coalesce("scheme_priority", DEFAULT_PRIORITY)
+            )
+            self._loaded_priority = self.priority
 
 
 class PMSProvider(BaseProvider):
@@ -1,6 +1,37 @@
 from django.db import models
+from django.db.models import Case, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator, MaxValueValidator
-from .providers import AIFProvider, PMSProvider
+from .providers import AIFProvider, PMSProvider, DEFAULT_PRIORITY
+from homepage.services.fee_parsing import PARSED_FIELDS, parse_scheme_values
+
+# Text columns with a parsed numeric copy, and every column derived from them
+PARSED_SOURCE_FIELDS = set(PARSED_FIELDS)
+PARSED_VALUE_FIELDS = [column for column, _ in PARSED_FIELDS.values()] + ["total_fee_pct"]
+
+
+class SchemeType(models.TextChoices):
+    """Scheme families: PMS / AIF live in the catalog tables, MF in funddetails"""
+    PMS = "PMS", "PMS"
+    AIF = "AIF", "AIF"
+    MF = "MF", "Mutual Fund"
+
+
+class SchemeQuerySet(models.QuerySet):
+
+    def active(self):
+        """Active schemes, filtered so the (is_active, ...) indexes are usable"""
+        return self.filter(is_active=Value(True))
+
+    def listed(self):
+        """
+        Active schemes open for investment, filtered so the
+        (is_active, open_for_investment, effective_priority) index is usable.
+
+        Comparing against Value(True) renders `col = true`; a plain `True`
+        renders a bare `WHERE col`, which SQLite cannot match to the index.
+        """
+        return self.filter(is_active=Value(True), open_for_investment=Value(True))
 
 
 class BaseScheme(models.Model):
@@ -9,6 +40,13 @@ class BaseScheme(models.Model):
     """
 
     # ===== Core Scheme Identity =====
+    scheme_code = models.CharField(
+        max_length=120,
+        unique=True,
+        blank=True,
+        null=True,
+        help_text="Stable key used to upsert this scheme from the Excel sheets"
+    )
     ia_name = models.CharField(
         max_length=255,
         blank=True,
@@ -77,6 +115,16 @@ class BaseScheme(models.Model):
         help_text="Since Inception Benchmark Return"
     )
 
+    # ===== Net-of-fee Returns =====
+    # Computed from the returns and parsed fees by homepage/services/net_returns.py
+    net_one_month_return = models.FloatField(blank=True, null=True, editable=False)
+    net_three_month_return = models.FloatField(blank=True, null=True, editable=False)
+    net_six_month_return = models.FloatField(blank=True, null=True, editable=False)
+    net_one_year_return = models.FloatField(blank=True, null=True, editable=False)
+    net_three_year_return = models.FloatField(blank=True, null=True, editable=False)
+    net_five_year_return = models.FloatField(blank=True, null=True, editable=False)
+    net_si_return = models.FloatField(blank=True, null=True, editable=False)
+
     # ===== Fund Details =====
     date_of_inception = models.DateField(blank=True, null=True)
     age = models.CharField(max_length=50, blank=True, null=True)
@@ -94,6 +142,30 @@ class BaseScheme(models.Model):
     
     exit_load = models.CharField(max_length=255, blank=True, null=True)
 
+    # ===== Parsed Amounts / Fees =====
+    # Numeric copies of the text columns above, kept in sync on save and import
+    min_inv_amount_value = models.DecimalField(
+        max_digits=16,
+        decimal_places=2,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Minimum investment in rupees, parsed from min_inv_amount"
+    )
+    setup_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True, editable=False)
+    fixed_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True, editable=False)
+    variable_fee_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True, editable=False)
+    hurdle_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True, editable=False)
+    carry_pct = models.DecimalField(max_digits=8, decimal_places=4, blank=True, null=True, editable=False)
+    total_fee_pct = models.DecimalField(
+        max_digits=8,
+        decimal_places=4,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Setup + fixed fee %, the cost paid regardless of performance"
+    )
+
     # ===== Strategy / Purpose =====
     purpose = models.TextField(blank=True, null=True)
 
@@ -115,28 +187,124 @@ class BaseScheme(models.Model):
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         help_text="Scheme priority from 1 (highest) to 5 (lowest)"
     )
+    effective_priority = models.PositiveSmallIntegerField(
+        default=DEFAULT_PRIORITY * 10 + DEFAULT_PRIORITY,
+        editable=False,
+        help_text="Provider priority x 10 + scheme priority, kept in sync on save"
+    )
 
     # ===== Metadata =====
+    content_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Fingerprint of the imported values; cleared on manual edits"
+    )
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SchemeQuerySet.as_manager()
+
     class Meta:
         abstract = True
         ordering = ["scheme_priority", "ia_name"]
         indexes = [
             models.Index(fields=["is_shortlisted", "scheme_priority"]),
+            models.Index(fields=["is_active", "open_for_investment", "effective_priority"]),
+            # Common compare-page sort keys
+            models.Index(fields=["is_active", "one_year_return"]),
+            models.Index(fields=["is_active", "three_year_return"]),
+            models.Index(fields=["is_active", "si_return"]),
+            models.Index(fields=["is_active", "aum"]),
+            models.Index(fields=["is_active", "net_one_year_return"]),
+            models.Index(fields=["is_active", "net_three_year_return"]),
+            models.Index(fields=["is_active", "net_si_return"]),
+            # Amount / fee range filters
+            models.Index(fields=["is_active", "min_inv_amount_value"]),
+            models.Index(fields=["is_active", "setup_fee_pct"]),
+            models.Index(fields=["is_active", "fixed_fee_pct"]),
+            models.Index(fields=["is_active", "variable_fee_pct"]),
+            models.Index(fields=["is_active", "hurdle_pct"]),
+            models.Index(fields=["is_active", "carry_pct"]),
+            models.Index(fields=["is_active", "total_fee_pct"]),
         ]
 
-    @property
-    def effective_priority(self):
+    @staticmethod
+    def compute_effective_priority(provider_priority, scheme_priority):
         """
         Combines provider priority and scheme priority
         Lower number = higher priority
         """
-        provider_priority = getattr(self.provider, "priority", 5)
-        scheme_priority = self.scheme_priority or 5
-        return (provider_priority * 10) + scheme_priority
+        return ((provider_priority or DEFAULT_PRIORITY) * 10) + (scheme_priority or DEFAULT_PRIORITY)
+
+    @classmethod
+    def refresh_effective_priority(cls, queryset=None):
+        """
+        Recompute the stored effective_priority for many schemes in one UPDATE.
+        Used after bulk writes that bypass save().
+        """
+        provider_model = cls._meta.get_field("provider").related_model
+        provider_priority = Subquery(
+            provider_model.objects
+            .filter(shortname=OuterRef("provider_id"))
+            .values("priority")[:1]
+        )
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.update(
+            effective_priority=(
+                Coalesce(provider_priority, DEFAULT_PRIORITY) * 10
+                + Coalesce("scheme_priority", DEFAULT_PRIORITY)
+            )
+        )
+
+    @staticmethod
+    def compute_total_fee(setup_fee_pct, fixed_fee_pct):
+        """Setup + fixed fee %, None when neither is known"""
+        if setup_fee_pct is None and fixed_fee_pct is None:
+            return None
+        return (setup_fee_pct or 0) + (fixed_fee_pct or 0)
+
+    @classmethod
+    def refresh_total_fee(cls, queryset=None):
+        """
+        Recompute the stored total_fee_pct for many schemes in one UPDATE.
+        Used after bulk writes that bypass save().
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.update(
+            total_fee_pct=Case(
+                When(setup_fee_pct__isnull=True, fixed_fee_pct__isnull=True, then=None),
+                default=Coalesce("setup_fee_pct", Value(0), output_field=models.DecimalField())
+                + Coalesce("fixed_fee_pct", Value(0), output_field=models.DecimalField()),
+            )
+        )
+
+    def refresh_parsed_fields(self):
+        """Re-parse the amount / fee text columns into their numeric copies"""
+        parsed = parse_scheme_values({source: getattr(self, source) for source in PARSED_SOURCE_FIELDS})
+        for column, value in parsed.items():
+            setattr(self, column, value)
+        self.total_fee_pct = self.compute_total_fee(self.setup_fee_pct, self.fixed_fee_pct)
+
+    def save(self, *args, **kwargs):
+        provider_priority = self.provider.priority if self.provider_id else None
+        self.effective_priority = self.compute_effective_priority(provider_priority, self.scheme_priority)
+        self.refresh_parsed_fields()
+        # Edited outside the importer: the next import must rewrite the row
+        self.content_hash = None
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            derived = ["effective_priority", "content_hash"]
+            if PARSED_SOURCE_FIELDS.intersection(update_fields):
+                derived += PARSED_VALUE_FIELDS
+            kwargs["update_fields"] = list(update_fields) + [
+                name for name in derived if name not in update_fields
+            ]
+
+        super().save(*args, **kwargs)
 
 
 
@@ -201,4 +369,17 @@ class PMSScheme(BaseScheme):
 
     def __str__(self):
         provider_name = self.provider.name if self.provider else "Unknown"
-        return f"{provider_name} - {self.ia_name}"
\ No newline at end of file
+        return f"{provider_name} - {self.ia_name}"
+
+
+# Scheme type -> concrete catalog model, used by the importers and catalog services
+SCHEME_MODELS = {
+    SchemeType.PMS: PMSScheme,
+    SchemeType.AIF: AIFScheme,
+}
+
+# Scheme type -> provider model
+PROVIDER_MODELS = {
+    SchemeType.PMS: PMSProvider,
+    SchemeType.AIF: AIFProvider,
+}
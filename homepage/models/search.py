@@ -0,0 +1,56 @@
+from django.db import models
+
+
+class SearchKind(models.TextChoices):
+    """What a search document points at"""
+    PMS = "PMS", "PMS Scheme"
+    AIF = "AIF", "AIF Scheme"
+    MF = "MF", "Mutual Fund"
+    PMS_PROVIDER = "PMS_PROVIDER", "PMS Provider"
+    AIF_PROVIDER = "AIF_PROVIDER", "AIF Provider"
+
+
+class SearchDocument(models.Model):
+    """
+    Flattened, searchable copy of a scheme or provider.
+
+    The full-text index is attached in the database itself (see migration
+    0006): an FTS5 external-content table kept in step by triggers on SQLite,
+    a GIN tsvector expression index on PostgreSQL. Rows are maintained by
+    homepage/services/search.py.
+    """
+
+    kind = models.CharField(max_length=20, choices=SearchKind.choices)
+    object_id = models.BigIntegerField()
+
+    # ===== Indexed text =====
+    title = models.CharField(max_length=300)
+    strategy = models.CharField(max_length=255, blank=True, null=True)
+    managers = models.TextField(blank=True, null=True)
+    provider_name = models.CharField(max_length=200, blank=True, null=True)
+
+    # ===== Ranking / filtering =====
+    provider_key = models.CharField(
+        max_length=50,
+        blank=True,
+        null=True,
+        help_text="Provider shortname, used to refresh a provider's schemes",
+    )
+    rank = models.PositiveSmallIntegerField(default=0, help_text="Tie-breaker, lower first")
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"],
+                name="unique_search_document",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "provider_key"]),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"
@@ -0,0 +1,40 @@
+from django.db import models
+
+from .schemes import SchemeType
+
+
+class SchemeSimilarity(models.Model):
+    """
+    One precomputed "similar scheme" of a PMS / AIF scheme.
+
+    Each scheme has up to k rows, ``rank`` 1 being the nearest neighbour of
+    its return profile and category. Rows are rebuilt offline by
+    homepage/services/similarity.py; ids point into the scheme tables (and
+    CatalogEntry.scheme_id) rather than at catalog rows, so a catalog
+    rebuild does not drop them.
+    """
+
+    scheme_type = models.CharField(max_length=10, choices=SchemeType.choices)
+    scheme_id = models.BigIntegerField()
+    similar_scheme_id = models.BigIntegerField()
+    rank = models.PositiveSmallIntegerField(help_text="1 = most similar")
+    distance = models.FloatField(help_text="Euclidean distance between feature vectors")
+    built_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Scheme Similarity"
+        verbose_name_plural = "Scheme Similarities"
+        ordering = ["scheme_type", "scheme_id", "rank"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scheme_type", "scheme_id", "rank"],
+                name="unique_scheme_similarity_rank",
+            ),
+            models.UniqueConstraint(
+                fields=["scheme_type", "scheme_id", "similar_scheme_id"],
+                name="unique_scheme_similarity_pair",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.scheme_type} #{self.scheme_id} ~ #{self.similar_scheme_id} ({self.rank})"
@@ -0,0 +1 @@
+# Homepage services package
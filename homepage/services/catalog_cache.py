@@ -0,0 +1,219 @@
+"""
+Versioned response cache for the public catalog pages.
+
+Cached pages are keyed on a catalog version counter. Any scheme or provider
+write bumps the counter (see homepage/signals.py), which orphans every cached
+page at once instead of deleting keys one by one; orphans simply age out.
+
+The counter is a CatalogVersion row, so bumps made by management commands
+reach every web worker; workers cache it for CATALOG_VERSION_TTL seconds.
+The same counter is the HTTP validator of the catalog views: ``catalog_condition``
+answers If-None-Match / If-Modified-Since with a 304 from a cache read,
+before the view queries or renders anything.
+
+Cached pages and validators also carry the release of the running code, so a
+deploy that only changes templates, scripts or views is not answered with
+pages or 304s from the previous one.
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache, wraps
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import has_vary_header, patch_cache_control
+from django.views.decorators.http import condition
+
+from homepage.models.catalog import CatalogVersion
+
+CATALOG_VERSION_KEY = "catalog:version"
+CATALOG_CACHE_TIMEOUT = getattr(settings, "CATALOG_CACHE_TIMEOUT", 60 * 60)
+CATALOG_VERSION_TTL = getattr(settings, "CATALOG_VERSION_TTL", 5)
+CATALOG_RELEASE = getattr(settings, "CATALOG_RELEASE", None)
+
+# Files whose changes alter rendered catalog pages
+RELEASE_SUFFIXES = {".py", ".html", ".js", ".css"}
+
+
+def get_catalog_version():
+    """Current catalog version"""
+    return _catalog_state()[0]
+
+
+@lru_cache(maxsize=None)
+def get_release_time():
+    """
+    When the running code last changed: the newest modification time of
+    the project's apps, templates and static files (read once per process).
+    """
+    base_dir = Path(settings.BASE_DIR)
+    roots = {base_dir / "config"} | {
+        Path(config.path) for config in apps.get_app_configs()
+        if Path(config.path).is_relative_to(base_dir)
+    }
+    newest = max(
+        (
+            path.stat().st_mtime
+            for root in roots
+            for path in root.rglob("*")
+            if path.suffix in RELEASE_SUFFIXES and path.is_file()
+        ),
+        default=0,
+    )
+    return datetime.fromtimestamp(int(newest), tz=dt_timezone.utc)
+
+
+def get_release():
+    """Release of the running code: settings.CATALOG_RELEASE, else its modification time"""
+    return CATALOG_RELEASE or str(int(get_release_time().timestamp()))
+
+
+def get_catalog_stamp():
+    """Release and catalog version, which every cached catalog output depends on"""
+    return f"{get_release()}-{get_catalog_version()}"
+
+
+def bump_catalog_version():
+    """Invalidate every cached catalog page"""
+    with transaction.atomic():
+        if not CatalogVersion.objects.filter(pk=1).update(version=F("version") + 1, changed_at=timezone.now()):
+            _load_catalog_state()
+        state = CatalogVersion.objects.values_list("version", "changed_at").get(pk=1)
+    cache.set(CATALOG_VERSION_KEY, state, CATALOG_VERSION_TTL)
+    return state[0]
+
+
+def _catalog_state():
+    """(version, changed_at), from the cache or the CatalogVersion row"""
+    state = cache.get(CATALOG_VERSION_KEY)
+    if state is None:
+        state = _load_catalog_state()
+        cache.set(CATALOG_VERSION_KEY, state, CATALOG_VERSION_TTL)
+    return state
+
+
+def _load_catalog_state():
+    # Seed from the clock so a fresh database never reuses a version that
+    # still has pages in a shared cache
+    row, _ = CatalogVersion.objects.get_or_create(
+        pk=1,
+        defaults={"version": int(time.time() * 1000), "changed_at": timezone.now()},
+    )
+    return row.version, row.changed_at
+
+
+def catalog_cache_key(name, *parts):
+    """Cache key for ``name`` under the current release and catalog version"""
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f"catalog:{get_catalog_stamp()}:{name}:{digest}"
+
+
+def cache_catalog_page(view_func):
+    """
+    Cache the full rendered response of a catalog view for anonymous GETs.
+
+    The key covers the view name and the full path (including the query
+    string), so filtered / paginated variants are cached independently.
+    Free-text ``q`` requests are not cached: type-ahead would store one page
+    per keystroke and evict the listing pages.
+    The whole response is stored, headers included, like Django's
+    UpdateCacheMiddleware does. Responses specific to one visitor are never
+    stored: those that set cookies, vary on them or used the CSRF token
+    (cached templates empty the base template's ``csrf_token_holder`` block).
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if (
+            request.method not in ("GET", "HEAD")
+            or request.user.is_authenticated
+            or request.GET.get("q")
+        ):
+            return view_func(request, *args, **kwargs)
+
+        key = catalog_cache_key(view_func.__name__, request.get_full_path())
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = view_func(request, *args, **kwargs)
+
+        if response.status_code == 200 and not response.streaming:
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+            if _is_shareable(request, response):
+                cache.set(key, response, CATALOG_CACHE_TIMEOUT)
+
+        return response
+
+    return wrapper
+
+
+def _is_shareable(request, response):
+    """Whether a response can be served to every anonymous visitor"""
+    # get_token() sets CSRF_COOKIE_NEEDS_UPDATE: the page embeds this
+    # visitor's CSRF token, and CsrfViewMiddleware will set their cookie
+    if request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+        return False
+    return not response.cookies and not has_vary_header(response, "Cookie")
+
+
+def get_catalog_last_modified():
+    """
+    When the catalog or the code rendering it last changed.
+
+    Bulk writes (imports, deactivation, fee / net-return backfills) do not
+    all touch ``updated_at``, but every write path bumps the version, which
+    records when it did.
+    """
+    return max(_catalog_state()[1].replace(microsecond=0), get_release_time())
+
+
+def catalog_etag(request, *args, **kwargs):
+    """ETag of a catalog view: release and catalog version (anonymous visitors only)"""
+    if request.user.is_authenticated:
+        return None
+    return f'"catalog-{get_catalog_stamp()}"'
+
+
+def catalog_last_modified(request, *args, **kwargs):
+    """Last-Modified of a catalog view (anonymous visitors only)"""
+    if request.user.is_authenticated:
+        return None
+    return get_catalog_last_modified()
+
+
+def conditional_page(etag_func=None, last_modified_func=None):
+    """
+    ``condition()`` that also marks responses ``Cache-Control: no-cache``.
+
+    Without it, a Last-Modified header lets browsers reuse a page without
+    asking (heuristic freshness); with it they revalidate every visit and
+    get a bodiless 304 while the validators still match.
+    """
+
+    def decorator(view_func):
+        conditional_view = condition(etag_func=etag_func, last_modified_func=last_modified_func)(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.has_header("ETag") or response.has_header("Last-Modified"):
+                patch_cache_control(response, no_cache=True)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# Outermost decorator of every catalog view, so matching requests skip the
+# page cache lookup as well as the view
+catalog_condition = conditional_page(etag_func=catalog_etag, last_modified_func=catalog_last_modified)
@@ -0,0 +1,133 @@
+"""
+Maintenance of the CatalogEntry read model.
+
+Every PMS / AIF scheme is flattened with its provider fields into one
+CatalogEntry row, so listings across both scheme types are a single
+index-ordered query instead of two queries merged in Python. Entries are
+refreshed for the touched schemes on save by homepage/signals.py and per
+batch by the importer; ``manage.py refresh_catalog`` rebuilds everything.
+"""
+
+import logging
+
+from django.db import transaction
+
+from homepage.models.catalog import CatalogEntry
+from homepage.models.schemes import PARSED_VALUE_FIELDS, SCHEME_MODELS, SchemeType
+from homepage.services.catalog_query import NET_RETURN_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Constants
+REFRESH_BATCH_SIZE = 1000
+
+# CatalogEntry field -> scheme ORM path, copied verbatim
+COMMON_SOURCE_FIELDS = {
+    "name": "ia_name",
+    "strategy_name": "strategy_name",
+    "category": "category",
+    "aum": "aum",
+    "min_inv_amount": "min_inv_amount",
+    "date_of_inception": "date_of_inception",
+    "one_month_return": "one_month_return",
+    "three_month_return": "three_month_return",
+    "six_month_return": "six_month_return",
+    "one_year_return": "one_year_return",
+    "three_year_return": "three_year_return",
+    "five_year_return": "five_year_return",
+    "si_return": "si_return",
+    **{field: field for field in NET_RETURN_FIELDS},
+    **{column: column for column in PARSED_VALUE_FIELDS},
+    "provider_shortname": "provider_id",
+    "provider_name": "provider__name",
+    "provider_is_whitelisted": "provider__is_whitelisted",
+    "effective_priority": "effective_priority",
+    "is_shortlisted": "is_shortlisted",
+    "scheme_updated_at": "updated_at",
+}
+
+SOURCE_FIELDS = {
+    SchemeType.PMS: COMMON_SOURCE_FIELDS,
+    SchemeType.AIF: {**COMMON_SOURCE_FIELDS, "aif_category": "aif_category"},
+}
+
+# Every CatalogEntry column rewritten on refresh
+ENTRY_FIELDS = list(SOURCE_FIELDS[SchemeType.AIF]) + ["is_listed", "refreshed_at"]
+
+
+def refresh_catalog_entries(scheme_type, queryset=None):
+    """
+    Upsert the catalog entries of PMS / AIF schemes (all by default).
+
+    Args:
+        scheme_type (str): SchemeType.PMS or SchemeType.AIF
+        queryset (QuerySet, optional): Schemes to refresh
+
+    Returns:
+        int: Number of entries written
+    """
+    model = SCHEME_MODELS[scheme_type]
+    queryset = model.objects.all() if queryset is None else queryset
+    source = SOURCE_FIELDS[scheme_type]
+    rows = queryset.values_list(
+        "id",
+        "is_active",
+        "open_for_investment",
+        "provider__is_active",
+        *source.values(),
+    )
+
+    written = 0
+    batch = []
+    for pk, is_active, open_for_investment, provider_active, *values in rows.iterator(
+        chunk_size=REFRESH_BATCH_SIZE
+    ):
+        batch.append(
+            CatalogEntry(
+                scheme_type=scheme_type,
+                scheme_id=pk,
+                is_listed=is_active and open_for_investment and provider_active,
+                **dict(zip(source, values)),
+            )
+        )
+        if len(batch) >= REFRESH_BATCH_SIZE:
+            written += _write_entries(batch)
+            batch = []
+    if batch:
+        written += _write_entries(batch)
+    return written
+
+
+def refresh_provider_entries(scheme_type, provider):
+    """Refresh the provider name / visibility / ranking of a provider's schemes"""
+    model = SCHEME_MODELS[scheme_type]
+    return refresh_catalog_entries(scheme_type, model.objects.filter(provider_id=provider.shortname))
+
+
+def remove_catalog_entries(scheme_type, scheme_ids):
+    CatalogEntry.objects.filter(scheme_type=scheme_type, scheme_id__in=scheme_ids).delete()
+
+
+def rebuild_catalog_entries():
+    """
+    Drop and rebuild every catalog entry.
+
+    Returns:
+        int: Number of entries written
+    """
+    with transaction.atomic():
+        CatalogEntry.objects.all().delete()
+        written = sum(refresh_catalog_entries(scheme_type) for scheme_type in SCHEME_MODELS)
+
+    logger.info(f"Catalog read model rebuilt with {written} entries")
+    return written
+
+
+def _write_entries(batch):
+    CatalogEntry.objects.bulk_create(
+        batch,
+        update_conflicts=True,
+        unique_fields=["scheme_type", "scheme_id"],
+        update_fields=ENTRY_FIELDS,
+    )
+    return len(batch)
@@ -0,0 +1,448 @@
+"""
+Query helpers shared by the catalog JSON API and listing pages.
+
+Request parameters are validated against explicit whitelists and turned into
+ORM filters. The JSON API cuts pages with keyset (cursor) pagination on the
+sort key plus ``id`` (the ranking ``effective_priority`` by default) so every
+page costs the same index range scan no matter how deep the client has paged;
+the combined PMS + AIF listing pages the CatalogEntry read model the same
+way. The compare pages sort on the same whitelisted, index-backed columns
+and use numbered pages.
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.paginator import Paginator
+from django.db.models import F, Q
+
+from homepage.models.catalog import CatalogEntry
+from homepage.models.schemes import SCHEME_MODELS, SchemeType
+
+# Constants
+DEFAULT_PAGE_SIZE = 25
+COMPARE_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+RETURN_FIELDS = (
+    "one_month_return",
+    "three_month_return",
+    "six_month_return",
+    "one_year_return",
+    "three_year_return",
+    "five_year_return",
+    "si_return",
+)
+
+# Net-of-fee copies, see services/net_returns.py
+NET_RETURN_FIELDS = tuple(f"net_{field}" for field in RETURN_FIELDS)
+
+# Parsed numeric amount / fee columns, public name -> column
+FEE_FIELDS = {
+    "min_inv_value": "min_inv_amount_value",
+    "setup_fee_pct": "setup_fee_pct",
+    "fixed_fee_pct": "fixed_fee_pct",
+    "variable_fee_pct": "variable_fee_pct",
+    "hurdle_pct": "hurdle_pct",
+    "carry_pct": "carry_pct",
+    "total_fee_pct": "total_fee_pct",
+}
+
+# Public field name -> ORM path, per scheme type
+COMMON_API_FIELDS = {
+    "id": "id",
+    "name": "ia_name",
+    "strategy": "strategy_name",
+    "provider": "provider__name",
+    "provider_shortname": "provider_id",
+    "category": "category",
+    "aum": "aum",
+    "min_inv": "min_inv_amount",
+    "benchmark": "benchmark_name",
+    "date_of_inception": "date_of_inception",
+    "open_for_investment": "open_for_investment",
+    "effective_priority": "effective_priority",
+    **{field: field for field in RETURN_FIELDS + NET_RETURN_FIELDS},
+    **FEE_FIELDS,
+}
+
+API_FIELDS = {
+    SchemeType.PMS: COMMON_API_FIELDS,
+    SchemeType.AIF: {
+        **COMMON_API_FIELDS,
+        "aif_category": "aif_category",
+        "capital_called_percent": "capital_called_percent",
+    },
+}
+
+# Public field name -> CatalogEntry column for the combined PMS + AIF listing
+CATALOG_API_FIELDS = {
+    "scheme_type": "scheme_type",
+    "id": "scheme_id",
+    "name": "name",
+    "strategy": "strategy_name",
+    "provider": "provider_name",
+    "provider_shortname": "provider_shortname",
+    "category": "category",
+    "aif_category": "aif_category",
+    "aum": "aum",
+    "min_inv": "min_inv_amount",
+    "date_of_inception": "date_of_inception",
+    "effective_priority": "effective_priority",
+    **{field: field for field in RETURN_FIELDS + NET_RETURN_FIELDS},
+    **FEE_FIELDS,
+}
+
+# ?type= value -> SchemeType for the combined listing
+CATALOG_TYPES = {
+    "pms": SchemeType.PMS,
+    "aif": SchemeType.AIF,
+}
+
+DEFAULT_API_FIELDS = (
+    "id",
+    "name",
+    "provider",
+    "category",
+    "one_year_return",
+    "three_year_return",
+    "min_inv",
+)
+
+# Numeric filters accepted as min_<name> / max_<name>, public name -> column.
+# Column names are shared by the scheme tables and CatalogEntry.
+RANGE_FILTER_FIELDS = {
+    **{field: field for field in RETURN_FIELDS + NET_RETURN_FIELDS},
+    "aum": "aum",
+    **FEE_FIELDS,
+}
+
+# Public sort key -> column. Prefix the key with "-" for descending order.
+# The 1Y / 3Y / SI return (gross and net), AUM and fee keys are backed by
+# (is_active, <column>) indexes.
+SORT_FIELDS = {
+    "priority": "effective_priority",
+    "name": "ia_name",
+    "aum": "aum",
+    **{field: field for field in RETURN_FIELDS + NET_RETURN_FIELDS},
+    **FEE_FIELDS,
+}
+DEFAULT_SORT = "priority"
+
+# Sort keys of the combined listing: the same columns on CatalogEntry
+CATALOG_SORT_FIELDS = {**SORT_FIELDS, "name": "name"}
+
+
+class CatalogQueryError(ValueError):
+    """Raised for invalid catalog query parameters (maps to HTTP 400)"""
+
+
+def scheme_queryset(scheme_type, whitelisted_only=False):
+    """Base queryset of publicly listed schemes for ``scheme_type``"""
+    queryset = SCHEME_MODELS[scheme_type].objects.listed().filter(provider__is_active=True)
+    if whitelisted_only:
+        queryset = queryset.filter(provider__is_whitelisted=True)
+    return queryset
+
+
+def compare_queryset(scheme_type):
+    """
+    Schemes listed on the compare pages for ``scheme_type``: every active PMS
+    scheme, and active AIF schemes of active, whitelisted providers.
+    """
+    queryset = SCHEME_MODELS[scheme_type].objects.active()
+    if scheme_type == SchemeType.AIF:
+        queryset = queryset.filter(provider__is_active=True, provider__is_whitelisted=True)
+    return queryset
+
+
+def apply_scheme_filters(queryset, scheme_type, params):
+    """
+    Apply whitelisted filters from a QueryDict.
+
+    Supported: q (scheme or provider name contains), category, aif_category
+    (AIF only), provider (shortname), whitelisted=1, and min_<name> /
+    max_<name> for RANGE_FILTER_FIELDS. Multi-valued filters accept repeated
+    parameters.
+    """
+    query = params.get("q", "").strip()
+    if query:
+        queryset = queryset.filter(name_filter(query, "ia_name", "provider__name"))
+
+    categories = params.getlist("category")
+    if categories:
+        queryset = queryset.filter(category_filter(categories))
+
+    aif_categories = params.getlist("aif_category")
+    if aif_categories:
+        if scheme_type != SchemeType.AIF:
+            raise CatalogQueryError("aif_category only applies to AIF schemes")
+        queryset = queryset.filter(aif_category__in=aif_categories)
+
+    providers = params.getlist("provider")
+    if providers:
+        queryset = queryset.filter(provider_id__in=providers)
+
+    if params.get("whitelisted") in ("1", "true"):
+        queryset = queryset.filter(provider__is_whitelisted=True)
+
+    return queryset.filter(**parse_range_filters(params))
+
+
+def apply_catalog_filters(queryset, params):
+    """
+    Apply whitelisted filters to a CatalogEntry queryset.
+
+    Supports the scheme filters plus ``type`` (pms / aif, repeatable).
+    """
+    types = params.getlist("type")
+    if types:
+        unknown = [name for name in types if name not in CATALOG_TYPES]
+        if unknown:
+            raise CatalogQueryError(f"Unknown type: {', '.join(unknown)}")
+        queryset = queryset.filter(scheme_type__in=[CATALOG_TYPES[name] for name in types])
+
+    query = params.get("q", "").strip()
+    if query:
+        queryset = queryset.filter(name_filter(query, "name", "provider_name"))
+
+    categories = params.getlist("category")
+    if categories:
+        queryset = queryset.filter(category_filter(categories))
+
+    aif_categories = params.getlist("aif_category")
+    if aif_categories:
+        queryset = queryset.filter(aif_category__in=aif_categories)
+
+    providers = params.getlist("provider")
+    if providers:
+        queryset = queryset.filter(provider_shortname__in=providers)
+
+    if params.get("whitelisted") in ("1", "true"):
+        queryset = queryset.filter(provider_is_whitelisted=True)
+
+    return queryset.filter(**parse_range_filters(params))
+
+
+def category_filter(categories):
+    """Any of ``categories``, ignoring case: sheets spell them inconsistently"""
+    condition = Q()
+    for category in categories:
+        condition |= Q(category__iexact=category)
+    return condition
+
+
+def name_filter(query, *columns):
+    """Any of ``columns`` contains ``query``, ignoring case"""
+    condition = Q()
+    for column in columns:
+        condition |= Q(**{f"{column}__icontains": query})
+    return condition
+
+
+def parse_range_filters(params):
+    """``min_<field>`` / ``max_<field>`` parameters as ORM lookups"""
+    range_filters = {}
+    for name, column in RANGE_FILTER_FIELDS.items():
+        for bound, lookup in (("min", "gte"), ("max", "lte")):
+            raw = params.get(f"{bound}_{name}")
+            if raw in (None, ""):
+                continue
+            try:
+                range_filters[f"{column}__{lookup}"] = float(raw)
+            except ValueError:
+                raise CatalogQueryError(f"{bound}_{name} must be a number")
+    return range_filters
+
+
+def parse_fields(available, raw):
+    """Validate a comma separated ``fields`` parameter against ``available``"""
+    if not raw:
+        return list(DEFAULT_API_FIELDS)
+
+    fields = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise CatalogQueryError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def apply_scheme_sort(queryset, raw):
+    """
+    Order by a whitelisted sort key, e.g. ``-three_year_return``.
+    Schemes without a value always sort last; ``id`` breaks ties.
+
+    Returns:
+        tuple: (ordered queryset, normalised sort key)
+    """
+    sort = raw or DEFAULT_SORT
+    name = sort.lstrip("-")
+    if name not in SORT_FIELDS:
+        raise CatalogQueryError(f"Cannot sort by {name}")
+
+    column = F(SORT_FIELDS[name])
+    if sort.startswith("-"):
+        return queryset.order_by(column.desc(nulls_last=True), "-id"), sort
+    return queryset.order_by(column.asc(nulls_last=True), "id"), sort
+
+
+def toggle_sort_keys(current, names):
+    """
+    Sort key each column header should link to. Numeric columns start
+    descending, name starts ascending; clicking the active column flips it.
+    """
+    links = {}
+    for name in names:
+        first = name if name == "name" else f"-{name}"
+        flipped = first[1:] if first.startswith("-") else f"-{first}"
+        links[name] = flipped if current == first else first
+    return links
+
+
+def compare_page(queryset, scheme_type, params):
+    """
+    Filter, sort and paginate a compare-page queryset from a QueryDict.
+
+    Accepts the API filters plus ``sort``, ``page`` and ``per_page``.
+
+    Returns:
+        tuple: (Page, normalised sort key)
+    """
+    queryset = apply_scheme_filters(queryset, scheme_type, params)
+    queryset, sort = apply_scheme_sort(queryset, params.get("sort"))
+    per_page = parse_page_size(params.get("per_page"), default=COMPARE_PAGE_SIZE)
+    return Paginator(queryset, per_page).get_page(params.get("page")), sort
+
+
+def parse_page_size(raw, default=DEFAULT_PAGE_SIZE):
+    if not raw:
+        return default
+    try:
+        size = int(raw)
+    except ValueError:
+        raise CatalogQueryError("Page size must be an integer")
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def encode_cursor(sort, value, pk):
+    raw = json.dumps([sort, value, pk], default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, sort):
+    """Return the ``(sort value, id)`` a cursor points after"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        pk = int(pk)
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise CatalogQueryError("Invalid cursor")
+    # A cursor only makes sense in the order it was cut from
+    if cursor_sort != sort:
+        raise CatalogQueryError("Invalid cursor")
+    return value, pk
+
+
+def keyset_after(queryset, column, descending, value, pk):
+    """Rows after ``(value, pk)`` in ``column`` order, NULLs last"""
+    beyond = "lt" if descending else "gt"
+    if value is None:
+        return queryset.filter(**{f"{column}__isnull": True, f"id__{beyond}": pk})
+
+    after = Q(**{f"{column}__{beyond}": value}) | Q(**{column: value, f"id__{beyond}": pk})
+    if queryset.model._meta.get_field(column).null:
+        after |= Q(**{f"{column}__isnull": True})
+    return queryset.filter(after)
+
+
+def fetch_scheme_page(scheme_type, params, whitelisted_only=False):
+    """
+    Fetch one keyset page of schemes as plain dicts.
+
+    Args:
+        scheme_type (str): SchemeType value
+        params (QueryDict): Filters plus ``fields``, ``sort``, ``limit`` and
+            ``cursor``
+        whitelisted_only (bool, optional): Restrict to whitelisted providers
+
+    Returns:
+        tuple: (list of scheme dicts, next cursor or None)
+    """
+    queryset = apply_scheme_filters(
+        scheme_queryset(scheme_type, whitelisted_only=whitelisted_only),
+        scheme_type,
+        params,
+    )
+    return keyset_page(queryset, API_FIELDS[scheme_type], SORT_FIELDS, params)
+
+
+def fetch_catalog_page(params):
+    """
+    Fetch one keyset page of the combined PMS + AIF catalog as plain dicts.
+
+    Both scheme types are read from the CatalogEntry read model, so the page
+    is one range scan of an (is_listed, <sort column>) index.
+
+    Args:
+        params (QueryDict): Filters plus ``fields``, ``sort``, ``limit`` and
+            ``cursor``
+
+    Returns:
+        tuple: (list of entry dicts, next cursor or None)
+    """
+    queryset = apply_catalog_filters(CatalogEntry.objects.listed(), params)
+    return keyset_page(
+        queryset, CATALOG_API_FIELDS, CATALOG_SORT_FIELDS, params, default_fields=("scheme_type",)
+    )
+
+
+def keyset_page(queryset, available, sort_fields, params, default_fields=()):
+    """
+    Cut one keyset page from a filtered queryset, ordered by ``sort``
+    (a key of ``sort_fields``, "-" prefixed for descending) and then ``id``.
+    Rows without a value sort last.
+
+    Args:
+        queryset (QuerySet): Filtered schemes or catalog entries
+        available (dict): Public field name -> ORM path
+        sort_fields (dict): Public sort key -> column
+        params (QueryDict): ``fields``, ``sort``, ``limit`` and ``cursor``
+        default_fields (tuple, optional): Prepended to DEFAULT_API_FIELDS
+
+    Returns:
+        tuple: (list of dicts, next cursor or None)
+    """
+    raw_fields = params.get("fields")
+    fields = parse_fields(available, raw_fields)
+    if not raw_fields:
+        fields = list(default_fields) + fields
+    page_size = parse_page_size(params.get("limit"))
+
+    sort = params.get("sort") or DEFAULT_SORT
+    name = sort.lstrip("-")
+    if name not in sort_fields:
+        raise CatalogQueryError(f"Cannot sort by {name}")
+    column = sort_fields[name]
+    descending = sort.startswith("-")
+
+    cursor = params.get("cursor")
+    if cursor:
+        value, pk = decode_cursor(cursor, sort)
+        queryset = keyset_after(queryset, column, descending, value, pk)
+
+    paths = {available[name] for name in fields} | {"id", column}
+    if descending:
+        ordering = (F(column).desc(nulls_last=True), "-id")
+    else:
+        ordering = (F(column).asc(nulls_last=True), "id")
+
+    # Fetch one extra row to know whether another page exists
+    rows = list(queryset.order_by(*ordering).values(*paths)[:page_size + 1])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(sort, rows[-1][column], rows[-1]["id"])
+
+    return [{name: row[available[name]] for name in fields} for row in rows], next_cursor
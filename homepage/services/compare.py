@@ -0,0 +1,188 @@
+"""
+Side-by-side comparison of a hand-picked set of PMS / AIF schemes.
+
+A selection like ``pms:12,aif:7,pms:3`` is normalised to a sorted, de-duplicated
+key. Building the comparison costs one query per scheme type present (schemes
+and providers via select_related) plus one range query over the return
+snapshots, so it scales with the selection rather than the catalog. The
+finished matrix is cached per normalised key under the catalog version.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from funddetails.models import SchemeReturnSnapshot
+from homepage.models.schemes import SCHEME_MODELS, SchemeType
+from homepage.services.catalog_cache import CATALOG_CACHE_TIMEOUT, catalog_cache_key
+from homepage.services.catalog_query import CatalogQueryError
+
+# Constants
+MAX_COMPARE_SCHEMES = 10
+HISTORY_YEARS = 5
+HISTORY_FIELDS = ("one_year_return", "three_year_return")
+
+# (field, label) rows of the comparison matrix; "provider" is the provider name
+COMPARE_ROWS = (
+    ("provider", "Provider"),
+    ("category", "Category"),
+    ("aif_category", "AIF Category"),
+    ("aum", "AUM (Cr)"),
+    ("min_inv_amount", "Min. Investment"),
+    ("one_month_return", "1M Return %"),
+    ("three_month_return", "3M Return %"),
+    ("six_month_return", "6M Return %"),
+    ("one_year_return", "1Y Return %"),
+    ("one_year_benchmark_return", "1Y Benchmark %"),
+    ("three_year_return", "3Y Return %"),
+    ("three_year_benchmark_return", "3Y Benchmark %"),
+    ("five_year_return", "5Y Return %"),
+    ("si_return", "Since Inception %"),
+    ("benchmark_name", "Benchmark"),
+    ("date_of_inception", "Inception Date"),
+    ("fund_managers", "Fund Managers"),
+    ("setup_fees", "Setup Fees"),
+    ("fixed_fees", "Fixed Fees"),
+    ("variable_fees", "Variable Fees"),
+    ("hurdle", "Hurdle"),
+    ("exit_load", "Exit Load"),
+)
+
+# URL prefix <-> SchemeType
+SELECTION_PREFIXES = {
+    "pms": SchemeType.PMS,
+    "aif": SchemeType.AIF,
+}
+
+
+def parse_selection(raw):
+    """
+    Parse ``pms:12,aif:7`` into a sorted, de-duplicated list of
+    ``(scheme_type, id)`` pairs.
+    """
+    selection = set()
+    for item in (raw or "").split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        prefix, _, pk = item.partition(":")
+        if prefix not in SELECTION_PREFIXES or not pk.isdigit():
+            raise CatalogQueryError(f"Invalid scheme id '{item}', expected e.g. pms:12 or aif:7")
+        selection.add((SELECTION_PREFIXES[prefix], int(pk)))
+
+    if not selection:
+        raise CatalogQueryError("Select at least one scheme, e.g. ?ids=pms:12,aif:7")
+    if len(selection) > MAX_COMPARE_SCHEMES:
+        raise CatalogQueryError(f"Compare at most {MAX_COMPARE_SCHEMES} schemes at a time")
+    return sorted(selection)
+
+
+def selection_key(selection):
+    return ",".join(f"{scheme_type.lower()}:{pk}" for scheme_type, pk in selection)
+
+
+def get_comparison(selection):
+    """Cached ``build_comparison`` for a parsed selection"""
+    key = catalog_cache_key("compare", selection_key(selection))
+    comparison = cache.get(key)
+    if comparison is None:
+        comparison = build_comparison(selection)
+        cache.set(key, comparison, CATALOG_CACHE_TIMEOUT)
+    return comparison
+
+
+def build_comparison(selection):
+    """
+    Build the comparison matrix for a parsed selection.
+
+    Returns:
+        dict: {
+            "schemes": [{"key", "scheme_type", "id", "name"}, ...],
+            "rows": [{"field", "label", "values": [...]}, ...],
+            "history": {scheme key: {"dates": [...], <field>: [...]}},
+            "missing": [keys of inactive / unknown schemes],
+        }
+    """
+    ids_by_type = {}
+    for scheme_type, pk in selection:
+        ids_by_type.setdefault(scheme_type, []).append(pk)
+
+    # One query per scheme type, providers joined in
+    found = {}
+    for scheme_type, ids in ids_by_type.items():
+        schemes = (
+            SCHEME_MODELS[scheme_type].objects
+            .active()
+            .filter(id__in=ids)
+            .select_related("provider")
+        )
+        for scheme in schemes:
+            found[(scheme_type, scheme.id)] = scheme
+
+    columns = [(scheme_type, pk) for scheme_type, pk in selection if (scheme_type, pk) in found]
+    schemes = [found[column] for column in columns]
+
+    return {
+        "schemes": [
+            {
+                "key": selection_key([column]),
+                "scheme_type": column[0],
+                "id": column[1],
+                "name": scheme.ia_name or scheme.strategy_name,
+            }
+            for column, scheme in zip(columns, schemes)
+        ],
+        "rows": [
+            {
+                "field": field,
+                "label": label,
+                "values": [_row_value(scheme, field) for scheme in schemes],
+            }
+            for field, label in COMPARE_ROWS
+            # Skip type-specific rows (e.g. aif_category) no selected scheme has
+            if any(field == "provider" or hasattr(scheme, field) for scheme in schemes)
+        ],
+        "history": _return_history(columns),
+        "missing": [selection_key([column]) for column in selection if column not in found],
+    }
+
+
+def _row_value(scheme, field):
+    if field == "provider":
+        return scheme.provider.name
+    return getattr(scheme, field, None)
+
+
+def _return_history(columns):
+    """Snapshot history of every selected scheme from one range query"""
+    if not columns:
+        return {}
+
+    ids_by_type = {}
+    for scheme_type, pk in columns:
+        ids_by_type.setdefault(scheme_type, []).append(pk)
+
+    selected = Q()
+    for scheme_type, ids in ids_by_type.items():
+        selected |= Q(scheme_type=scheme_type, scheme_id__in=ids)
+
+    since = timezone.localdate() - timedelta(days=365 * HISTORY_YEARS)
+    rows = (
+        SchemeReturnSnapshot.objects
+        .filter(selected, as_of__gte=since)
+        .order_by("scheme_type", "scheme_id", "as_of")
+        .values_list("scheme_type", "scheme_id", "as_of", *HISTORY_FIELDS)
+    )
+
+    history = {}
+    for scheme_type, scheme_id, as_of, *values in rows:
+        series = history.setdefault(
+            selection_key([(scheme_type, scheme_id)]),
+            {"dates": [], **{field: [] for field in HISTORY_FIELDS}},
+        )
+        series["dates"].append(as_of)
+        for field, value in zip(HISTORY_FIELDS, values):
+            series[field].append(value)
+    return history
@@ -0,0 +1,93 @@
+"""
+Facet counts for the compare page filters.
+
+All facets of a scheme type (category, AIF category, provider and open for
+investment) come from a single GROUP BY over the compare-page schemes,
+grouped on every facet column at once and folded into per-facet counts in
+Python. The result is a small JSON-ready dict cached under the catalog
+version, so it is recomputed once per catalog change and every request in
+between is a single cache read.
+"""
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from homepage.models.schemes import SCHEME_MODELS, SchemeType
+from homepage.services.catalog_cache import CATALOG_CACHE_TIMEOUT, catalog_cache_key
+from homepage.services.catalog_query import compare_queryset
+
+# Facet name -> scheme column, per scheme type
+COMMON_FACET_FIELDS = {
+    "category": "category",
+    "provider": "provider_id",
+    "open_for_investment": "open_for_investment",
+}
+
+FACET_FIELDS = {
+    SchemeType.PMS: COMMON_FACET_FIELDS,
+    SchemeType.AIF: {**COMMON_FACET_FIELDS, "aif_category": "aif_category"},
+}
+
+
+def get_facets(scheme_type):
+    """Cached ``compute_facets`` for the current catalog version"""
+    key = catalog_cache_key("facets", scheme_type)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(scheme_type)
+        cache.set(key, facets, CATALOG_CACHE_TIMEOUT)
+    return facets
+
+
+def compute_facets(scheme_type):
+    """
+    Count the compare-page schemes of ``scheme_type`` per facet value.
+
+    Returns:
+        dict: {
+            "total": int,
+            <facet>: [{"value", "label", "count"}, ...] most common first,
+        }
+    """
+    facet_fields = FACET_FIELDS[scheme_type]
+    rows = (
+        compare_queryset(scheme_type)
+        .values(*facet_fields.values(), "provider__name")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    counts = {facet: {} for facet in facet_fields}
+    labels = {facet: {} for facet in facet_fields}
+    total = 0
+    for row in rows:
+        total += row["count"]
+        for facet, column in facet_fields.items():
+            value = row[column]
+            counts[facet][value] = counts[facet].get(value, 0) + row["count"]
+            labels[facet].setdefault(value, _facet_label(scheme_type, facet, value, row))
+
+    return {
+        "total": total,
+        **{
+            facet: [
+                {"value": value, "label": labels[facet][value], "count": count}
+                for value, count in sorted(
+                    values.items(),
+                    key=lambda item: (-item[1], str(labels[facet][item[0]])),
+                )
+            ]
+            for facet, values in counts.items()
+        },
+    }
+
+
+def _facet_label(scheme_type, facet, value, row):
+    if facet == "provider":
+        return row["provider__name"]
+    if facet == "aif_category":
+        choices = dict(SCHEME_MODELS[scheme_type]._meta.get_field("aif_category").flatchoices)
+        return choices.get(value, value)
+    if facet == "open_for_investment":
+        return "Open" if value else "Closed"
+    return value
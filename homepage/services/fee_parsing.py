@@ -0,0 +1,138 @@
+"""
+Parsers for the free-text amount and fee columns of PMS / AIF schemes.
+
+The sheets describe minimum investments as "50 L", "₹1 Cr" or "50,00,000"
+and fees as "2% p.a.", "1.5 - 2%" or "Nil". These helpers turn them into a
+Decimal rupee amount or percentage so the numeric copies on BaseScheme can be
+indexed, filtered and sorted in the database. Text that cannot be read with
+confidence parses to None rather than a guess.
+"""
+
+import re
+from decimal import Decimal
+
+# Constants
+AMOUNT_QUANTUM = Decimal("0.01")
+PERCENT_QUANTUM = Decimal("0.0001")
+# Fee / hurdle percentages above this are amounts or typos, not percentages
+MAX_PERCENT = Decimal(100)
+
+# Indian denomination suffixes -> rupee multiplier
+AMOUNT_UNITS = {
+    "k": Decimal("1000"),
+    "thousand": Decimal("1000"),
+    "l": Decimal("100000"),
+    "lac": Decimal("100000"),
+    "lacs": Decimal("100000"),
+    "lakh": Decimal("100000"),
+    "lakhs": Decimal("100000"),
+    "cr": Decimal("10000000"),
+    "crore": Decimal("10000000"),
+    "crores": Decimal("10000000"),
+    "mn": Decimal("1000000"),
+    "million": Decimal("1000000"),
+}
+
+# Fee text meaning "no fee"
+NIL_FEE_WORDS = {"nil", "none", "zero", "no", "0"}
+
+# Scheme text column -> (numeric column, parser name)
+PARSED_FIELDS = {
+    "min_inv_amount": ("min_inv_amount_value", "amount"),
+    "setup_fees": ("setup_fee_pct", "percent"),
+    "fixed_fees": ("fixed_fee_pct", "percent"),
+    "variable_fees": ("variable_fee_pct", "percent"),
+    "hurdle": ("hurdle_pct", "percent"),
+    "carry": ("carry_pct", "percent"),
+}
+
+NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+AMOUNT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([a-z]+)?")
+PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:%\s*)?(?:-|to)\s*(\d+(?:\.\d+)?)\s*%|(\d+(?:\.\d+)?)\s*%")
+
+
+def parse_amount(text):
+    """
+    Rupee amount of a minimum-investment string.
+
+    "50 L" -> 5000000, "₹1.5 Cr" -> 15000000, "50,00,000" -> 5000000.
+
+    Returns:
+        Decimal | None
+    """
+    if text is None:
+        return None
+    cleaned = str(text).lower().replace(",", "").replace("₹", " ")
+    cleaned = re.sub(r"\b(?:rs|inr)\b\.?", " ", cleaned)
+
+    match = AMOUNT_RE.search(cleaned)
+    if not match:
+        return None
+
+    number, unit = match.groups()
+    multiplier = Decimal(1)
+    if unit:
+        if unit not in AMOUNT_UNITS:
+            return None
+        multiplier = AMOUNT_UNITS[unit]
+
+    return (Decimal(number) * multiplier).quantize(AMOUNT_QUANTUM)
+
+
+def parse_percent(text):
+    """
+    Percentage of a fee / hurdle string.
+
+    "2% p.a." -> 2, "1.5 - 2%" -> 2 (upper bound of a range), "Nil" -> 0.
+    Only the first percentage is read, so "20% above 10% hurdle" -> 20.
+    Values above MAX_PERCENT parse to None, so a bare "25000" (a rupee
+    setup fee) is not read as 25000%.
+
+    Returns:
+        Decimal | None
+    """
+    if text is None:
+        return None
+    cleaned = str(text).strip().lower()
+    if not cleaned:
+        return None
+    if cleaned.rstrip(".") in NIL_FEE_WORDS:
+        return Decimal(0).quantize(PERCENT_QUANTUM)
+
+    match = PERCENT_RE.search(cleaned)
+    if match:
+        # Range "a - b%": keep the upper bound
+        value = match.group(2) or match.group(3)
+    elif NUMBER_RE.fullmatch(cleaned):
+        # A bare number is read as a percentage ("2", "1.25")
+        value = cleaned
+    else:
+        return None
+
+    percent = Decimal(value)
+    if percent > MAX_PERCENT:
+        return None
+    return percent.quantize(PERCENT_QUANTUM)
+
+
+PARSERS = {
+    "amount": parse_amount,
+    "percent": parse_percent,
+}
+
+
+def parse_scheme_values(values):
+    """
+    Numeric columns for the text columns present in ``values``.
+
+    Args:
+        values (dict): Scheme text column -> raw value
+
+    Returns:
+        dict: Numeric column -> Decimal or None
+    """
+    return {
+        column: PARSERS[parser](values[source])
+        for source, (column, parser) in PARSED_FIELDS.items()
+        if source in values
+    }
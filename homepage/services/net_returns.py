@@ -0,0 +1,166 @@
+"""
+Net-of-fee returns for PMS / AIF schemes.
+
+The reported returns on BaseScheme are gross. ``net_of_fee_returns`` applies
+a scheme's fee rules to one return horizon for many schemes at once, as
+NumPy array arithmetic:
+
+    1. the fixed (management) fee is charged on the assets at the end of
+       each year, pro-rated for horizons under a year;
+    2. the performance fee (variable fee for PMS, carry for AIF) is taken on
+       the profit above the hurdle, or on the whole profit up to the
+       performance share once the hurdle is cleared when ``catch_up`` is set;
+    3. the one-time setup fee is charged on the amount invested.
+
+Annualised horizons (1Y and longer) assume the gross CAGR was earned evenly
+every year, so fees compound yearly; the result is annualised back.
+``compute_net_returns`` runs this for every scheme of a type and stores the
+net_* columns, so compare pages sort on net return with plain SQL.
+"""
+
+import logging
+
+import numpy as np
+from django.utils import timezone
+
+from homepage.models.schemes import SCHEME_MODELS
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DAYS_PER_YEAR = 365.25
+DEFAULT_BATCH_SIZE = 1000
+
+# Gross column -> (net column, horizon in years or None for since inception)
+NET_RETURN_HORIZONS = {
+    "one_month_return": ("net_one_month_return", 1 / 12),
+    "three_month_return": ("net_three_month_return", 0.25),
+    "six_month_return": ("net_six_month_return", 0.5),
+    "one_year_return": ("net_one_year_return", 1),
+    "three_year_return": ("net_three_year_return", 3),
+    "five_year_return": ("net_five_year_return", 5),
+    "si_return": ("net_si_return", None),
+}
+
+NET_RETURN_FIELDS = [net for net, _ in NET_RETURN_HORIZONS.values()]
+
+FEE_FIELDS = (
+    "setup_fee_pct",
+    "fixed_fee_pct",
+    "variable_fee_pct",
+    "carry_pct",
+    "hurdle_pct",
+    "catch_up",
+)
+
+
+def net_of_fee_returns(gross, years, fixed_fee, setup_fee, performance_fee, hurdle, catch_up):
+    """
+    Net return of many schemes over one horizon.
+
+    Returns, fees and the hurdle are percentages. Horizons of a year or more
+    are read and returned as annualised (CAGR) returns, shorter ones as
+    absolute returns. Missing fees (NaN) count as zero.
+
+    Args:
+        gross (np.ndarray): Gross return per scheme, NaN when missing
+        years (np.ndarray): Horizon length in years per scheme
+        fixed_fee (np.ndarray): Annual fixed fee %
+        setup_fee (np.ndarray): One-time setup fee %
+        performance_fee (np.ndarray): Share of profit %, variable fee or carry
+        hurdle (np.ndarray): Annual hurdle rate %
+        catch_up (np.ndarray): Bool, manager catches up once the hurdle is met
+
+    Returns:
+        np.ndarray: Net return %, NaN where gross or the horizon is missing
+    """
+    fixed_fee, setup_fee, performance_fee, hurdle = (
+        np.nan_to_num(values) / 100 for values in (fixed_fee, setup_fee, performance_fee, hurdle)
+    )
+    annualised = years >= 1
+    # Annualised horizons: one period per year. Shorter ones: a single period.
+    period = np.where(annualised, 1.0, years)
+    periods = np.where(annualised, years, 1.0)
+
+    gross_period = gross / 100
+    after_fixed = (1 + gross_period) * (1 - fixed_fee * period) - 1
+
+    period_hurdle = hurdle * period
+    excess = after_fixed - period_hurdle
+    cleared = excess > 0
+    performance = np.where(
+        catch_up,
+        np.where(cleared, np.minimum(excess, performance_fee * after_fixed), 0.0),
+        performance_fee * np.maximum(excess, 0.0),
+    )
+    net_period = after_fixed - performance
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        wealth = (1 - setup_fee) * np.maximum(1 + net_period, 0.0) ** periods
+        net = np.where(annualised, wealth ** (1 / periods) - 1, wealth - 1)
+    return net * 100
+
+
+def compute_net_returns(scheme_type, queryset=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Store the net_* returns of PMS / AIF schemes (all by default).
+
+    Schemes with no parsed fee at all get NULL net returns rather than a
+    copy of the gross ones. Like every bulk write, this bypasses the signals:
+    callers refresh the catalog entries of the schemes afterwards.
+
+    Args:
+        scheme_type (str): SchemeType.PMS or SchemeType.AIF
+        queryset (QuerySet, optional): Schemes to compute
+        batch_size (int, optional): Schemes loaded and written per batch
+
+    Returns:
+        int: Number of schemes written
+    """
+    model = SCHEME_MODELS[scheme_type]
+    queryset = model.objects.all() if queryset is None else queryset
+    rows = list(
+        queryset
+        .order_by("id")
+        .values_list("id", "date_of_inception", *FEE_FIELDS, *NET_RETURN_HORIZONS)
+    )
+    today = timezone.localdate()
+
+    written = 0
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        columns = list(zip(*batch))
+        ids = columns[0]
+        inception_years = np.array(
+            [(today - inception).days / DAYS_PER_YEAR if inception else np.nan for inception in columns[1]],
+            dtype=np.float64,
+        )
+        setup, fixed, variable, carry, hurdle = (
+            np.array(values, dtype=np.float64) for values in columns[2:7]
+        )
+        catch_up = np.array([bool(value) for value in columns[7]])
+        performance = np.where(np.isnan(variable), carry, variable)
+        has_fees = ~(np.isnan(setup) & np.isnan(fixed) & np.isnan(performance))
+
+        net_columns = {}
+        for index, (net_field, horizon) in enumerate(NET_RETURN_HORIZONS.values()):
+            gross = np.array(columns[8 + index], dtype=np.float64)
+            years = inception_years if horizon is None else np.full(len(batch), float(horizon))
+            net = net_of_fee_returns(gross, years, fixed, setup, performance, hurdle, catch_up)
+            net_columns[net_field] = np.where(has_fees, net, np.nan)
+
+        schemes = [
+            model(
+                id=pk,
+                **{
+                    field: None if np.isnan(values[position]) else round(float(values[position]), 4)
+                    for field, values in net_columns.items()
+                },
+            )
+            for position, pk in enumerate(ids)
+        ]
+        model.objects.bulk_update(schemes, NET_RETURN_FIELDS)
+        written += len(schemes)
+
+    logger.info(f"Net returns computed for {scheme_type}: {written} schemes")
+    return written
@@ -0,0 +1,75 @@
+"""
+Provider listing / detail data with per-provider scheme aggregates.
+
+Scheme count, total AUM and average returns are computed by the database in
+the same query that loads the providers (conditional aggregates over the
+provider -> schemes join), and each provider's schemes are loaded by one
+ordered Prefetch query, so a page costs a fixed number of queries however
+many providers or schemes it shows.
+"""
+
+from django.db.models import Avg, Count, Prefetch, Q, Sum
+
+from homepage.models.schemes import PROVIDER_MODELS, SCHEME_MODELS
+
+# Constants
+LISTING_TOP_SCHEMES = 3
+
+# Only publicly listed schemes count towards a provider's aggregates
+LISTED_SCHEMES = Q(schemes__is_active=True, schemes__open_for_investment=True)
+
+
+def annotated_providers(scheme_type):
+    """Active providers of ``scheme_type`` annotated with scheme aggregates"""
+    return (
+        PROVIDER_MODELS[scheme_type].objects
+        .filter(is_active=True)
+        .annotate(
+            scheme_count=Count("schemes", filter=LISTED_SCHEMES),
+            total_aum=Sum("schemes__aum", filter=LISTED_SCHEMES),
+            avg_one_year_return=Avg("schemes__one_year_return", filter=LISTED_SCHEMES),
+            avg_three_year_return=Avg("schemes__three_year_return", filter=LISTED_SCHEMES),
+            avg_si_return=Avg("schemes__si_return", filter=LISTED_SCHEMES),
+        )
+    )
+
+
+def listed_schemes(scheme_type):
+    """A provider's listed schemes, best ranked first"""
+    return SCHEME_MODELS[scheme_type].objects.listed().order_by("effective_priority", "id")
+
+
+def provider_listing(scheme_type):
+    """
+    Every active provider with its aggregates and top schemes.
+
+    Two queries: the annotated providers, then one windowed Prefetch that
+    loads each provider's first LISTING_TOP_SCHEMES schemes into
+    ``top_schemes``.
+    """
+    return list(
+        annotated_providers(scheme_type)
+        .order_by("priority", "name")
+        .prefetch_related(
+            Prefetch(
+                "schemes",
+                queryset=listed_schemes(scheme_type)[:LISTING_TOP_SCHEMES],
+                to_attr="top_schemes",
+            )
+        )
+    )
+
+
+def get_provider_detail(scheme_type, shortname):
+    """
+    One provider with its aggregates and every listed scheme in
+    ``listed_schemes``, or None for an unknown / inactive provider.
+    """
+    return (
+        annotated_providers(scheme_type)
+        .filter(shortname=shortname)
+        .prefetch_related(
+            Prefetch("schemes", queryset=listed_schemes(scheme_type), to_attr="listed_schemes")
+        )
+        .first()
+    )
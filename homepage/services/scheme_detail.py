@@ -0,0 +1,76 @@
+"""
+Scheme detail page data and HTTP validators.
+
+A detail page is one ``select_related`` query: the scheme with its provider.
+The rendered static sections are cached as template fragments keyed on the
+scheme's and provider's ``updated_at``, so an edit or re-import changes the
+key and the old fragments age out. The scheme fragment is also keyed on the
+catalog stamp (release and catalog version): net returns and parsed fees are
+backfilled in bulk without touching ``updated_at``.
+
+The same two timestamps, plus the catalog stamp for the similar-scheme
+list and the code, drive Last-Modified / ETag. They are read by a single indexed lookup
+and cache reads before the view runs, so a repeat visitor or crawler with a
+fresh copy gets a 304 without the page being loaded or rendered.
+"""
+
+from homepage.models.schemes import SCHEME_MODELS
+from homepage.services.catalog_cache import get_catalog_last_modified, get_catalog_stamp
+
+# Returns shown on the detail page: (label, return field, benchmark field, net field)
+DETAIL_RETURNS = (
+    ("1M", "one_month_return", "one_month_benchmark_return", "net_one_month_return"),
+    ("3M", "three_month_return", "three_month_benchmark_return", "net_three_month_return"),
+    ("6M", "six_month_return", "six_month_benchmark_return", "net_six_month_return"),
+    ("1Y", "one_year_return", "one_year_benchmark_return", "net_one_year_return"),
+    ("3Y", "three_year_return", "three_year_benchmark_return", "net_three_year_return"),
+    ("5Y", "five_year_return", "five_year_benchmark_return", "net_five_year_return"),
+    ("Since Inception", "si_return", "si_benchmark_return", "net_si_return"),
+)
+
+
+def scheme_detail_queryset(scheme_type):
+    """Active schemes of active providers, with the provider joined in"""
+    return (
+        SCHEME_MODELS[scheme_type].objects
+        .active()
+        .filter(provider__is_active=True)
+        .select_related("provider")
+    )
+
+
+def get_scheme_detail(scheme_type, pk):
+    """The scheme with its provider in one query, or None"""
+    return scheme_detail_queryset(scheme_type).filter(pk=pk).first()
+
+
+def scheme_returns(scheme):
+    """Rows of (label, return, benchmark, net) for the returns table"""
+    return [
+        (label, getattr(scheme, field), getattr(scheme, benchmark), getattr(scheme, net))
+        for label, field, benchmark, net in DETAIL_RETURNS
+    ]
+
+
+def scheme_last_modified(scheme_type, pk):
+    """
+    Latest of the scheme's and its provider's ``updated_at`` and the
+    catalog's last change (similar schemes come from the rest of the catalog).
+
+    Returns:
+        datetime | None: None for a missing or unlisted scheme
+    """
+    row = (
+        scheme_detail_queryset(scheme_type)
+        .filter(pk=pk)
+        .values_list("updated_at", "provider__updated_at")
+        .first()
+    )
+    if row is None:
+        return None
+    return max(*row, get_catalog_last_modified())
+
+
+def scheme_etag(scheme_type, pk, last_modified):
+    """Strong validator for one rendered detail page"""
+    return f'"{scheme_type}-{pk}-{last_modified.timestamp():.6f}-{get_catalog_stamp()}"'
@@ -0,0 +1,54 @@
+"""
+Backfill of the parsed amount / fee columns on PMS / AIF schemes.
+
+New and edited schemes are parsed on save and by the importer; this re-parses
+existing rows, e.g. after the parser learns a new format. Schemes are read in
+chunks with only their text columns and just the rows whose numeric copies
+changed are written back, then their catalog entries are refreshed.
+"""
+
+import logging
+
+from django.db import transaction
+
+from homepage.models.schemes import PARSED_SOURCE_FIELDS, PARSED_VALUE_FIELDS, SCHEME_MODELS
+from homepage.services.catalog_entries import refresh_catalog_entries
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_BATCH_SIZE = 1000
+
+
+def backfill_parsed_fields(scheme_type, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Re-parse min_inv_amount and the fee columns of every ``scheme_type`` scheme.
+
+    Args:
+        scheme_type (str): SchemeType.PMS or SchemeType.AIF
+        batch_size (int, optional): Schemes per bulk_update. Defaults to 1000.
+
+    Returns:
+        tuple: (schemes checked, schemes updated)
+    """
+    model = SCHEME_MODELS[scheme_type]
+    schemes = model.objects.only("id", *PARSED_SOURCE_FIELDS, *PARSED_VALUE_FIELDS).order_by("id")
+
+    checked = 0
+    changed = []
+    for scheme in schemes.iterator(chunk_size=batch_size):
+        checked += 1
+        before = [getattr(scheme, column) for column in PARSED_VALUE_FIELDS]
+        scheme.refresh_parsed_fields()
+        if [getattr(scheme, column) for column in PARSED_VALUE_FIELDS] != before:
+            changed.append(scheme)
+
+    with transaction.atomic():
+        # bulk_update bypasses save() and the signals, so refresh the entries here
+        model.objects.bulk_update(changed, PARSED_VALUE_FIELDS, batch_size=batch_size)
+        for start in range(0, len(changed), batch_size):
+            ids = [scheme.id for scheme in changed[start:start + batch_size]]
+            refresh_catalog_entries(scheme_type, model.objects.filter(id__in=ids))
+
+    logger.info(f"Parsed fees backfilled for {scheme_type}: {len(changed)} of {checked} schemes changed")
+    return checked, len(changed)
@@ -0,0 +1,561 @@
+"""
+Bulk ingestion of PMS / AIF scheme sheets.
+
+Workbooks are streamed row by row (openpyxl read-only mode for .xlsx, the csv
+module for .csv) and written in batches with
+``bulk_create(update_conflicts=True)``, so a full catalog refresh never holds
+the whole file in memory and costs one provider lookup, one existing-key
+lookup and one upsert per batch, plus one set-based write each for the
+re-rank, the net-of-fee returns, the search index, the catalog read model
+and the return snapshots.
+
+Rows are fingerprinted (``content_hash``) and only those whose fingerprint
+changed since the last import are written, so re-importing a mostly
+unchanged sheet leaves ``updated_at`` and the catalog caches alone.
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from funddetails.models import SchemeReturnSnapshot
+from funddetails.services.snapshots import SNAPSHOT_FIELDS, append_return_snapshots
+from homepage.models.schemes import SCHEME_MODELS
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.catalog_entries import refresh_catalog_entries
+from homepage.services.fee_parsing import PARSED_FIELDS, parse_scheme_values
+from homepage.services.net_returns import compute_net_returns
+from homepage.services.search import index_schemes
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+SUPPORTED_EXTENSIONS = (".xlsx", ".xlsm", ".csv")
+
+# Fields that are never read from a sheet column
+NON_IMPORTABLE_FIELDS = {"provider", "scheme_code", "sheet_type", "created_at", "updated_at"}
+
+# Normalised sheet headers that differ from the model field names
+COLUMN_ALIASES = {
+    "scheme": "ia_name",
+    "scheme_name": "ia_name",
+    "name": "ia_name",
+    "strategy": "strategy_name",
+    "product": "product_name",
+    "benchmark": "benchmark_name",
+    "open_ended": "open_ended_yes_no",
+    "tenor": "expected_tenor",
+    "aum_cr": "aum",
+    "aum_in_cr": "aum",
+    "min_investment": "min_inv_amount",
+    "minimum_investment": "min_inv_amount",
+    "1m_return": "one_month_return",
+    "1m_benchmark_return": "one_month_benchmark_return",
+    "3m_return": "three_month_return",
+    "3m_benchmark_return": "three_month_benchmark_return",
+    "6m_return": "six_month_return",
+    "6m_benchmark_return": "six_month_benchmark_return",
+    "1y_return": "one_year_return",
+    "1y_benchmark_return": "one_year_benchmark_return",
+    "3y_return": "three_year_return",
+    "3y_benchmark_return": "three_year_benchmark_return",
+    "5y_return": "five_year_return",
+    "5y_benchmark_return": "five_year_benchmark_return",
+    "since_inception_return": "si_return",
+    "since_inception_benchmark_return": "si_benchmark_return",
+    "inception_date": "date_of_inception",
+    "fund_manager": "fund_managers",
+    "capital_called": "capital_called_percent",
+    "provider_shortname": "provider",
+    "shortname": "provider",
+    "provider_code": "provider",
+    "code": "scheme_code",
+}
+
+EMPTY_VALUES = {"", "-", "--", "na", "n/a", "nil", "none", "null"}
+TRUE_VALUES = {"yes", "y", "true", "1", "open", "open ended", "open-ended"}
+FALSE_VALUES = {"no", "n", "false", "0", "closed", "close ended", "close-ended"}
+DATE_FORMATS = ("%d-%m-%Y", "%d/%m/%Y", "%d-%b-%Y", "%d %b %Y", "%Y-%m-%d")
+
+
+class SchemeImportError(Exception):
+    """Raised when a scheme file cannot be imported at all"""
+
+
+class ImportResult:
+    """Running counters for one import run"""
+
+    def __init__(self):
+        self.rows = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.deactivated = 0
+        self.skipped = 0
+        self.snapshots = 0
+        self.errors = []
+
+    def skip(self, sheet_name, row_number, reason):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"{sheet_name} row {row_number}: {reason}")
+
+    def summary(self):
+        return (
+            f"{self.rows} rows read: {self.inserted} inserted, "
+            f"{self.updated} updated, {self.unchanged} unchanged, "
+            f"{self.deactivated} deactivated, {self.skipped} skipped, "
+            f"{self.snapshots} return snapshots"
+        )
+
+
+def import_scheme_file(
+    path,
+    scheme_type,
+    batch_size=DEFAULT_BATCH_SIZE,
+    sheets=None,
+    source_name=None,
+    as_of=None,
+    deactivate_missing=False,
+):
+    """
+    Import every sheet of a workbook (or a single CSV) into the scheme table.
+
+    Each row's imported values are fingerprinted into ``content_hash``; rows
+    whose fingerprint matches the stored one are left untouched, so a
+    re-import costs writes only for the rows that changed.
+
+    Args:
+        path (str | Path): .xlsx / .csv file to read
+        scheme_type (str): SchemeType value selecting PMSScheme or AIFScheme
+        batch_size (int, optional): Rows written per upsert. Defaults to 1000.
+        sheets (list, optional): Restrict the import to these sheet names
+        source_name (str, optional): Original file name, used as the sheet
+            name of CSV files that were spooled to a temporary path
+        as_of (date, optional): Date the sheet's returns are reported for;
+            a return snapshot is appended per scheme. Defaults to today.
+        deactivate_missing (bool, optional): Mark active schemes of the
+            imported sheets that are no longer listed as inactive, and
+            reactivate listed ones. Skipped when any row failed to import.
+
+    Returns:
+        ImportResult: Inserted / updated / unchanged / deactivated / skipped
+            counters and row errors
+    """
+    model = SCHEME_MODELS.get(scheme_type)
+    if model is None:
+        raise SchemeImportError(f"Unknown scheme type: {scheme_type}")
+
+    as_of = as_of or timezone.localdate()
+    result = ImportResult()
+
+    # Sheet name -> scheme codes listed in it
+    seen_codes = {}
+
+    for sheet_name, header, rows in iter_sheet_rows(path, sheets=sheets, source_name=source_name):
+        column_map = build_column_map(model, header)
+        sheet_codes = seen_codes.setdefault(sheet_name[:50], set())
+        batch = []
+
+        for row_number, row in enumerate(rows, start=2):
+            if not any(_has_value(cell) for cell in row):
+                continue
+
+            result.rows += 1
+            batch.append((row_number, row))
+
+            if len(batch) >= batch_size:
+                sheet_codes.update(_write_batch(
+                    model, scheme_type, sheet_name, column_map, batch, result, as_of, deactivate_missing
+                ))
+                batch = []
+
+        if batch:
+            sheet_codes.update(_write_batch(
+                model, scheme_type, sheet_name, column_map, batch, result, as_of, deactivate_missing
+            ))
+
+    if deactivate_missing:
+        if result.skipped:
+            result.errors.append(
+                f"Missing schemes were not deactivated: {result.skipped} rows could not be imported"
+            )
+        else:
+            result.deactivated = _deactivate_missing(model, scheme_type, seen_codes, batch_size)
+
+    # bulk_create bypasses the post_save hooks that invalidate cached pages
+    if result.inserted or result.updated or result.deactivated:
+        bump_catalog_version()
+
+    logger.info(f"Imported {model._meta.verbose_name_plural} from {path}: {result.summary()}")
+    return result
+
+
+def iter_sheet_rows(path, sheets=None, source_name=None):
+    """
+    Yield ``(sheet_name, header, rows)`` for each sheet in the file.
+
+    ``rows`` is a lazy iterator of value tuples and must be consumed before
+    moving on to the next sheet.
+    """
+    path = Path(path)
+    extension = path.suffix.lower()
+
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise SchemeImportError(f"Unsupported file type: {extension or path.name}")
+
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is not None:
+                yield Path(source_name or path).stem, header, reader
+        return
+
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise SchemeImportError("openpyxl is required to import Excel workbooks")
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            if sheets and worksheet.title not in sheets:
+                continue
+
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is not None:
+                yield worksheet.title, header, rows
+    finally:
+        workbook.close()
+
+
+def build_column_map(model, header):
+    """
+    Map model field names onto column positions of a sheet header.
+
+    Unknown columns are ignored; the first column wins when two headers
+    resolve to the same field.
+    """
+    fields = importable_fields(model)
+    column_map = {}
+
+    for index, title in enumerate(header):
+        key = normalize_header(title)
+        field_name = COLUMN_ALIASES.get(key, key)
+        if field_name in fields or field_name in ("provider", "scheme_code"):
+            column_map.setdefault(field_name, index)
+
+    if "provider" not in column_map:
+        raise SchemeImportError("Sheet has no provider shortname column")
+
+    return column_map
+
+
+def importable_fields(model):
+    """Concrete scheme fields that may be filled from a sheet column"""
+    return {
+        field.name: field
+        for field in model._meta.concrete_fields
+        if not field.primary_key and field.editable and field.name not in NON_IMPORTABLE_FIELDS
+    }
+
+
+def normalize_header(title):
+    """'1Y Return (%)' -> '1y_return'"""
+    text = str(title or "").strip().lower()
+    text = re.sub(r"\(.*?\)", "", text)
+    return re.sub(r"[^a-z0-9]+", "_", text).strip("_")
+
+
+def derive_scheme_code(shortname, values):
+    """Fallback upsert key for sheets without a scheme_code column"""
+    name = values.get("ia_name") or ""
+    strategy = values.get("strategy_name") or ""
+    if not name and not strategy:
+        return None
+    return slugify(f"{shortname} {name} {strategy}")[:120]
+
+
+def coerce_value(field, raw):
+    """
+    Convert a raw cell value into the Python value for ``field``.
+
+    Raises:
+        ValidationError: If the cell cannot be converted
+    """
+    if isinstance(raw, str):
+        raw = raw.strip()
+    # Amount / fee text is kept as written and parsed like save() does, so
+    # "Nil" / "None" still mean a zero fee; elsewhere they mean no value
+    if raw is None or raw == "" or (field.name not in PARSED_FIELDS and not _has_value(raw)):
+        return None
+
+    if isinstance(field, models.BooleanField):
+        if isinstance(raw, bool):
+            return raw
+        text = str(raw).strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+        raise ValidationError(f"'{raw}' is not a yes/no value")
+
+    if field.choices:
+        return _coerce_choice(field, raw)
+
+    if isinstance(field, (models.FloatField, models.DecimalField, models.IntegerField)):
+        if isinstance(raw, str):
+            raw = raw.replace(",", "").replace("%", "").strip()
+        if isinstance(field, models.IntegerField) and isinstance(raw, float) and raw.is_integer():
+            raw = int(raw)
+
+    elif isinstance(field, models.DateField):
+        if isinstance(raw, datetime):
+            return raw.date()
+        if isinstance(raw, str):
+            raw = _parse_date(raw)
+
+    elif isinstance(field, (models.CharField, models.TextField)):
+        if isinstance(raw, float) and raw.is_integer():
+            raw = int(raw)
+        raw = str(raw)
+        if field.max_length and len(raw) > field.max_length:
+            raise ValidationError(f"{field.name} is longer than {field.max_length} characters")
+
+    return field.to_python(raw)
+
+
+# Private helper functions
+
+def _write_batch(model, scheme_type, sheet_name, column_map, batch, result, as_of, activate=False):
+    """
+    Resolve providers, build instances and upsert the changed rows of one batch.
+
+    Returns:
+        set: Scheme codes of every row imported from the batch
+    """
+    provider_index = column_map["provider"]
+    fields = importable_fields(model)
+    value_columns = [
+        (name, index) for name, index in column_map.items()
+        if name not in ("provider", "scheme_code")
+    ]
+    # Listed schemes are (re)activated unless the sheet says otherwise
+    activate = activate and "is_active" not in column_map
+
+    # One provider lookup per batch
+    shortnames = {_text(_cell(row, provider_index)) for _, row in batch}
+    shortnames.discard(None)
+    provider_model = model._meta.get_field("provider").related_model
+    known_providers = set(
+        provider_model.objects
+        .filter(shortname__in=shortnames)
+        .values_list("shortname", flat=True)
+    )
+
+    instances = {}
+    for row_number, row in batch:
+        shortname = _text(_cell(row, provider_index))
+        if shortname not in known_providers:
+            result.skip(sheet_name, row_number, f"unknown provider '{shortname}'")
+            continue
+
+        try:
+            values = {
+                name: coerce_value(fields[name], _cell(row, index))
+                for name, index in value_columns
+            }
+        except ValidationError as e:
+            result.skip(sheet_name, row_number, "; ".join(e.messages))
+            continue
+
+        scheme_code = _text(_cell(row, column_map.get("scheme_code"))) or derive_scheme_code(shortname, values)
+        if not scheme_code:
+            result.skip(sheet_name, row_number, "no scheme_code, ia_name or strategy_name")
+            continue
+
+        if activate:
+            values["is_active"] = True
+
+        # Later rows win when a sheet repeats a scheme inside one batch
+        instances[scheme_code] = model(
+            scheme_code=scheme_code,
+            provider_id=shortname,
+            sheet_type=sheet_name[:50],
+            content_hash=content_fingerprint(shortname, sheet_name[:50], values),
+            **values,
+            **parse_scheme_values(values),
+        )
+
+    if not instances:
+        return set()
+
+    # scheme_code -> (id, stored fingerprint)
+    existing = {
+        code: (pk, content_hash)
+        for code, pk, content_hash in (
+            model.objects
+            .filter(scheme_code__in=list(instances))
+            .values_list("scheme_code", "id", "content_hash")
+        )
+    }
+    changed = {
+        code: instance for code, instance in instances.items()
+        if code not in existing or existing[code][1] != instance.content_hash
+    }
+    unchanged_ids = [existing[code][0] for code in instances if code not in changed]
+
+    value_names = [name for name, _ in value_columns] + (["is_active"] if activate else [])
+    update_fields = value_names + ["provider", "sheet_type", "content_hash", "updated_at"]
+    parsed_columns = [PARSED_FIELDS[name][0] for name in update_fields if name in PARSED_FIELDS]
+    update_fields += parsed_columns
+    snapshot_fields = [name for name in value_names if name in SNAPSHOT_FIELDS]
+
+    with transaction.atomic():
+        if changed:
+            model.objects.bulk_create(
+                changed.values(),
+                update_conflicts=True,
+                unique_fields=["scheme_code"],
+                update_fields=update_fields,
+            )
+            written = model.objects.filter(scheme_code__in=list(changed))
+            # bulk_create skips save(), so re-rank the batch in a single UPDATE
+            model.refresh_effective_priority(written)
+            if {"setup_fee_pct", "fixed_fee_pct"}.intersection(parsed_columns):
+                model.refresh_total_fee(written)
+            index_schemes(scheme_type, written)
+            compute_net_returns(scheme_type, written)
+            refresh_catalog_entries(scheme_type, written)
+
+        if snapshot_fields:
+            scheme_ids = {code: pk for code, (pk, _) in existing.items()}
+            if len(scheme_ids) < len(instances):
+                scheme_ids.update(
+                    model.objects
+                    .filter(scheme_code__in=[code for code in changed if code not in existing])
+                    .values_list("scheme_code", "id")
+                )
+            # Unchanged schemes only need a snapshot if this date has none yet
+            recorded = set(
+                SchemeReturnSnapshot.objects
+                .filter(scheme_type=scheme_type, scheme_id__in=unchanged_ids, as_of=as_of)
+                .values_list("scheme_id", flat=True)
+            ) if unchanged_ids else set()
+            result.snapshots += append_return_snapshots(
+                scheme_type,
+                {
+                    scheme_ids[code]: {field: getattr(instance, field) for field in snapshot_fields}
+                    for code, instance in instances.items()
+                    if scheme_ids[code] not in recorded
+                },
+                as_of,
+            )
+
+    inserted = sum(1 for code in changed if code not in existing)
+    result.inserted += inserted
+    result.updated += len(changed) - inserted
+    result.unchanged += len(instances) - len(changed)
+    return set(instances)
+
+
+def _deactivate_missing(model, scheme_type, seen_codes, batch_size):
+    """Deactivate active schemes of the imported sheets that were not listed"""
+    active = (
+        model.objects
+        .active()
+        .filter(sheet_type__in=list(seen_codes))
+        .values_list("id", "scheme_code", "sheet_type")
+    )
+    missing_ids = [
+        pk for pk, code, sheet_type in active.iterator(chunk_size=batch_size)
+        if code not in seen_codes[sheet_type]
+    ]
+
+    for start in range(0, len(missing_ids), batch_size):
+        ids = missing_ids[start:start + batch_size]
+        with transaction.atomic():
+            # Clear the fingerprint so the scheme is rewritten (and reactivated) if listed again
+            model.objects.filter(id__in=ids).update(
+                is_active=False, content_hash=None, updated_at=timezone.now()
+            )
+            index_schemes(scheme_type, model.objects.filter(id__in=ids))
+            refresh_catalog_entries(scheme_type, model.objects.filter(id__in=ids))
+    return len(missing_ids)
+
+
+def content_fingerprint(shortname, sheet_type, values):
+    """
+    Stable hash of a row's imported values, independent of column order.
+
+    Returns:
+        str: 32 hex characters
+    """
+    payload = json.dumps(
+        [shortname, sheet_type, sorted(values.items())],
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _coerce_choice(field, raw):
+    """Accept choice keys or labels, e.g. 'CAT3', 'Category III', 'Cat III'"""
+    lookup = {}
+    for key, label in field.flatchoices:
+        lookup[_choice_token(key)] = key
+        lookup[_choice_token(label)] = key
+        lookup[_choice_token(label).replace("category", "cat")] = key
+
+    value = lookup.get(_choice_token(raw))
+    if value is None:
+        raise ValidationError(f"'{raw}' is not a valid {field.name}")
+    return value
+
+
+def _choice_token(value):
+    return re.sub(r"[^a-z0-9]", "", str(value).lower())
+
+
+def _parse_date(text):
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return text
+
+
+def _cell(row, index):
+    if index is None or index >= len(row):
+        return None
+    return row[index]
+
+
+def _text(value):
+    if not _has_value(value):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip() or None
+
+
+def _has_value(value):
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() not in EMPTY_VALUES
+    return True
@@ -0,0 +1,329 @@
+"""
+Full-text search over schemes, mutual funds and providers.
+
+Every searchable row is flattened into a SearchDocument (name, strategy,
+fund managers, provider name). The database indexes those documents itself:
+SQLite through an FTS5 external-content table with prefix indexes, kept in
+step by triggers, and PostgreSQL through a GIN tsvector expression index
+(both created in migration 0006). Queries are tokenised here and every token
+is matched as a prefix, so "hdf fle" finds "HDFC Flexi Cap".
+
+Documents are refreshed on save by homepage/signals.py and in bulk by the
+importers; ``manage.py rebuild_search_index`` rebuilds everything.
+"""
+
+import logging
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from funddetails.models import MutualFundScheme
+from homepage.models.schemes import PROVIDER_MODELS, SCHEME_MODELS, SchemeType
+from homepage.models.search import SearchDocument, SearchKind
+
+logger = logging.getLogger(__name__)
+
+# Constants
+INDEX_BATCH_SIZE = 1000
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_TOKENS = 8
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 25
+
+SCHEME_KINDS = {
+    SchemeType.PMS: SearchKind.PMS,
+    SchemeType.AIF: SearchKind.AIF,
+}
+
+PROVIDER_KINDS = {
+    SchemeType.PMS: SearchKind.PMS_PROVIDER,
+    SchemeType.AIF: SearchKind.AIF_PROVIDER,
+}
+
+DOCUMENT_FIELDS = [
+    "title",
+    "strategy",
+    "managers",
+    "provider_name",
+    "provider_key",
+    "rank",
+    "is_active",
+]
+
+# Must match the expression indexed by migration 0006 on PostgreSQL
+POSTGRES_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(d.title, '') || ' ' || coalesce(d.strategy, '') || ' ' || "
+    "coalesce(d.managers, '') || ' ' || coalesce(d.provider_name, ''))"
+)
+
+
+# ======================================================
+# BACKENDS
+# ======================================================
+class SearchBackend:
+    """Runs a tokenised prefix query against the document index"""
+
+    def search(self, tokens, kinds, limit):
+        """
+        Args:
+            tokens (list): Lower-cased word tokens, each matched as a prefix
+            kinds (list): SearchKind values to restrict to
+            limit (int): Maximum number of results
+
+        Returns:
+            list: (kind, object_id, title, provider_name) tuples, best first
+        """
+        raise NotImplementedError
+
+    def optimize(self):
+        """Compact the index after a bulk rebuild"""
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """
+    SQLite FTS5, weighting title over provider name over strategy / managers.
+
+    Every match is scored with bm25 and only the best ``limit`` are kept;
+    SQLite sorts ORDER BY ... LIMIT with a bounded sorter, so broad
+    autocomplete prefixes like "eq" cost a pass over their matches but still
+    return the best ones, wherever they sit in the index. Kind filters are
+    part of the MATCH expression so the index narrows them too.
+    """
+
+    def search(self, tokens, kinds, limit):
+        text_match = " ".join(f'"{token}"*' for token in tokens)
+        match = f"{{title strategy managers provider_name}} : ({text_match})"
+        if set(kinds) != set(SearchKind.values):
+            kind_match = " OR ".join(f'"{kind.lower()}"' for kind in kinds)
+            match = f"{match} AND {{kind}} : ({kind_match})"
+
+        # CROSS JOIN keeps the FTS table as the outer loop
+        sql = """
+            SELECT d.kind, d.object_id, d.title, d.provider_name
+            FROM homepage_searchdocument_fts f
+            CROSS JOIN homepage_searchdocument d ON d.id = f.rowid
+            WHERE homepage_searchdocument_fts MATCH %s AND d.is_active
+            ORDER BY bm25(homepage_searchdocument_fts, 10.0, 2.0, 1.0, 5.0, 0.0), d.rank
+            LIMIT %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [match, limit])
+            return cursor.fetchall()
+
+    def optimize(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO homepage_searchdocument_fts (homepage_searchdocument_fts) VALUES ('optimize')"
+            )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """PostgreSQL tsvector / tsquery on the GIN expression index"""
+
+    def search(self, tokens, kinds, limit):
+        query = " & ".join(f"{token}:*" for token in tokens)
+        placeholders = ", ".join(["%s"] * len(kinds))
+        sql = f"""
+            SELECT d.kind, d.object_id, d.title, d.provider_name
+            FROM homepage_searchdocument d
+            WHERE {POSTGRES_DOCUMENT} @@ to_tsquery('simple'::regconfig, %s)
+              AND d.is_active
+              AND d.kind IN ({placeholders})
+            ORDER BY ts_rank({POSTGRES_DOCUMENT}, to_tsquery('simple'::regconfig, %s)) DESC, d.rank
+            LIMIT %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [query, *kinds, query, limit])
+            return cursor.fetchall()
+
+
+class BasicSearchBackend(SearchBackend):
+    """Unindexed fallback for other databases: every token must prefix a word"""
+
+    def search(self, tokens, kinds, limit):
+        queryset = SearchDocument.objects.filter(is_active=True, kind__in=kinds)
+        for token in tokens:
+            matches = Q()
+            for field in ("title", "strategy", "managers", "provider_name"):
+                matches |= Q(**{f"{field}__istartswith": token}) | Q(**{f"{field}__icontains": f" {token}"})
+            queryset = queryset.filter(matches)
+        return list(
+            queryset
+            .order_by("rank", "title")
+            .values_list("kind", "object_id", "title", "provider_name")[:limit]
+        )
+
+
+SEARCH_BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def get_search_backend():
+    return SEARCH_BACKENDS.get(connection.vendor, BasicSearchBackend)()
+
+
+# ======================================================
+# QUERYING
+# ======================================================
+def tokenize(query):
+    """Lower-cased word tokens of a user query, capped at MAX_QUERY_TOKENS"""
+    return re.findall(r"\w+", query.lower())[:MAX_QUERY_TOKENS]
+
+
+def search_documents(query, kinds=None, limit=DEFAULT_SEARCH_LIMIT):
+    """
+    Prefix search across scheme, mutual fund and provider documents.
+
+    Args:
+        query (str): Raw user input
+        kinds (list, optional): SearchKind values to include. Defaults to all.
+        limit (int, optional): Maximum results. Defaults to 10.
+
+    Returns:
+        list: dicts with kind, id, title and provider, best match first
+    """
+    tokens = tokenize(query)
+    if not tokens or len("".join(tokens)) < MIN_QUERY_LENGTH:
+        return []
+
+    rows = get_search_backend().search(
+        tokens,
+        list(kinds or SearchKind.values),
+        max(1, min(limit, MAX_SEARCH_LIMIT)),
+    )
+    return [
+        {"kind": kind, "id": object_id, "title": title, "provider": provider_name}
+        for kind, object_id, title, provider_name in rows
+    ]
+
+
+# ======================================================
+# INDEXING
+# ======================================================
+def index_schemes(scheme_type, queryset=None):
+    """Upsert the search documents of PMS / AIF schemes (all by default)"""
+    model = SCHEME_MODELS[scheme_type]
+    queryset = model.objects.all() if queryset is None else queryset
+    rows = queryset.values_list(
+        "id",
+        "ia_name",
+        "strategy_name",
+        "product_name",
+        "fund_managers",
+        "provider__name",
+        "provider_id",
+        "effective_priority",
+        "is_active",
+        "provider__is_active",
+    )
+    return _upsert_documents(
+        SearchDocument(
+            kind=SCHEME_KINDS[scheme_type],
+            object_id=pk,
+            title=(ia_name or strategy or product or str(pk))[:300],
+            strategy=strategy,
+            managers=managers,
+            provider_name=provider_name,
+            provider_key=shortname,
+            rank=effective_priority,
+            is_active=is_active and provider_active,
+        )
+        for (
+            pk, ia_name, strategy, product, managers, provider_name,
+            shortname, effective_priority, is_active, provider_active,
+        ) in rows.iterator(chunk_size=INDEX_BATCH_SIZE)
+    )
+
+
+def index_providers(scheme_type, queryset=None):
+    """Upsert the search documents of PMS / AIF providers (all by default)"""
+    model = PROVIDER_MODELS[scheme_type]
+    queryset = model.objects.all() if queryset is None else queryset
+    rows = queryset.values_list("id", "name", "shortname", "priority", "is_active")
+    return _upsert_documents(
+        SearchDocument(
+            kind=PROVIDER_KINDS[scheme_type],
+            object_id=pk,
+            title=name,
+            provider_name=shortname,
+            provider_key=shortname,
+            rank=priority,
+            is_active=is_active,
+        )
+        for pk, name, shortname, priority, is_active in rows.iterator(chunk_size=INDEX_BATCH_SIZE)
+    )
+
+
+def index_mutual_funds(queryset=None):
+    """Upsert the search documents of mutual fund schemes (all by default)"""
+    queryset = MutualFundScheme.objects.all() if queryset is None else queryset
+    rows = queryset.values_list("id", "scheme_name", "category", "amc_name", "is_active")
+    return _upsert_documents(
+        SearchDocument(
+            kind=SearchKind.MF,
+            object_id=pk,
+            title=scheme_name[:300],
+            strategy=category,
+            provider_name=amc_name,
+            is_active=is_active,
+        )
+        for pk, scheme_name, category, amc_name, is_active in rows.iterator(chunk_size=INDEX_BATCH_SIZE)
+    )
+
+
+def remove_documents(kind, object_ids):
+    SearchDocument.objects.filter(kind=kind, object_id__in=object_ids).delete()
+
+
+def reindex_provider(scheme_type, provider):
+    """Refresh a provider's document and its schemes' provider name / visibility"""
+    index_providers(scheme_type, PROVIDER_MODELS[scheme_type].objects.filter(pk=provider.pk))
+    index_schemes(scheme_type, SCHEME_MODELS[scheme_type].objects.filter(provider_id=provider.shortname))
+
+
+def rebuild_search_index():
+    """
+    Drop and rebuild every search document.
+
+    Returns:
+        int: Number of documents written
+    """
+    with transaction.atomic():
+        SearchDocument.objects.all().delete()
+        # Catalog documents first: SQLite scores the earliest rowids first
+        written = 0
+        for scheme_type in SCHEME_KINDS:
+            written += index_providers(scheme_type)
+            written += index_schemes(scheme_type)
+        written += index_mutual_funds()
+
+    get_search_backend().optimize()
+    logger.info(f"Search index rebuilt with {written} documents")
+    return written
+
+
+def _upsert_documents(documents):
+    written = 0
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= INDEX_BATCH_SIZE:
+            written += _write_documents(batch)
+            batch = []
+    if batch:
+        written += _write_documents(batch)
+    return written
+
+
+def _write_documents(batch):
+    SearchDocument.objects.bulk_create(
+        batch,
+        update_conflicts=True,
+        unique_fields=["kind", "object_id"],
+        update_fields=DOCUMENT_FIELDS,
+    )
+    return len(batch)
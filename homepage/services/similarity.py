@@ -0,0 +1,203 @@
+"""
+"Schemes like this one" recommendations.
+
+Every scheme of a type becomes a feature vector: its 1M through SI returns,
+standardised per horizon (missing returns sit at the horizon mean), plus a
+weighted one-hot of its category. ``nearest_neighbours`` finds the k closest
+listed schemes of every scheme with blockwise matrix arithmetic,
+
+    |a - b|^2 = |a|^2 + |b|^2 - 2 a.b
+
+and ``argpartition``, so memory stays at block_size x candidates however
+many schemes there are. ``build_scheme_similarity`` stores the neighbour
+lists in SchemeSimilarity; ``similar_schemes`` serves them as one indexed
+query joined onto the catalog entries.
+
+Building is an offline job (``manage.py build_scheme_similarity``), run after
+imports. Schemes are read from CatalogEntry, which carries the returns and
+category of both scheme types.
+"""
+
+import logging
+
+import numpy as np
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from homepage.models.catalog import CatalogEntry
+from homepage.models.similarity import SchemeSimilarity
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_NEIGHBOURS = 6
+DEFAULT_BLOCK_SIZE = 1024
+WRITE_BATCH_SIZE = 1000
+
+# Schemes with fewer reported returns are too sparse to compare
+MIN_RETURNS = 2
+
+# Distance between two different categories, in standard deviations of return
+CATEGORY_WEIGHT = 1.5
+
+SIMILARITY_RETURN_FIELDS = (
+    "one_month_return",
+    "three_month_return",
+    "six_month_return",
+    "one_year_return",
+    "three_year_return",
+    "five_year_return",
+    "si_return",
+)
+
+
+def build_features(returns, categories):
+    """
+    Feature matrix of many schemes.
+
+    Args:
+        returns (np.ndarray): n x horizons gross returns, NaN when missing
+        categories (list): Category per scheme, None when unknown
+
+    Returns:
+        np.ndarray: n x (horizons + categories) float64 matrix
+    """
+    # nanmean / nanstd without the empty-column warnings
+    counts = np.maximum((~np.isnan(returns)).sum(axis=0), 1)
+    mean = np.nansum(returns, axis=0) / counts
+    std = np.sqrt(np.nansum((returns - mean) ** 2, axis=0) / counts)
+    std[std == 0] = 1.0
+    standardised = np.nan_to_num((returns - mean) / std)
+
+    # Two one-hot rows differ in two columns: scale so that costs CATEGORY_WEIGHT
+    labels = sorted({category for category in categories if category})
+    column = {category: index for index, category in enumerate(labels)}
+    one_hot = np.zeros((len(categories), len(labels)))
+    for row, category in enumerate(categories):
+        if category:
+            one_hot[row, column[category]] = CATEGORY_WEIGHT / np.sqrt(2)
+
+    return np.hstack([standardised, one_hot])
+
+
+def nearest_neighbours(features, ids, candidates, candidate_ids, k, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    The k nearest candidates of every row of ``features``.
+
+    A scheme is never its own neighbour (rows and candidates with the same id
+    are skipped).
+
+    Args:
+        features (np.ndarray): n x d query vectors
+        ids (np.ndarray): n ids of the query rows
+        candidates (np.ndarray): m x d candidate vectors
+        candidate_ids (np.ndarray): m ids of the candidates
+        k (int): Neighbours per row
+        block_size (int): Query rows per distance block
+
+    Returns:
+        tuple: (n x k candidate positions, n x k distances), nearest first;
+        np.inf distances pad rows with fewer than k candidates
+    """
+    k = min(k, len(candidate_ids))
+    positions = np.zeros((len(ids), k), dtype=np.int64)
+    distances = np.full((len(ids), k), np.inf)
+    if k == 0:
+        return positions, distances
+
+    candidate_norms = np.einsum("ij,ij->i", candidates, candidates)
+    for start in range(0, len(ids), block_size):
+        block = features[start:start + block_size]
+        block_norms = np.einsum("ij,ij->i", block, block)
+        squared = block_norms[:, None] + candidate_norms[None, :] - 2 * block @ candidates.T
+        np.maximum(squared, 0, out=squared)
+        squared[ids[start:start + block_size, None] == candidate_ids[None, :]] = np.inf
+
+        if k < squared.shape[1]:
+            nearest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+        else:
+            nearest = np.broadcast_to(np.arange(k), (len(block), k)).copy()
+        nearest_squared = np.take_along_axis(squared, nearest, axis=1)
+        order = np.argsort(nearest_squared, axis=1, kind="stable")
+
+        positions[start:start + len(block)] = np.take_along_axis(nearest, order, axis=1)
+        distances[start:start + len(block)] = np.sqrt(np.take_along_axis(nearest_squared, order, axis=1))
+
+    return positions, distances
+
+
+def build_scheme_similarity(scheme_type, k=DEFAULT_NEIGHBOURS, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Rebuild the neighbour lists of every scheme of ``scheme_type``.
+
+    Every catalog entry with enough returns gets up to k listed neighbours;
+    rows are replaced in one transaction so pages never see a partial build.
+
+    Args:
+        scheme_type (str): SchemeType.PMS or SchemeType.AIF
+        k (int, optional): Neighbours per scheme
+        block_size (int, optional): Schemes per distance block
+
+    Returns:
+        int: Number of schemes that got neighbours
+    """
+    rows = list(
+        CatalogEntry.objects
+        .filter(scheme_type=scheme_type)
+        .order_by("scheme_id")
+        .values_list("scheme_id", "is_listed", "category", *SIMILARITY_RETURN_FIELDS)
+    )
+    returns = np.array([row[3:] for row in rows], dtype=np.float64).reshape(-1, len(SIMILARITY_RETURN_FIELDS))
+    comparable = (~np.isnan(returns)).sum(axis=1) >= MIN_RETURNS
+
+    ids = np.array([row[0] for row in rows], dtype=np.int64)[comparable]
+    listed = np.array([row[1] for row in rows], dtype=bool)[comparable]
+    features = build_features(returns[comparable], [row[2] for row, keep in zip(rows, comparable) if keep])
+
+    positions, distances = nearest_neighbours(
+        features, ids, features[listed], ids[listed], k, block_size=block_size,
+    )
+    listed_ids = ids[listed]
+
+    similarities = [
+        SchemeSimilarity(
+            scheme_type=scheme_type,
+            scheme_id=int(scheme_id),
+            similar_scheme_id=int(listed_ids[position]),
+            rank=rank,
+            distance=round(float(distance), 6),
+        )
+        for scheme_id, row_positions, row_distances in zip(ids, positions, distances)
+        for rank, (position, distance) in enumerate(zip(row_positions, row_distances), start=1)
+        if np.isfinite(distance)
+    ]
+
+    with transaction.atomic():
+        SchemeSimilarity.objects.filter(scheme_type=scheme_type).delete()
+        SchemeSimilarity.objects.bulk_create(similarities, batch_size=WRITE_BATCH_SIZE)
+
+    built = len({similarity.scheme_id for similarity in similarities})
+    logger.info(f"Similar schemes built for {scheme_type}: {built} schemes, {len(similarities)} rows")
+    return built
+
+
+def similar_schemes(scheme_type, scheme_id):
+    """
+    Listed catalog entries similar to one scheme, most similar first.
+
+    One query: the entries are picked and ranked by subqueries on the
+    (scheme_type, scheme_id, ...) unique indexes of SchemeSimilarity.
+    Neighbours unlisted since the last build are left out.
+    """
+    neighbours = SchemeSimilarity.objects.filter(scheme_type=scheme_type, scheme_id=scheme_id)
+    neighbour = neighbours.filter(similar_scheme_id=OuterRef("scheme_id")).order_by()
+    return list(
+        CatalogEntry.objects
+        .listed()
+        .filter(scheme_type=scheme_type, scheme_id__in=neighbours.values("similar_scheme_id"))
+        .annotate(
+            similarity_rank=Subquery(neighbour.values("rank")[:1]),
+            similarity_distance=Subquery(neighbour.values("distance")[:1]),
+        )
+        .order_by("similarity_rank")
+    )
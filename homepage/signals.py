@@ -0,0 +1,120 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from funddetails.models import MutualFundScheme
+from homepage.models.providers import AIFProvider, PMSProvider
+from homepage.models.schemes import SCHEME_MODELS, AIFScheme, PMSScheme
+from homepage.models.search import SearchKind
+from homepage.services.catalog_cache import bump_catalog_version
+from homepage.services.catalog_entries import (
+    refresh_catalog_entries,
+    refresh_provider_entries,
+    remove_catalog_entries,
+)
+from homepage.services.net_returns import compute_net_returns
+from homepage.services.search import (
+    PROVIDER_KINDS,
+    PROVIDER_MODELS,
+    SCHEME_KINDS,
+    index_mutual_funds,
+    index_schemes,
+    reindex_provider,
+    remove_documents,
+)
+
+# Models whose rows feed the cached catalog pages
+CATALOG_MODELS = (PMSProvider, AIFProvider, PMSScheme, AIFScheme)
+
+
+# ==========================================================
+# INVALIDATE CATALOG CACHE ON SCHEME / PROVIDER WRITES
+# ==========================================================
+def invalidate_catalog(sender, **kwargs):
+    # Bump after commit so a concurrent request cannot re-cache the
+    # pre-commit rows under the new version.
+    transaction.on_commit(bump_catalog_version)
+
+
+for model in CATALOG_MODELS:
+    post_save.connect(invalidate_catalog, sender=model, dispatch_uid=f"catalog_save_{model.__name__}")
+    post_delete.connect(invalidate_catalog, sender=model, dispatch_uid=f"catalog_delete_{model.__name__}")
+
+
+# ==========================================================
+# KEEP SEARCH DOCUMENTS IN SYNC
+# ==========================================================
+def sync_scheme_document(sender, instance, **kwargs):
+    scheme_type = SCHEME_TYPES[sender]
+    index_schemes(scheme_type, sender.objects.filter(pk=instance.pk))
+
+
+def remove_scheme_document(sender, instance, **kwargs):
+    remove_documents(SCHEME_KINDS[SCHEME_TYPES[sender]], [instance.pk])
+
+
+def sync_provider_documents(sender, instance, **kwargs):
+    # After commit, so scheme ranks reflect the priority update BaseProvider.save()
+    # runs once this signal has fired
+    transaction.on_commit(lambda: reindex_provider(PROVIDER_TYPES[sender], instance))
+
+
+def remove_provider_document(sender, instance, **kwargs):
+    # The provider's schemes are cascade-deleted, each removing its own document
+    remove_documents(PROVIDER_KINDS[PROVIDER_TYPES[sender]], [instance.pk])
+
+
+def sync_mutual_fund_document(sender, instance, **kwargs):
+    index_mutual_funds(MutualFundScheme.objects.filter(pk=instance.pk))
+
+
+def remove_mutual_fund_document(sender, instance, **kwargs):
+    remove_documents(SearchKind.MF, [instance.pk])
+
+
+# ==========================================================
+# RECOMPUTE NET-OF-FEE RETURNS
+# ==========================================================
+def sync_net_returns(sender, instance, **kwargs):
+    # Connected before the catalog entry handler, which copies the result
+    compute_net_returns(SCHEME_TYPES[sender], sender.objects.filter(pk=instance.pk))
+
+
+# ==========================================================
+# KEEP CATALOG ENTRIES IN SYNC
+# ==========================================================
+def sync_catalog_entry(sender, instance, **kwargs):
+    refresh_catalog_entries(SCHEME_TYPES[sender], sender.objects.filter(pk=instance.pk))
+
+
+def remove_catalog_entry(sender, instance, **kwargs):
+    remove_catalog_entries(SCHEME_TYPES[sender], [instance.pk])
+
+
+def sync_provider_entries(sender, instance, **kwargs):
+    # After commit, like the search documents, to pick up the re-ranked schemes
+    transaction.on_commit(lambda: refresh_provider_entries(PROVIDER_TYPES[sender], instance))
+
+
+SCHEME_TYPES = {model: scheme_type for scheme_type, model in SCHEME_MODELS.items()}
+PROVIDER_TYPES = {model: scheme_type for scheme_type, model in PROVIDER_MODELS.items()}
+
+for model in SCHEME_TYPES:
+    post_save.connect(sync_scheme_document, sender=model, dispatch_uid=f"search_save_{model.__name__}")
+    post_delete.connect(remove_scheme_document, sender=model, dispatch_uid=f"search_delete_{model.__name__}")
+
+for model in PROVIDER_TYPES:
+    post_save.connect(sync_provider_documents, sender=model, dispatch_uid=f"search_save_{model.__name__}")
+    post_delete.connect(remove_provider_document, sender=model, dispatch_uid=f"search_delete_{model.__name__}")
+
+for model in SCHEME_TYPES:
+    post_save.connect(sync_net_returns, sender=model, dispatch_uid=f"net_returns_save_{model.__name__}")
+
+for model in SCHEME_TYPES:
+    post_save.connect(sync_catalog_entry, sender=model, dispatch_uid=f"entry_save_{model.__name__}")
+    post_delete.connect(remove_catalog_entry, sender=model, dispatch_uid=f"entry_delete_{model.__name__}")
+
+for model in PROVIDER_TYPES:
+    post_save.connect(sync_provider_entries, sender=model, dispatch_uid=f"entry_save_{model.__name__}")
+
+post_save.connect(sync_mutual_fund_document, sender=MutualFundScheme, dispatch_uid="search_save_MutualFundScheme")
+post_delete.connect(remove_mutual_fund_document, sender=MutualFundScheme, dispatch_uid="search_delete_MutualFundScheme")
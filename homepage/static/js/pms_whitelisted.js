@@ -4,43 +4,81 @@
 
 let ALL_SCHEMES = [];
 let CURRENT_FILTER = "all";
-let CURRENT_SORT = "returns";
+let CURRENT_SORT = "-one_year_return";
+let NEXT_CURSOR = null;
+const PAGE_SIZE = 50;
+const MOST_WATCHED_COUNT = 6;
+const SEARCH_DELAY_MS = 250;
+let SEARCH_TIMER = null;
+let FETCH_SEQ = 0;
 
 /* =====================================================
    INIT
    ===================================================== */
 document.addEventListener("DOMContentLoaded", () => {
+  fetchMostWatched();
   fetchSchemes();
   bindUIEvents();
 });
 
 /* =====================================================
-   FETCH DATA
+   FETCH DATA (cursor paginated, searched, sorted and filtered by the API)
    ===================================================== */
-function fetchSchemes() {
-  fetch(window.PMS_DATA_URL)
+function fetchSchemes(cursor = null) {
+  const params = new URLSearchParams({ limit: PAGE_SIZE, sort: CURRENT_SORT });
+  const query = document.getElementById("search-input").value.trim();
+  if (query) params.set("q", query);
+  if (CURRENT_FILTER !== "all") params.set("category", currentCategoryLabel());
+  if (cursor) params.set("cursor", cursor);
+  const seq = ++FETCH_SEQ;
+
+  fetch(`${window.PMS_DATA_URL}?${params}`)
     .then(res => res.json())
     .then(data => {
-      ALL_SCHEMES = data.schemes || [];
-      renderMostWatched();
+      // A newer search / filter / sort replaced this request
+      if (seq !== FETCH_SEQ) return;
+      const page = data.schemes || [];
+      ALL_SCHEMES = cursor ? ALL_SCHEMES.concat(page) : page;
+      NEXT_CURSOR = data.next_cursor || null;
       renderTable();
+      renderPagination();
     })
     .catch(err => {
       console.error("Failed to load PMS data", err);
     });
 }
 
+// Across every category, whatever the table is filtered to
+function fetchMostWatched() {
+  const params = new URLSearchParams({ limit: MOST_WATCHED_COUNT, sort: "-one_year_return" });
+
+  fetch(`${window.PMS_DATA_URL}?${params}`)
+    .then(res => res.json())
+    .then(data => renderMostWatched(data.schemes || []))
+    .catch(err => {
+      console.error("Failed to load top PMS schemes", err);
+    });
+}
+
+function currentCategoryLabel() {
+  const active = document.querySelector(".pms-watched-filters button.active");
+  return active ? active.dataset.filter : CURRENT_FILTER;
+}
+
 /* =====================================================
    EVENT BINDINGS
    ===================================================== */
 function bindUIEvents() {
-  // Search
-  document.getElementById("search-input").addEventListener("input", renderTable);
+  // Search (from the first page, once typing pauses)
+  document.getElementById("search-input").addEventListener("input", () => {
+    clearTimeout(SEARCH_TIMER);
+    SEARCH_TIMER = setTimeout(() => fetchSchemes(), SEARCH_DELAY_MS);
+  });
 
   // Sort
   document.getElementById("sort-select").addEventListener("change", e => {
     CURRENT_SORT = e.target.value;
-    renderTable();
+    fetchSchemes();
   });
 
   // Category filters
@@ -51,22 +89,18 @@ function bindUIEvents() {
 
       btn.classList.add("active");
       CURRENT_FILTER = btn.dataset.filter.toLowerCase();
-      renderTable();
+      fetchSchemes();
     });
   });
 }
 
 /* =====================================================
-   MOST WATCHED SCHEMES (TOP 6)
+   MOST WATCHED SCHEMES (TOP 6 BY 1Y RETURN, FROM THE API)
    ===================================================== */
-function renderMostWatched() {
+function renderMostWatched(topSchemes) {
   const grid = document.getElementById("pms-watched-grid");
   grid.innerHTML = "";
 
-  const topSchemes = [...ALL_SCHEMES]
-    .sort((a, b) => (b.one_year_return || 0) - (a.one_year_return || 0))
-    .slice(0, 6);
-
   topSchemes.forEach(s => {
     grid.innerHTML += `
       <div class="pms-watched-card" onclick="openModal('${s.name}', '${s.provider}')">
@@ -100,10 +134,8 @@ function renderTable() {
 
   tbody.innerHTML = "";
 
-  let filtered = filterSchemes();
-  filtered = sortSchemes(filtered);
-
-  if (filtered.length === 0) {
+  // Already searched, filtered and sorted by the API; pages are appended in order
+  if (ALL_SCHEMES.length === 0) {
     tbody.innerHTML = `
       <tr>
         <td colspan="6" class="pms-empty">No schemes found</td>
@@ -112,7 +144,7 @@ function renderTable() {
     return;
   }
 
-  filtered.forEach(s => {
+  ALL_SCHEMES.forEach(s => {
     tbody.innerHTML += `
       <tr onclick="openModal('${s.name}', '${s.provider}')">
         <td>${s.name || "—"}</td>
@@ -127,33 +159,19 @@ function renderTable() {
 }
 
 /* =====================================================
-   FILTER & SORT
+   PAGINATION ("Load more" follows next_cursor)
    ===================================================== */
-function filterSchemes() {
-  const query = document.getElementById("search-input").value.toLowerCase();
-
-  return ALL_SCHEMES.filter(s => {
-    const matchesSearch =
-      (s.name || "").toLowerCase().includes(query) ||
-      (s.provider || "").toLowerCase().includes(query);
-
-    const matchesCategory =
-      CURRENT_FILTER === "all" ||
-      (s.category || "").toLowerCase() === CURRENT_FILTER;
+function renderPagination() {
+  const controls = document.getElementById("pagination-controls");
+  controls.innerHTML = "";
 
-    return matchesSearch && matchesCategory;
-  });
-}
-
-function sortSchemes(data) {
-  if (CURRENT_SORT === "name") {
-    return data.sort((a, b) => (a.name || "").localeCompare(b.name || ""));
-  }
+  if (!NEXT_CURSOR) return;
 
-  // Default: sort by returns
-  return data.sort(
-    (a, b) => (b.one_year_return || 0) - (a.one_year_return || 0)
-  );
+  const button = document.createElement("button");
+  button.className = "pms-select";
+  button.textContent = "Load more";
+  button.addEventListener("click", () => fetchSchemes(NEXT_CURSOR));
+  controls.appendChild(button);
 }
 
 /* =====================================================
@@ -1,3 +1,470 @@
-from django.test import TestCase
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from importlib import import_module
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+
+from django.apps import apps
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db.models import F
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from homepage.models import CatalogVersion, PMSProvider, PMSScheme, SchemeType, SearchDocument, SearchKind
+from homepage.services.catalog_cache import (
+    CATALOG_VERSION_KEY,
+    bump_catalog_version,
+    cache_catalog_page,
+    catalog_cache_key,
+)
+from homepage.services.fee_parsing import parse_percent
+from homepage.services.net_returns import compute_net_returns, net_of_fee_returns
+from homepage.services.scheme_import import import_scheme_file
+from homepage.services.search import search_documents
+from homepage.services.similarity import build_features, nearest_neighbours
+
+
+# ======================================================
+# CATALOG PAGE CACHE
+# ======================================================
+class CatalogPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.calls = 0
+
+    def get(self, view, path="/catalog/"):
+        request = self.factory.get(path)
+        request.user = AnonymousUser()
+        return view(request)
+
+    def test_hit_restores_headers(self):
+        @cache_catalog_page
+        def view(request):
+            self.calls += 1
+            response = HttpResponse("page", content_type="text/plain")
+            response["X-Catalog"] = "1"
+            return response
+
+        self.get(view)
+        response = self.get(view)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(response.content, b"page")
+        self.assertEqual(response["Content-Type"], "text/plain")
+        self.assertEqual(response["X-Catalog"], "1")
+
+    def test_response_using_csrf_token_is_not_stored(self):
+        @cache_catalog_page
+        def view(request):
+            self.calls += 1
+            return HttpResponse(get_token(request))
+
+        first = self.get(view)
+        second = self.get(view)
+
+        self.assertEqual(self.calls, 2)
+        self.assertNotEqual(first.content, second.content)
+
+    def test_response_setting_cookie_is_not_stored(self):
+        @cache_catalog_page
+        def view(request):
+            self.calls += 1
+            response = HttpResponse("page")
+            response.set_cookie("visitor", str(self.calls))
+            return response
+
+        self.get(view)
+        self.get(view)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_free_text_query_is_not_stored(self):
+        @cache_catalog_page
+        def view(request):
+            self.calls += 1
+            return HttpResponse("page")
+
+        self.get(view, "/catalog/?q=alp")
+        self.get(view, "/catalog/?q=alp")
+
+        self.assertEqual(self.calls, 2)
+
+    def test_cached_page_has_no_csrf_token(self):
+        url = reverse("homepage:pms_whitelisted")
+
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+
+        self.assertNotContains(first, "csrf-token-holder")
+        self.assertNotIn("csrftoken", first.cookies)
+        self.assertEqual(first.content, second.content)
+
+
+# ======================================================
+# CATALOG VERSION / VALIDATORS
+# ======================================================
+class CatalogVersionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("homepage:pms_whitelisted")
+
+    def test_matching_etag_gets_304(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_bump_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        bump_catalog_version()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_bump_from_another_process_is_seen(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        # A management command bumps the row, not this process's cache;
+        # the worker re-reads the row once its cached version expires
+        CatalogVersion.objects.filter(pk=1).update(version=F("version") + 1)
+        cache.delete(CATALOG_VERSION_KEY)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+    def test_deploy_changes_validators_and_cache_key(self):
+        first = self.client.get(self.url)
+        key = catalog_cache_key("page")
+
+        # New code, same catalog data
+        released = timezone.now() + timedelta(days=1)
+        with mock.patch("homepage.services.catalog_cache.CATALOG_RELEASE", "next"), \
+                mock.patch("homepage.services.catalog_cache.get_release_time", return_value=released):
+            by_etag = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+            by_date = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+            self.assertNotEqual(catalog_cache_key("page"), key)
+
+        self.assertEqual(by_etag.status_code, 200)
+        self.assertEqual(by_date.status_code, 200)
+        self.assertNotEqual(by_etag["ETag"], first["ETag"])
+
+
+# ======================================================
+# SCHEME IMPORT
+# ======================================================
+class SchemeImportFeeTests(TestCase):
+    def setUp(self):
+        PMSProvider.objects.create(name="Alpha Capital", shortname="ALPHA")
+
+    def import_csv(self, text):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pms.csv"
+            path.write_text(text, encoding="utf-8")
+            return import_scheme_file(path, SchemeType.PMS)
+
+    def test_nil_fees_parse_to_zero_on_import_and_save(self):
+        result = self.import_csv(
+            "provider_shortname,scheme_code,ia_name,setup_fees,fixed_fees,variable_fees\n"
+            "ALPHA,alpha-growth,Alpha Growth,Nil,NIL,None\n"
+        )
+        imported = PMSScheme.objects.get(scheme_code="alpha-growth")
+
+        saved = PMSScheme.objects.create(
+            provider_id="ALPHA", scheme_code="alpha-value", ia_name="Alpha Value",
+            setup_fees="Nil", fixed_fees="NIL", variable_fees="None",
+        )
+
+        self.assertEqual(result.inserted, 1)
+        for scheme in (imported, saved):
+            self.assertEqual(scheme.setup_fees, "Nil")
+            self.assertEqual(scheme.setup_fee_pct, Decimal("0"))
+            self.assertEqual(scheme.fixed_fee_pct, Decimal("0"))
+            self.assertEqual(scheme.variable_fee_pct, Decimal("0"))
+            self.assertEqual(scheme.total_fee_pct, Decimal("0"))
+
+    def test_amounts_and_ratios_are_not_read_as_percentages(self):
+        self.assertEqual(parse_percent("1.25"), Decimal("1.25"))
+        self.assertEqual(parse_percent("100"), Decimal("100"))
+        for text in ("25000", "Rs 25,000 + GST", "2/20", "150%"):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_percent(text))
+
+        saved = PMSScheme.objects.create(provider_id="ALPHA", scheme_code="alpha-value", setup_fees="25000")
+
+        self.assertIsNone(PMSScheme.objects.get(pk=saved.pk).setup_fee_pct)
+
+    def test_placeholders_stay_empty_outside_fee_columns(self):
+        self.import_csv(
+            "provider_shortname,scheme_code,ia_name,strategy_name,1y_return,setup_fees\n"
+            "ALPHA,alpha-growth,Alpha Growth,NA,-,\n"
+        )
+        scheme = PMSScheme.objects.get(scheme_code="alpha-growth")
+
+        self.assertIsNone(scheme.strategy_name)
+        self.assertIsNone(scheme.one_year_return)
+        self.assertIsNone(scheme.setup_fees)
+        self.assertIsNone(scheme.setup_fee_pct)
+
+
+class SchemeCodeBackfillTests(TestCase):
+    def test_import_updates_schemes_entered_before_scheme_code(self):
+        PMSProvider.objects.create(name="Alpha Capital", shortname="ALPHA")
+        scheme = PMSScheme.objects.create(provider_id="ALPHA", ia_name="Alpha Growth", strategy_name="NA")
+        duplicate = PMSScheme.objects.create(provider_id="ALPHA", ia_name="Alpha Growth")
+
+        migration = import_module("homepage.migrations.0003_aifscheme_scheme_code_pmsscheme_scheme_code")
+        migration.backfill_scheme_code(apps, None)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pms.csv"
+            path.write_text("provider_shortname,ia_name,aum\nALPHA,Alpha Growth,100\n", encoding="utf-8")
+            result = import_scheme_file(path, SchemeType.PMS)
+
+        self.assertEqual((result.inserted, result.updated), (0, 1))
+        self.assertEqual(PMSScheme.objects.get(pk=scheme.pk).aum, Decimal("100"))
+        self.assertIsNone(PMSScheme.objects.get(pk=duplicate.pk).scheme_code)
+
+
+# ======================================================
+# NET-OF-FEE RETURNS
+# ======================================================
+class NetReturnTests(SimpleTestCase):
+    def net(self, gross, years, fixed=0.0, setup=0.0, performance=0.0, hurdle=0.0, catch_up=False):
+        return float(net_of_fee_returns(
+            np.array([gross]), np.array([float(years)]), np.array([fixed]), np.array([setup]),
+            np.array([performance]), np.array([hurdle]), np.array([catch_up]),
+        )[0])
+
+    def test_hurdle_without_catch_up(self):
+        # After the 2% fee: 17.6%; 20% of the 7.6% above the hurdle is 1.52%
+        self.assertAlmostEqual(self.net(20, 1, fixed=2, performance=20, hurdle=10), 16.08)
+        self.assertAlmostEqual(self.net(8, 1, performance=20, hurdle=10), 8.0)
+
+    def test_hurdle_with_catch_up(self):
+        # Cleared well past the hurdle: 20% of the whole 17.6%
+        self.assertAlmostEqual(self.net(20, 1, fixed=2, performance=20, hurdle=10, catch_up=True), 14.08)
+        # Inside the catch-up zone: everything above the 10% hurdle
+        self.assertAlmostEqual(self.net(12, 1, performance=20, hurdle=10, catch_up=True), 10.0)
+        self.assertAlmostEqual(self.net(8, 1, performance=20, hurdle=10, catch_up=True), 8.0)
+
+    def test_fees_compound_yearly_and_setup_is_charged_once(self):
+        expected = ((1 - 0.03) * (1.2 * 0.98) ** 3) ** (1 / 3) - 1
+
+        self.assertAlmostEqual(self.net(20, 3, fixed=2, setup=3), expected * 100)
+
+    def test_short_horizons_pro_rate_fee_and_hurdle(self):
+        # 6M: 1% fee, 5% hurdle. 10% gross -> 8.9%, 20% of the 3.9% excess
+        self.assertAlmostEqual(self.net(10, 0.5, fixed=2, performance=20, hurdle=10), 8.12)
+
+    def test_missing_gross_stays_missing(self):
+        self.assertTrue(np.isnan(self.net(np.nan, 1, fixed=2)))
+
+
+class ComputeNetReturnsTests(TestCase):
+    def test_stores_net_returns_only_for_schemes_with_fees(self):
+        PMSProvider.objects.create(name="Alpha Capital", shortname="ALPHA")
+        charged = PMSScheme.objects.create(
+            provider_id="ALPHA", scheme_code="alpha-growth", one_year_return=20.0,
+            fixed_fees="2%", variable_fees="20%", hurdle="10%",
+        )
+        unknown = PMSScheme.objects.create(provider_id="ALPHA", scheme_code="alpha-value", one_year_return=20.0)
+
+        compute_net_returns(SchemeType.PMS)
+
+        self.assertAlmostEqual(PMSScheme.objects.get(pk=charged.pk).net_one_year_return, 16.08)
+        self.assertIsNone(PMSScheme.objects.get(pk=unknown.pk).net_one_year_return)
+
+
+# ======================================================
+# SIMILAR SCHEMES
+# ======================================================
+class NearestNeighbourTests(SimpleTestCase):
+    def test_hand_checked_query(self):
+        points = np.array([[0.0], [1.0], [3.0], [7.0]])
+        ids = np.array([10, 11, 12, 13])
+
+        positions, distances = nearest_neighbours(points[:1], ids[:1], points, ids, k=2)
+
+        # Itself (id 10) is skipped
+        self.assertEqual(ids[positions[0]].tolist(), [11, 12])
+        self.assertEqual(distances[0].tolist(), [1.0, 3.0])
+
+    def test_blocks_match_brute_force(self):
+        rng = np.random.default_rng(11)
+        features = rng.normal(size=(23, 4))
+        ids = np.arange(100, 123)
+        candidates = features[::2]
+        candidate_ids = ids[::2]
+
+        positions, distances = nearest_neighbours(features, ids, candidates, candidate_ids, k=3, block_size=5)
+
+        for row in range(len(ids)):
+            brute = sorted(
+                (np.linalg.norm(features[row] - candidate), position)
+                for position, candidate in enumerate(candidates)
+                if candidate_ids[position] != ids[row]
+            )[:3]
+            self.assertEqual(positions[row].tolist(), [position for _, position in brute])
+            np.testing.assert_allclose(distances[row], [distance for distance, _ in brute])
+
+    def test_short_candidate_list_is_padded(self):
+        positions, distances = nearest_neighbours(
+            np.zeros((1, 2)), np.array([1]), np.zeros((2, 2)), np.array([1, 2]), k=2
+        )
+
+        self.assertEqual(distances[0, 0], 0.0)
+        self.assertEqual(distances[0, 1], np.inf)
+
+    def test_other_category_costs_the_category_weight(self):
+        returns = np.array([[10.0, 20.0], [10.0, 20.0], [12.0, np.nan]])
+
+        features = build_features(returns, ["Equity", "Debt", None])
+
+        self.assertAlmostEqual(float(np.linalg.norm(features[0] - features[1])), 1.5)
+        # A missing return sits at the horizon mean
+        self.assertEqual(features[2, 1], 0.0)
+
+
+# ======================================================
+# SEARCH
+# ======================================================
+class SearchRankingTests(TestCase):
+    def test_best_match_wins_wherever_it_was_indexed(self):
+        SearchDocument.objects.bulk_create(
+            SearchDocument(kind=SearchKind.MF, object_id=pk, title=f"Fund {pk}", strategy="Alpha equity")
+            for pk in range(1, 501)
+        )
+        SearchDocument.objects.create(kind=SearchKind.PMS, object_id=1, title="Alpha Growth")
+
+        results = search_documents("alph", limit=1)
+
+        self.assertEqual([result["title"] for result in results], ["Alpha Growth"])
+
+
+    def test_migration_indexes_existing_catalog(self):
+        PMSProvider.objects.create(name="Alpha Capital", shortname="ALPHA")
+        PMSScheme.objects.create(provider_id="ALPHA", scheme_code="alpha-growth", ia_name="Alpha Growth")
+        SearchDocument.objects.all().delete()
+
+        migration = import_module("homepage.migrations.0006_searchdocument")
+        migration.backfill_search_documents(apps, None)
+
+        self.assertEqual(
+            {(result["kind"], result["title"]) for result in search_documents("alpha")},
+            {("PMS_PROVIDER", "Alpha Capital"), ("PMS", "Alpha Growth")},
+        )
+
+    def test_autocomplete_is_not_page_cached(self):
+        SearchDocument.objects.create(kind=SearchKind.PMS, object_id=1, title="Alpha Growth")
+        url = reverse("homepage:search_api")
+
+        self.client.get(url, {"q": "alp"})
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"q": "alp"})
+
+        self.assertEqual(len(response.json()["results"]), 1)
+
+
+# ======================================================
+# SCHEME DETAIL
+# ======================================================
+class SchemeDetailTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        PMSProvider.objects.create(name="Alpha Capital", shortname="ALPHA")
+        self.scheme = PMSScheme.objects.create(
+            provider_id="ALPHA", scheme_code="alpha-growth", ia_name="Alpha Growth", one_year_return=20.0,
+        )
+        self.url = reverse("homepage:pms_scheme", args=[self.scheme.pk])
+
+    def test_bulk_net_return_update_reaches_cached_fragment(self):
+        self.client.get(self.url)
+
+        # Like compute_net_returns: no updated_at change, then a version bump
+        PMSScheme.objects.filter(pk=self.scheme.pk).update(net_one_year_return=12.345)
+        bump_catalog_version()
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "12.35%")
+
+
+# ======================================================
+# SCHEME API – SORT / FILTER
+# ======================================================
+class SchemeApiSortTests(TestCase):
+    RETURNS = [30.0, None, 10.0, 20.0, 10.0]
+
+    def setUp(self):
+        cache.clear()
+        PMSProvider.objects.create(name="Alpha Capital", shortname="ALPHA", is_whitelisted=True)
+        for index, one_year_return in enumerate(self.RETURNS):
+            PMSScheme.objects.create(
+                provider_id="ALPHA",
+                scheme_code=f"alpha-{index}",
+                ia_name=f"Alpha {index}",
+                category="EQUITY" if index % 2 else "Equity",
+                one_year_return=one_year_return,
+            )
+
+    def walk(self, url, **params):
+        rows, cursor = [], None
+        while True:
+            query = {**params, **({"cursor": cursor} if cursor else {})}
+            data = self.client.get(url, query).json()
+            rows += data["schemes"]
+            cursor = data["next_cursor"]
+            if not cursor:
+                return rows
+
+    def test_pages_follow_the_sort_with_nulls_last(self):
+        url = reverse("homepage:pms_whitelisted_data")
+
+        rows = self.walk(url, sort="-one_year_return", limit=2)
+
+        self.assertEqual([row["one_year_return"] for row in rows], [30.0, 20.0, 10.0, 10.0, None])
+        self.assertEqual(len({row["id"] for row in rows}), len(self.RETURNS))
+
+    def test_top_list_covers_every_page(self):
+        url = reverse("homepage:scheme_list_api", args=["pms"])
+
+        data = self.client.get(url, {"sort": "-one_year_return", "limit": 1}).json()
+
+        self.assertEqual(data["schemes"][0]["one_year_return"], 30.0)
+
+    def test_cursor_from_another_sort_is_rejected(self):
+        url = reverse("homepage:scheme_list_api", args=["pms"])
+        cursor = self.client.get(url, {"sort": "name", "limit": 1}).json()["next_cursor"]
+
+        response = self.client.get(url, {"sort": "-one_year_return", "cursor": cursor})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_category_ignores_case(self):
+        url = reverse("homepage:scheme_list_api", args=["pms"])
+
+        data = self.client.get(url, {"category": "equity", "limit": 10}).json()
+
+        self.assertEqual(len(data["schemes"]), len(self.RETURNS))
+
+    def test_search_reaches_schemes_beyond_the_first_page(self):
+        url = reverse("homepage:pms_whitelisted_data")
+
+        by_name = self.client.get(url, {"q": "ALPHA 3", "limit": 1}).json()
+        by_provider = self.walk(url, q="capital", limit=2)
+
+        self.assertEqual([row["name"] for row in by_name["schemes"]], ["Alpha 3"])
+        self.assertEqual(len(by_provider), len(self.RETURNS))
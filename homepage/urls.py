@@ -1,5 +1,6 @@
 # homepage/urls.py
 from django.urls import path
+from homepage.models.schemes import SchemeType
 from homepage.views import (
     home,
     get_in_touch,
@@ -13,6 +14,14 @@ from homepage.views import (
     aif,
     aif_top,
     aif_compare,
+    scheme_compare,
+    provider_list,
+    provider_detail,
+    scheme_detail,
+    scheme_list_api,
+    catalog_list_api,
+    facets_api,
+    search_api,
 )
 
 app_name = "homepage"
@@ -34,9 +43,24 @@ urlpatterns = [
     path("pms/compare/", pms_compare, name="pms_compare"),
     path("pms/whitelisted/", pms_whitelisted, name="pms_whitelisted"),
     path("pms/whitelisted/data/", pms_whitelisted_data, name="pms_whitelisted_data"),
+    path("pms/providers/", provider_list, {"scheme_type": SchemeType.PMS}, name="pms_providers"),
+    path("pms/providers/<str:shortname>/", provider_detail, {"scheme_type": SchemeType.PMS}, name="pms_provider"),
+    path("pms/schemes/<int:pk>/", scheme_detail, {"scheme_type": SchemeType.PMS}, name="pms_scheme"),
 
     # AIF
     path("aif/", aif, name="aif"),
     path("aif/top/", aif_top, name="aif_top"),
     path("aif/compare/", aif_compare, name="aif_compare"),
+    path("aif/providers/", provider_list, {"scheme_type": SchemeType.AIF}, name="aif_providers"),
+    path("aif/providers/<str:shortname>/", provider_detail, {"scheme_type": SchemeType.AIF}, name="aif_provider"),
+    path("aif/schemes/<int:pk>/", scheme_detail, {"scheme_type": SchemeType.AIF}, name="aif_scheme"),
+
+    # Compare selected schemes
+    path("compare/", scheme_compare, name="scheme_compare"),
+
+    # API v1
+    path("api/v1/schemes/<str:scheme_type>/", scheme_list_api, name="scheme_list_api"),
+    path("api/v1/catalog/", catalog_list_api, name="catalog_list_api"),
+    path("api/v1/facets/<str:scheme_type>/", facets_api, name="facets_api"),
+    path("api/v1/search/", search_api, name="search_api"),
 ]
@@ -1 +1,2 @@
 from .generic_views import *
+from .api_views import *
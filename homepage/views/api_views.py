@@ -0,0 +1,147 @@
+# homepage/views/api_views.py
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_GET
+
+from homepage.models.schemes import SchemeType
+from homepage.models.search import SearchKind
+from homepage.services.catalog_cache import cache_catalog_page, catalog_condition
+from homepage.services.catalog_query import CatalogQueryError, fetch_catalog_page, fetch_scheme_page
+from homepage.services.facets import get_facets
+from homepage.services.search import DEFAULT_SEARCH_LIMIT, search_documents
+
+# URL segment -> SchemeType
+API_SCHEME_TYPES = {
+    "pms": SchemeType.PMS,
+    "aif": SchemeType.AIF,
+}
+
+# ?type= value -> SearchKind values
+SEARCH_TYPES = {
+    "pms": [SearchKind.PMS],
+    "aif": [SearchKind.AIF],
+    "mf": [SearchKind.MF],
+    "provider": [SearchKind.PMS_PROVIDER, SearchKind.AIF_PROVIDER],
+}
+
+
+def scheme_page_response(request, scheme_type, whitelisted_only=False):
+    """Serialize one keyset page of schemes, or a 400 for bad parameters"""
+    try:
+        schemes, next_cursor = fetch_scheme_page(
+            scheme_type, request.GET, whitelisted_only=whitelisted_only
+        )
+    except CatalogQueryError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return JsonResponse({"schemes": schemes, "next_cursor": next_cursor})
+
+
+# ======================================================
+# API v1 – SCHEMES
+# ======================================================
+@require_GET
+@catalog_condition
+@cache_catalog_page
+def scheme_list_api(request, scheme_type):
+    """
+    GET /api/v1/schemes/<pms|aif>/
+
+    Query params:
+        fields: comma separated field names (see catalog_query.API_FIELDS)
+        sort: catalog_query.SORT_FIELDS key, "-" prefixed for descending
+            (default priority)
+        limit: page size, max 100
+        cursor: next_cursor from the previous page
+        q: scheme or provider name contains (not cached)
+        category, aif_category, provider, whitelisted,
+        min_<name>, max_<name>: range filters (see catalog_query.RANGE_FILTER_FIELDS)
+    """
+    if scheme_type not in API_SCHEME_TYPES:
+        raise Http404("Unknown scheme type")
+
+    return scheme_page_response(request, API_SCHEME_TYPES[scheme_type])
+
+
+# ======================================================
+# API v1 – COMBINED PMS + AIF CATALOG
+# ======================================================
+@require_GET
+@catalog_condition
+@cache_catalog_page
+def catalog_list_api(request):
+    """
+    GET /api/v1/catalog/
+
+    PMS and AIF schemes in one ranking, read from the CatalogEntry table.
+
+    Query params:
+        type: pms / aif, repeatable (default both)
+        fields: comma separated field names (see catalog_query.CATALOG_API_FIELDS)
+        sort: catalog_query.CATALOG_SORT_FIELDS key, "-" prefixed for
+            descending (default priority)
+        limit: page size, max 100
+        cursor: next_cursor from the previous page
+        q: scheme or provider name contains (not cached)
+        category, aif_category, provider, whitelisted,
+        min_<name>, max_<name>: range filters (see catalog_query.RANGE_FILTER_FIELDS)
+    """
+    try:
+        entries, next_cursor = fetch_catalog_page(request.GET)
+    except CatalogQueryError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return JsonResponse({"schemes": entries, "next_cursor": next_cursor})
+
+
+# ======================================================
+# API v1 – FACETS
+# ======================================================
+@require_GET
+@catalog_condition
+def facets_api(request, scheme_type):
+    """
+    GET /api/v1/facets/<pms|aif>/
+
+    Scheme counts per category, AIF category, provider and open for
+    investment over the compare-page schemes. Served from the facet cache,
+    which is rebuilt once per catalog change.
+    """
+    if scheme_type not in API_SCHEME_TYPES:
+        raise Http404("Unknown scheme type")
+
+    return JsonResponse({"facets": get_facets(API_SCHEME_TYPES[scheme_type])})
+
+
+# ======================================================
+# API v1 – SEARCH / AUTOCOMPLETE
+# ======================================================
+@require_GET
+@catalog_condition
+def search_api(request):
+    """
+    GET /api/v1/search/?q=hdfc fle
+
+    Not page-cached: autocomplete asks for a new prefix on every keystroke,
+    and storing those would evict the cached catalog pages.
+
+    Query params:
+        q: search text; every word is matched as a prefix
+        type: comma separated pms, aif, mf, provider (default all)
+        limit: max results, up to 25
+    """
+    kinds = []
+    for name in request.GET.get("type", "").split(","):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in SEARCH_TYPES:
+            return JsonResponse({"error": f"Unknown type: {name}"}, status=400)
+        kinds.extend(SEARCH_TYPES[name])
+
+    try:
+        limit = int(request.GET.get("limit", DEFAULT_SEARCH_LIMIT))
+    except ValueError:
+        return JsonResponse({"error": "limit must be an integer"}, status=400)
+
+    results = search_documents(request.GET.get("q", ""), kinds=kinds, limit=limit)
+    return JsonResponse({"results": results})
@@ -1,10 +1,40 @@
 # homepage/views.py
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render
 from django.db.models import Case, When, Value, IntegerField
 
 from homepage.models.providers import PMSProvider, AIFProvider
-from homepage.models.schemes import PMSScheme, AIFScheme
-from django.http import JsonResponse
+from homepage.models.schemes import PMSScheme, AIFScheme, SchemeType
+from homepage.services.catalog_cache import (
+    CATALOG_CACHE_TIMEOUT,
+    cache_catalog_page,
+    catalog_condition,
+    conditional_page,
+    get_catalog_stamp,
+)
+from homepage.services.catalog_query import (
+    CatalogQueryError,
+    compare_page,
+    compare_queryset,
+    toggle_sort_keys,
+)
+from homepage.services.compare import get_comparison, parse_selection
+from homepage.services.providers import get_provider_detail, provider_listing
+from homepage.services.scheme_detail import (
+    get_scheme_detail,
+    scheme_etag,
+    scheme_last_modified,
+    scheme_returns,
+)
+from homepage.services.similarity import similar_schemes
+from homepage.views.api_views import scheme_page_response
+
+# Number of ranked schemes shown on the "top" pages
+TOP_SCHEMES_LIMIT = 12
+
+# Sortable columns on the compare pages (see catalog_query.SORT_FIELDS)
+PMS_COMPARE_SORTS = ("name", "one_year_return", "three_year_return", "net_three_year_return", "aum")
+AIF_COMPARE_SORTS = ("name", "three_year_return", "si_return", "net_si_return", "aum")
 
 
 # ======================================================
@@ -56,6 +86,8 @@ def aif(request):
 # ======================================================
 # PMS – WHITELISTED PROVIDERS
 # ======================================================
+@catalog_condition
+@cache_catalog_page
 def pms_whitelisted(request):
     """
     Whitelisted PMS providers page
@@ -77,38 +109,21 @@ def pms_whitelisted(request):
 # PMS – WHITELISTED DATA (SCHEMES)
 # ======================================================
 
+@catalog_condition
+@cache_catalog_page
 def pms_whitelisted_data(request):
-    schemes = (
-        PMSScheme.objects
-        .filter(
-            is_active=True,
-            open_for_investment=True,
-            provider__is_whitelisted=True,
-            provider__is_active=True,
-        )
-        .select_related("provider")
-        .order_by("effective_priority")
-    )
-
-    data = [
-        {
-            "id": s.id,
-            "name": s.ia_name,
-            "provider": s.provider.name,
-            "category": s.category,
-            "one_year_return": s.one_year_return,
-            "three_year_return": s.three_year_return,
-            "min_inv": s.min_inv_amount,
-        }
-        for s in schemes
-    ]
-
-    return JsonResponse({"schemes": data})
+    """
+    Whitelisted PMS schemes, one keyset page at a time.
+    Accepts the same parameters as the v1 scheme API.
+    """
+    return scheme_page_response(request, SchemeType.PMS, whitelisted_only=True)
 
 
 # ======================================================
 # PMS – TOP / FEATURED
 # ======================================================
+@catalog_condition
+@cache_catalog_page
 def pms_top(request):
     """
     Top PMS providers & schemes
@@ -122,14 +137,13 @@ def pms_top(request):
 
     schemes = (
         PMSScheme.objects
+        .listed()
         .filter(
-            is_active=True,
-            open_for_investment=True,
             provider__is_whitelisted=True,
             provider__is_active=True,
         )
         .select_related("provider")
-        .order_by("effective_priority")
+        .order_by("effective_priority")[:TOP_SCHEMES_LIMIT]
     )
 
     return render(
@@ -145,31 +159,38 @@ def pms_top(request):
 # ======================================================
 # PMS – COMPARE
 # ======================================================
+@catalog_condition
+@cache_catalog_page
 def pms_compare(request):
     """
-    Compare all PMS schemes
+    Compare all PMS schemes.
+    Sorting, filtering and pagination come from the query string,
+    e.g. ?sort=-three_year_return&min_aum=500&page=2
     """
-    schemes = (
-        PMSScheme.objects
-        .filter(is_active=True)
-        .select_related("provider")
-        .order_by(
-            "provider__priority",
-            "scheme_priority",
-            "ia_name",
-        )
-    )
+    schemes = compare_queryset(SchemeType.PMS).select_related("provider")
+
+    try:
+        page, sort = compare_page(schemes, SchemeType.PMS, request.GET)
+    except CatalogQueryError as e:
+        return HttpResponseBadRequest(str(e))
 
     return render(
         request,
         "homepage/pms_compare.html",
-        {"schemes": schemes}
+        {
+            "schemes": page,
+            "page_obj": page,
+            "sort": sort,
+            "sort_links": toggle_sort_keys(sort, PMS_COMPARE_SORTS),
+        }
     )
 
 
 # ======================================================
 # AIF – TOP / SHORTLISTED
 # ======================================================
+@catalog_condition
+@cache_catalog_page
 def aif_top(request):
     """
     Top / shortlisted AIF schemes
@@ -177,11 +198,8 @@ def aif_top(request):
 
     schemes = (
         AIFScheme.objects
-        .filter(
-            is_active=True,
-            open_for_investment=True,
-            provider__is_active=True,
-        )
+        .listed()
+        .filter(provider__is_active=True)
         .select_related("provider")
         .annotate(
             sort_priority=Case(
@@ -192,8 +210,7 @@ def aif_top(request):
         )
         .order_by(
             "sort_priority",
-            "provider__priority",
-            "scheme_priority",
+            "effective_priority",
             "-created_at",
         )
     )
@@ -208,31 +225,145 @@ def aif_top(request):
 # ======================================================
 # AIF – COMPARE
 # ======================================================
+@catalog_condition
+@cache_catalog_page
 def aif_compare(request):
     """
-    Compare all active AIF schemes with active & whitelisted providers
+    Compare all active AIF schemes with active & whitelisted providers.
+    Accepts the same sort / filter / page parameters as pms_compare.
     """
 
-    schemes = (
-        AIFScheme.objects
-        .filter(
-            is_active=True,
-            provider__is_active=True,
-            provider__is_whitelisted=True,
-        )
-        .select_related("provider")
-        .order_by(
-            "provider__priority",
-            "scheme_priority",
-            "ia_name",
-        )
-    )
+    schemes = compare_queryset(SchemeType.AIF).select_related("provider")
+
+    try:
+        page, sort = compare_page(schemes, SchemeType.AIF, request.GET)
+    except CatalogQueryError as e:
+        return HttpResponseBadRequest(str(e))
 
     return render(
         request,
         "homepage/aif_compare.html",
         {
-            "schemes": schemes,
-            "total_schemes": schemes.count(),
+            "schemes": page,
+            "page_obj": page,
+            "total_schemes": page.paginator.count,
+            "sort": sort,
+            "sort_links": toggle_sort_keys(sort, AIF_COMPARE_SORTS),
+        },
+    )
+
+
+# ======================================================
+# PROVIDERS – LISTING / DETAIL (PMS + AIF)
+# ======================================================
+@catalog_condition
+@cache_catalog_page
+def provider_list(request, scheme_type):
+    """
+    Active providers with scheme count, total AUM, average returns and
+    their top schemes; see services/providers.py for the query shape.
+    """
+    return render(
+        request,
+        "homepage/provider_list.html",
+        {
+            "scheme_type": scheme_type,
+            "providers": provider_listing(scheme_type),
+        },
+    )
+
+
+@catalog_condition
+@cache_catalog_page
+def provider_detail(request, scheme_type, shortname):
+    """
+    One provider's aggregates and every listed scheme
+    """
+    provider = get_provider_detail(scheme_type, shortname)
+    if provider is None:
+        raise Http404("Unknown provider")
+
+    return render(
+        request,
+        "homepage/provider_detail.html",
+        {
+            "scheme_type": scheme_type,
+            "provider": provider,
+        },
+    )
+
+
+# ======================================================
+# SCHEME – DETAIL (PMS + AIF)
+# ======================================================
+def _scheme_last_modified(request, scheme_type, pk):
+    # Anonymous GETs only, like cache_catalog_page: signed-in pages carry
+    # per-user state (CSRF token) that must not be revalidated as unchanged.
+    if request.user.is_authenticated:
+        return None
+    # condition() asks for the ETag and Last-Modified separately; look the
+    # timestamps up once per request.
+    if not hasattr(request, "_scheme_last_modified"):
+        request._scheme_last_modified = scheme_last_modified(scheme_type, pk)
+    return request._scheme_last_modified
+
+
+def _scheme_etag(request, scheme_type, pk):
+    last_modified = _scheme_last_modified(request, scheme_type, pk)
+    if last_modified is None:
+        return None
+    return scheme_etag(scheme_type, pk, last_modified)
+
+
+@conditional_page(etag_func=_scheme_etag, last_modified_func=_scheme_last_modified)
+def scheme_detail(request, scheme_type, pk):
+    """
+    One scheme with its provider, fees, fund managers, returns and
+    similar schemes.
+    Unchanged pages are answered with 304; see services/scheme_detail.py.
+    """
+    scheme = get_scheme_detail(scheme_type, pk)
+    if scheme is None:
+        raise Http404("Unknown scheme")
+
+    return render(
+        request,
+        "homepage/scheme_detail.html",
+        {
+            "scheme_type": scheme_type,
+            "scheme": scheme,
+            "returns": scheme_returns(scheme),
+            "similar_schemes": similar_schemes(scheme_type, scheme.pk),
+            "fragment_timeout": CATALOG_CACHE_TIMEOUT,
+            "catalog_stamp": get_catalog_stamp(),
         },
     )
+
+
+# ======================================================
+# COMPARE – SELECTED SCHEMES (PMS + AIF)
+# ======================================================
+@catalog_condition
+def scheme_compare(request):
+    """
+    Side-by-side comparison of hand-picked schemes,
+    e.g. /compare/?ids=pms:12,aif:7 (add &format=json for JSON).
+    The matrix is cached per sorted selection; see services/compare.py.
+    """
+    try:
+        selection = parse_selection(request.GET.get("ids"))
+    except CatalogQueryError as e:
+        if request.GET.get("format") == "json":
+            return JsonResponse({"error": str(e)}, status=400)
+        return HttpResponseBadRequest(str(e))
+
+    comparison = get_comparison(selection)
+
+    if request.GET.get("format") == "json":
+        return JsonResponse(comparison)
+
+    return render(
+        request,
+        "homepage/scheme_compare.html",
+        {"comparison": comparison},
+    )
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import OTPTransaction, OTPPurpose, OTPStatus
+from .models import OTPTransaction, OTPPurpose, OTPStatus, OTPDeliveryOutbox, OTPAuditRecord
 
 class OTPTransactionAdmin(admin.ModelAdmin):
     list_display = ('otp_code', 'get_recipient', 'purpose', 'status', 'created_at', 'sent_at', 'verified_at')
@@ -32,3 +32,23 @@ class OTPTransactionAdmin(admin.ModelAdmin):
     get_recipient.short_description = "Recipient"
 
 admin.site.register(OTPTransaction, OTPTransactionAdmin)
+
+
+class OTPDeliveryOutboxAdmin(admin.ModelAdmin):
+    list_display = ('otp', 'channel', 'purpose', 'email', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status', 'channel', 'created_at')
+    search_fields = ('otp__email', 'otp__phone', 'email', 'phone')
+    readonly_fields = ('otp', 'channel', 'attempts', 'locked_by', 'locked_until', 'last_error', 'created_at', 'sent_at')
+    exclude = ('otp_code',)
+    list_select_related = ('otp',)
+
+admin.site.register(OTPDeliveryOutbox, OTPDeliveryOutboxAdmin)
+
+
+class OTPAuditRecordAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'event', 'purpose', 'email', 'phone', 'ip_address')
+    list_filter = ('event', 'purpose', 'created_at')
+    search_fields = ('email', 'phone')
+    readonly_fields = ('event', 'purpose', 'email', 'phone', 'ip_address', 'created_at')
+
+admin.site.register(OTPAuditRecord, OTPAuditRecordAdmin)
@@ -0,0 +1,209 @@
+"""
+Cache-backed OTP store.
+
+Purposes listed as "cache" in the OTP_STORE_BACKENDS setting keep their live
+OTPs in the Django cache instead of OTPTransaction rows:
+
+    otp:<purpose>:<recipient>              {nonce, code hash, expires_at}, TTL = expiry
+    otp:<purpose>:<recipient>:<nonce>:n    attempts, counted with cache.incr
+    otp:<purpose>:<recipient>:<nonce>:used set once with cache.add on success
+
+A new OTP replaces the recipient's previous one. The code is stored as an
+HMAC, attempts are counted atomically by the cache, and the "used" marker
+makes a code verifiable only once under concurrent submits. Expired OTPs
+simply age out, so this traffic leaves nothing behind in the OTP table;
+only a compact OTPAuditRecord per event is written, off the request path.
+Whenever an OTP is replaced, invalidated, used up or verified, its
+unsent outbox rows are deleted, so the worker never sends a dead code.
+
+All web processes must share the cache (Redis / Memcached): with the
+per-process LocMemCache a code generated by one worker can't be verified by
+another. Delivery does not read the cache: the outbox row carries the code.
+"""
+
+import atexit
+import hashlib
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from .models import OTPAuditRecord, OTPDeliveryOutbox, OutboxStatus
+
+logger = logging.getLogger(__name__)
+
+# Constants
+KEY_PREFIX = "otp"
+STORE_BACKENDS = ("db", "cache")
+
+
+@dataclass
+class CachedOTP:
+    """A cache-stored OTP, shaped like the OTPTransaction fields delivery uses"""
+    otp_code: str
+    purpose: str
+    delivery_method: str
+    expires_at: datetime
+    email: str = None
+    phone: str = None
+    user_id: int = None
+    created_at: datetime = field(default_factory=timezone.now)
+    id = None
+
+    def is_expired(self):
+        return timezone.now() >= self.expires_at
+
+
+def get_store_backend(purpose):
+    """ "db" or "cache", from OTP_STORE_BACKENDS (purpose -> backend)"""
+    backend = getattr(settings, 'OTP_STORE_BACKENDS', {}).get(purpose, "db")
+    if backend not in STORE_BACKENDS:
+        raise ValueError(f"Unknown OTP store backend for {purpose}: {backend}")
+    return backend
+
+
+def store_otp(otp):
+    """Make ``otp`` the recipient's live OTP for its purpose"""
+    key = _entry_key(otp.purpose, otp.email, otp.phone, otp.user_id)
+    ttl = _seconds_left(otp.expires_at)
+    _drop_pending_deliveries(otp.purpose, otp.email, otp.phone)
+    nonce = uuid.uuid4().hex
+    cache.set(f"{key}:{nonce}:n", 0, ttl)
+    cache.set(
+        key,
+        {
+            'nonce': nonce,
+            'code_hash': _code_hash(key, otp.otp_code),
+            'expires_at': otp.expires_at,
+        },
+        ttl,
+    )
+
+
+def verify_cached_otp(otp_code, purpose, email=None, phone=None, user=None, max_attempts=3):
+    """
+    Check a code against the recipient's live cached OTP and consume it.
+
+    Returns:
+        bool: Whether the verification was successful
+    """
+    key = _entry_key(purpose, email, phone, user.pk if user else None)
+    entry = cache.get(key)
+    if not entry or timezone.now() >= entry['expires_at']:
+        return False
+
+    nonce = entry['nonce']
+    try:
+        attempts = cache.incr(f"{key}:{nonce}:n")
+    except ValueError:
+        # Counter evicted: treat the OTP as gone
+        return False
+
+    if attempts > max_attempts or not constant_time_compare(entry['code_hash'], _code_hash(key, otp_code)):
+        if attempts >= max_attempts and _delete_entry(key, nonce):
+            _drop_pending_deliveries(purpose, email, phone)
+        return False
+
+    # Only the first of concurrent correct submits gets the marker
+    if not cache.add(f"{key}:{nonce}:used", 1, _seconds_left(entry['expires_at'])):
+        return False
+    if _delete_entry(key, nonce):
+        _drop_pending_deliveries(purpose, email, phone)
+    return True
+
+
+def invalidate_cached_otp(purpose, email=None, phone=None, user=None):
+    """Drop the recipient's live cached OTP for ``purpose``, if any"""
+    cache.delete(_entry_key(purpose, email, phone, user.pk if user else None))
+    _drop_pending_deliveries(purpose, email, phone)
+
+
+def record_audit(event, purpose, email=None, phone=None, ip_address=None):
+    """
+    Write an OTPAuditRecord in the background (inline when OTP_AUDIT_ASYNC
+    is off, e.g. in tests).
+    """
+    values = {
+        'event': event,
+        'purpose': purpose,
+        'email': email,
+        'phone': phone,
+        'ip_address': ip_address,
+        'created_at': timezone.now(),
+    }
+    if not getattr(settings, 'OTP_AUDIT_ASYNC', True):
+        OTPAuditRecord.objects.create(**values)
+        return
+    _get_audit_executor().submit(_write_audit, values)
+
+
+# Private helper functions
+
+_audit_executor = None
+
+
+def _get_audit_executor():
+    global _audit_executor
+    if _audit_executor is None:
+        # One thread: audit writes are tiny and ordered; the request never waits
+        _audit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otp-audit")
+        atexit.register(_audit_executor.shutdown, wait=True)
+    return _audit_executor
+
+
+def _write_audit(values):
+    # A long-lived thread: recycle its DB connection like a request would
+    close_old_connections()
+    try:
+        OTPAuditRecord.objects.create(**values)
+    except Exception as e:
+        logger.error(f"Failed to write OTP audit record: {str(e)}")
+    finally:
+        close_old_connections()
+
+
+def _entry_key(purpose, email=None, phone=None, user_id=None):
+    recipient = (email or "").strip().lower() or phone or (f"user:{user_id}" if user_id else "")
+    if not recipient:
+        raise ValueError("Must provide either email, phone or user")
+    digest = hashlib.md5(recipient.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{purpose}:{digest}"
+
+
+def _code_hash(key, otp_code):
+    return salted_hmac("otps.cache_store", f"{key}:{otp_code}").hexdigest()
+
+
+def _seconds_left(expires_at):
+    return max(1, int((expires_at - timezone.now()).total_seconds()) + 1)
+
+
+def _delete_entry(key, nonce):
+    # Leave a newer OTP generated in the meantime alone
+    entry = cache.get(key)
+    if entry and entry['nonce'] == nonce:
+        cache.delete(key)
+        return True
+    return False
+
+
+def _drop_pending_deliveries(purpose, email=None, phone=None):
+    # Recipients are matched like _entry_key() keys them: email first
+    if email:
+        recipient = Q(email__iexact=email.strip())
+    elif phone:
+        recipient = Q(phone=phone)
+    else:
+        return
+    OTPDeliveryOutbox.objects.filter(
+        recipient, otp__isnull=True, purpose=purpose, status=OutboxStatus.PENDING
+    ).delete()
+
@@ -0,0 +1,103 @@
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from otps.models import OutboxStatus
+from otps.outbox import (
+    DEFAULT_BATCH_SIZE,
+    OUTBOX_LEASE_SECONDS,
+    claim_deliveries,
+    new_lease_token,
+    process_delivery,
+    process_delivery_args,
+    prune_finished_deliveries,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between prunes of old finished deliveries
+PRUNE_INTERVAL = 60 * 60
+
+
+class Command(BaseCommand):
+    help = "Send queued OTP deliveries from the outbox, with retries and backoff, pruning old finished rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=4,
+            help="Sender processes (default 4). 0 sends in this process.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Deliveries claimed per round (default {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when nothing is due (default 1)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send everything currently due, then exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["processes"] < 0:
+            raise CommandError("--processes cannot be negative")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        if options["processes"] == 0:
+            self._run(None, options)
+            return
+
+        # Spawn, not fork: forked children would share this process's DB
+        # connections. Spawned ones start bare, so each loads Django first.
+        with ProcessPoolExecutor(
+            max_workers=options["processes"],
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        ) as pool:
+            self._run(pool, options)
+
+    def _run(self, pool, options):
+        sent = 0
+        pruned_at = None
+        try:
+            while True:
+                if pruned_at is None or time.monotonic() - pruned_at >= PRUNE_INTERVAL:
+                    prune_finished_deliveries()
+                    pruned_at = time.monotonic()
+
+                token = new_lease_token()
+                claimed = claim_deliveries(token, limit=options["batch_size"], lease_seconds=OUTBOX_LEASE_SECONDS)
+                if not claimed:
+                    if options["once"]:
+                        break
+                    # Don't hold a connection open while idle
+                    connections.close_all()
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                if pool is None:
+                    results = [process_delivery(delivery_id, token) for delivery_id in claimed]
+                else:
+                    results = list(pool.map(process_delivery_args, [(delivery_id, token) for delivery_id in claimed]))
+                round_sent = results.count(OutboxStatus.SENT)
+                sent += round_sent
+                logger.info(f"OTP outbox round: {len(claimed)} claimed, {round_sent} sent")
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f"OTP worker stopped: {sent} deliveries sent"))
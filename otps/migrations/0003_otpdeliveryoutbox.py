@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:03
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('otps', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OTPDeliveryOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(choices=[('EMAIL', 'Email'), ('SMS', 'SMS')], help_text='Channel this row delivers over', max_length=10)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('SENT', 'Sent'), ('FAILED', 'Failed'), ('CANCELLED', 'Cancelled')], default='PENDING', help_text='Current status of this delivery', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='Number of send attempts made')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the row is next due')),
+                ('locked_by', models.CharField(blank=True, help_text='Lease token of the worker sending it', max_length=64, null=True)),
+                ('locked_until', models.DateTimeField(blank=True, help_text="When the worker's lease runs out", null=True)),
+                ('last_error', models.TextField(blank=True, help_text='Error of the last failed attempt', null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('otp', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='otps.otptransaction')),
+            ],
+            options={
+                'verbose_name': 'OTP Delivery',
+                'verbose_name_plural': 'OTP Delivery Outbox',
+                'ordering': ['next_attempt_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='otps_otpdel_status_00edcc_idx'), models.Index(fields=['locked_by'], name='otps_otpdel_locked__e2f5da_idx')],
+            },
+        ),
+    ]
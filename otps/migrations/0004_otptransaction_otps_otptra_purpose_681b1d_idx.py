@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('otps', '0003_otpdeliveryoutbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='otptransaction',
+            index=models.Index(fields=['purpose', 'email', 'status', '-created_at'], name='otps_otptra_purpose_681b1d_idx'),
+        ),
+    ]
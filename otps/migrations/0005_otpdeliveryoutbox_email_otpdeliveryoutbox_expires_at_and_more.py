@@ -0,0 +1,63 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:08
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('otps', '0004_otptransaction_otps_otptra_purpose_681b1d_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='otpdeliveryoutbox',
+            name='email',
+            field=models.EmailField(blank=True, max_length=254, null=True),
+        ),
+        migrations.AddField(
+            model_name='otpdeliveryoutbox',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='otpdeliveryoutbox',
+            name='otp_code',
+            field=models.CharField(blank=True, help_text='Cleared once sent or given up', max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='otpdeliveryoutbox',
+            name='phone',
+            field=models.CharField(blank=True, max_length=15, null=True),
+        ),
+        migrations.AddField(
+            model_name='otpdeliveryoutbox',
+            name='purpose',
+            field=models.CharField(blank=True, choices=[('LOGIN', 'Login Authentication'), ('SIGNUP', 'New Account Creation'), ('PASSWORD_RESET', 'Password Reset'), ('EMAIL_VERIFICATION', 'Email Verification'), ('TRANSACTION_VERIFICATION', 'Transaction Verification'), ('PROFILE_UPDATE', 'Profile Update'), ('OTHER', 'Other Purpose')], max_length=30, null=True),
+        ),
+        migrations.AlterField(
+            model_name='otpdeliveryoutbox',
+            name='otp',
+            field=models.ForeignKey(blank=True, help_text='OTP to deliver; empty for cache-stored OTPs, which carry the payload below', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='otps.otptransaction'),
+        ),
+        migrations.CreateModel(
+            name='OTPAuditRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('purpose', models.CharField(choices=[('LOGIN', 'Login Authentication'), ('SIGNUP', 'New Account Creation'), ('PASSWORD_RESET', 'Password Reset'), ('EMAIL_VERIFICATION', 'Email Verification'), ('TRANSACTION_VERIFICATION', 'Transaction Verification'), ('PROFILE_UPDATE', 'Profile Update'), ('OTHER', 'Other Purpose')], max_length=30)),
+                ('event', models.CharField(choices=[('GENERATED', 'Generated'), ('VERIFIED', 'Verified'), ('FAILED', 'Verification Failed')], max_length=20)),
+                ('email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('phone', models.CharField(blank=True, max_length=15, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'OTP Audit Record',
+                'verbose_name_plural': 'OTP Audit Records',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='otps_otpaud_created_328749_idx'), models.Index(fields=['email', '-created_at'], name='otps_otpaud_email_539b43_idx')],
+            },
+        ),
+    ]
@@ -86,6 +86,8 @@ class OTPTransaction(models.Model):
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['otp_code']),
             models.Index(fields=['status']),
+            # verify_otp(): latest OTP of a recipient for a purpose
+            models.Index(fields=['purpose', 'email', 'status', '-created_at']),
         ]
     
     def __str__(self):
@@ -123,3 +125,102 @@ class OTPTransaction(models.Model):
     def generate_otp(cls, length=6):
         """Generate a random OTP of specified length"""
         return get_random_string(length=length, allowed_chars='0123456789')
+
+
+class OutboxStatus(models.TextChoices):
+    """Define the status of a queued OTP delivery"""
+    PENDING = 'PENDING', 'Pending'
+    SENT = 'SENT', 'Sent'
+    FAILED = 'FAILED', 'Failed'
+    CANCELLED = 'CANCELLED', 'Cancelled'
+
+class OTPDeliveryOutbox(models.Model):
+    """
+    One queued delivery of an OTP over one channel (transactional outbox).
+
+    Rows are written in the same transaction as their OTPTransaction and sent
+    by `manage.py run_otp_worker`, so the request path never waits on SMTP /
+    SMS. A worker leases a row (locked_by / locked_until) while sending it;
+    failed sends are retried with exponential backoff until
+    OTP_OUTBOX_MAX_ATTEMPTS. Sent and cancelled rows are deleted; FAILED ones
+    are pruned after OTP_OUTBOX_FAILED_RETENTION_DAYS.
+    """
+    otp = models.ForeignKey(
+        OTPTransaction, on_delete=models.CASCADE, related_name='deliveries', null=True, blank=True,
+        help_text="OTP to deliver; empty for cache-stored OTPs, which carry the payload below"
+    )
+    channel = models.CharField(
+        max_length=10,
+        choices=[(DeliveryMethod.EMAIL, 'Email'), (DeliveryMethod.SMS, 'SMS')],
+        help_text="Channel this row delivers over"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING,
+        help_text="Current status of this delivery"
+    )
+
+    # Payload of cache-stored OTPs (otps/cache_store.py), which have no OTPTransaction
+    purpose = models.CharField(max_length=30, choices=OTPPurpose.choices, null=True, blank=True)
+    email = models.EmailField(null=True, blank=True)
+    phone = models.CharField(max_length=15, null=True, blank=True)
+    otp_code = models.CharField(max_length=10, null=True, blank=True, help_text="Cleared once sent or given up")
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    # Retry / lease tracking
+    attempts = models.PositiveSmallIntegerField(default=0, help_text="Number of send attempts made")
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text="When the row is next due")
+    locked_by = models.CharField(max_length=64, null=True, blank=True, help_text="Lease token of the worker sending it")
+    locked_until = models.DateTimeField(null=True, blank=True, help_text="When the worker's lease runs out")
+    last_error = models.TextField(null=True, blank=True, help_text="Error of the last failed attempt")
+
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['next_attempt_at']
+        verbose_name = "OTP Delivery"
+        verbose_name_plural = "OTP Delivery Outbox"
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+            models.Index(fields=['locked_by']),
+        ]
+
+    def __str__(self):
+        otp = f"OTP #{self.otp_id}" if self.otp_id else f"cached OTP for {self.email or self.phone}"
+        return f"{self.get_channel_display()} delivery of {otp} - {self.get_status_display()}"
+
+
+class OTPAuditEvent(models.TextChoices):
+    """Define the events recorded for cache-stored OTPs"""
+    GENERATED = 'GENERATED', 'Generated'
+    VERIFIED = 'VERIFIED', 'Verified'
+    FAILED = 'FAILED', 'Verification Failed'
+
+class OTPAuditRecord(models.Model):
+    """
+    Compact audit trail of cache-stored OTPs (see otps/cache_store.py).
+
+    Purposes kept in the cache get no OTPTransaction row; one small record per
+    event is written off the request path instead. The code itself is never
+    stored.
+    """
+    purpose = models.CharField(max_length=30, choices=OTPPurpose.choices)
+    event = models.CharField(max_length=20, choices=OTPAuditEvent.choices)
+    email = models.EmailField(null=True, blank=True)
+    phone = models.CharField(max_length=15, null=True, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "OTP Audit Record"
+        verbose_name_plural = "OTP Audit Records"
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['email', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_event_display()} {self.get_purpose_display()} OTP for {self.email or self.phone or 'Unknown'}"
@@ -0,0 +1,198 @@
+"""
+OTP delivery outbox worker.
+
+generate_otp() queues one OTPDeliveryOutbox row per channel; this module
+sends them. A worker claims a batch of due rows with a lease (one
+conditional UPDATE, so concurrent workers never claim the same row), sends
+each one, and records the outcome:
+
+    sent      -> SENT, and the OTP is marked DELIVERED
+    failed    -> retried after an exponential, jittered backoff, FAILED once
+                 OTP_OUTBOX_MAX_ATTEMPTS is reached
+    OTP gone  -> CANCELLED when the OTP was invalidated, used or expired first
+
+Sent and cancelled rows are deleted: the OTPTransaction records the
+delivery, so the table only holds pending work and recent failures. FAILED
+rows are kept for OTP_OUTBOX_FAILED_RETENTION_DAYS for inspection, then
+removed by prune_finished_deliveries(). Cache-stored OTPs (no OTPTransaction,
+the code is in the row) also have their code cleared when they fail, so
+codes don't outlive their delivery in the database. The cache store deletes
+their rows itself when their OTP is replaced, invalidated or used.
+
+A worker that dies mid-send loses its lease after OTP_OUTBOX_LEASE_SECONDS
+and the rows are claimed again, so delivery is at-least-once.
+"""
+
+import logging
+import random
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .cache_store import CachedOTP
+from .models import OTPDeliveryOutbox, OTPStatus, OTPTransaction, OutboxStatus
+from .services import send_otp_message
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_BATCH_SIZE = 50
+OUTBOX_MAX_ATTEMPTS = getattr(settings, 'OTP_OUTBOX_MAX_ATTEMPTS', 5)
+OUTBOX_LEASE_SECONDS = getattr(settings, 'OTP_OUTBOX_LEASE_SECONDS', 60)
+OUTBOX_BACKOFF_SECONDS = getattr(settings, 'OTP_OUTBOX_BACKOFF_SECONDS', 5)
+OUTBOX_MAX_BACKOFF_SECONDS = getattr(settings, 'OTP_OUTBOX_MAX_BACKOFF_SECONDS', 300)
+OUTBOX_FAILED_RETENTION_DAYS = getattr(settings, 'OTP_OUTBOX_FAILED_RETENTION_DAYS', 7)
+
+# OTP statuses that are still worth delivering
+DELIVERABLE_OTP_STATUSES = [OTPStatus.CREATED, OTPStatus.DELIVERED]
+
+
+def new_lease_token():
+    """Unique token identifying one claim of one worker"""
+    return uuid.uuid4().hex
+
+
+def claim_deliveries(token, limit=DEFAULT_BATCH_SIZE, lease_seconds=OUTBOX_LEASE_SECONDS):
+    """
+    Lease up to ``limit`` due deliveries to ``token``.
+
+    Args:
+        token (str): Lease token, see new_lease_token()
+        limit (int, optional): Max rows to claim
+        lease_seconds (int, optional): How long the claim holds
+
+    Returns:
+        list: Ids of the claimed OTPDeliveryOutbox rows
+    """
+    now = timezone.now()
+    due = Q(status=OutboxStatus.PENDING, next_attempt_at__lte=now) & (
+        Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+    )
+    candidates = list(
+        OTPDeliveryOutbox.objects.filter(due).order_by('next_attempt_at').values_list('id', flat=True)[:limit]
+    )
+    if not candidates:
+        return []
+
+    # Re-check the due condition in the UPDATE: rows another worker leased
+    # in between are skipped rather than claimed twice
+    OTPDeliveryOutbox.objects.filter(due, id__in=candidates).update(
+        locked_by=token,
+        locked_until=now + timedelta(seconds=lease_seconds),
+    )
+    return list(OTPDeliveryOutbox.objects.filter(locked_by=token).values_list('id', flat=True))
+
+
+def process_delivery(delivery_id, token):
+    """
+    Send one leased delivery and record the outcome.
+
+    Args:
+        delivery_id (int): OTPDeliveryOutbox id
+        token (str): Lease token the row was claimed with
+
+    Returns:
+        str: The delivery's OutboxStatus (SENT / CANCELLED rows are deleted),
+            or None if the lease was lost
+    """
+    delivery = (
+        OTPDeliveryOutbox.objects
+        .select_related('otp')
+        .filter(id=delivery_id, locked_by=token, status=OutboxStatus.PENDING)
+        .first()
+    )
+    if delivery is None:
+        return None
+    leased = OTPDeliveryOutbox.objects.filter(id=delivery_id, locked_by=token)
+    cached = delivery.otp_id is None
+    otp_transaction = _payload_otp(delivery) if cached else delivery.otp
+
+    if otp_transaction.is_expired() or (
+        not cached and otp_transaction.status not in DELIVERABLE_OTP_STATUSES
+    ):
+        leased.delete()
+        logger.info(f"OTP delivery #{delivery_id} cancelled: the OTP is no longer usable")
+        return OutboxStatus.CANCELLED
+
+    try:
+        send_otp_message(otp_transaction, delivery.channel)
+    except Exception as e:
+        attempts = delivery.attempts + 1
+        if attempts >= OUTBOX_MAX_ATTEMPTS:
+            status, next_attempt_at = OutboxStatus.FAILED, delivery.next_attempt_at
+            logger.error(f"OTP delivery #{delivery_id} failed after {attempts} attempts: {e}")
+        else:
+            status, next_attempt_at = OutboxStatus.PENDING, timezone.now() + backoff_delay(attempts)
+            logger.warning(f"OTP delivery #{delivery_id} attempt {attempts} failed, retrying: {e}")
+        leased.update(
+            status=status,
+            attempts=F('attempts') + 1,
+            next_attempt_at=next_attempt_at,
+            last_error=str(e),
+            locked_by=None,
+            locked_until=None,
+            **({'otp_code': None} if cached and status == OutboxStatus.FAILED else {}),
+        )
+        return status
+
+    leased.delete()
+    if cached:
+        logger.info(f"Cached {otp_transaction.purpose} OTP sent via {delivery.channel}")
+        return OutboxStatus.SENT
+
+    now = timezone.now()
+    # Conditional so a concurrent invalidate / verify is never overwritten
+    OTPTransaction.objects.filter(id=otp_transaction.id, status=OTPStatus.CREATED).update(
+        status=OTPStatus.DELIVERED,
+        sent_at=now,
+    )
+    logger.info(f"OTP #{otp_transaction.id} sent via {delivery.channel}")
+    return OutboxStatus.SENT
+
+
+def prune_finished_deliveries(retention_days=OUTBOX_FAILED_RETENTION_DAYS):
+    """
+    Delete finished rows last attempted more than ``retention_days`` ago:
+    FAILED rows, and any SENT / CANCELLED rows left from before those were
+    deleted on the spot.
+
+    Returns:
+        int: Number of rows deleted
+    """
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = OTPDeliveryOutbox.objects.filter(
+        status__in=[OutboxStatus.FAILED, OutboxStatus.SENT, OutboxStatus.CANCELLED],
+        next_attempt_at__lt=cutoff,
+    ).delete()
+    if deleted:
+        logger.info(f"Pruned {deleted} finished OTP deliveries older than {retention_days} days")
+    return deleted
+
+
+def process_delivery_args(args):
+    """process_delivery() for Executor.map"""
+    return process_delivery(*args)
+
+
+def _payload_otp(delivery):
+    """The cache-stored OTP an outbox row carries"""
+    return CachedOTP(
+        otp_code=delivery.otp_code,
+        purpose=delivery.purpose,
+        delivery_method=delivery.channel,
+        expires_at=delivery.expires_at,
+        email=delivery.email,
+        phone=delivery.phone,
+    )
+
+
+def backoff_delay(attempts):
+    """
+    Delay before retry number ``attempts``: exponential, capped at
+    OTP_OUTBOX_MAX_BACKOFF_SECONDS, with jitter so failed batches spread out.
+    """
+    delay = min(OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1), OUTBOX_MAX_BACKOFF_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
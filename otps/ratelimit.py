@@ -0,0 +1,166 @@
+"""
+Sliding-window rate limits for sending and verifying OTPs.
+
+Budgets come from the OTP_RATE_LIMITS setting: per action ("send" /
+"verify"), a list of (scope, limit, window seconds) rules, where scope is
+"email" or "ip". Every rule is counted per OTP purpose.
+
+Counters live in the Django cache, so a request costs no DB query. Each
+rule keeps two fixed-window buckets (current and previous) and estimates the
+sliding window as
+
+    current + previous * (1 - elapsed fraction of the current window)
+
+which needs no per-request timestamps and is exact enough for abuse control.
+A request already over budget is rejected after one read; otherwise it is
+counted first (cache.incr is atomic) and judged on the counts incr returned,
+so concurrent requests can't all pass on the same stale read. A request
+that turns out to be over budget gives its increments back.
+Counters are shared across workers only with a shared cache backend
+(Redis / Memcached), see CACHES in settings.
+"""
+
+import hashlib
+import math
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+
+# Constants
+DEFAULT_RATE_LIMITS = {
+    "send": [
+        ("email", 3, 60),
+        ("email", 10, 60 * 60),
+        ("ip", 30, 60 * 60),
+    ],
+    "verify": [
+        ("email", 10, 10 * 60),
+        ("ip", 50, 10 * 60),
+    ],
+}
+
+KEY_PREFIX = "otp-rl"
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    retry_after: int = 0
+
+
+def get_rate_limits(action):
+    """The (scope, limit, window) rules of ``action``"""
+    return getattr(settings, "OTP_RATE_LIMITS", DEFAULT_RATE_LIMITS).get(action, [])
+
+
+def client_ip(request):
+    """Address of the client (the proxy's, behind a proxy)"""
+    return request.META.get("REMOTE_ADDR")
+
+
+def check_rate_limit(action, purpose, email=None, ip=None):
+    """
+    Count one ``action`` for an email / IP and purpose, unless over budget.
+
+    Args:
+        action (str): "send" or "verify"
+        purpose (str): OTPPurpose value
+        email (str, optional): Email the OTP is for
+        ip (str, optional): Client IP address
+
+    Returns:
+        RateLimitResult: allowed, and seconds until it would be when not
+    """
+    identities = {"email": (email or "").strip().lower(), "ip": ip or ""}
+    now = time.time()
+
+    rules = []
+    for scope, limit, window in get_rate_limits(action):
+        identity = identities.get(scope)
+        if not identity:
+            continue
+        bucket = int(now // window)
+        digest = hashlib.md5(identity.encode()).hexdigest()
+        base = f"{KEY_PREFIX}:{action}:{purpose}:{scope}:{window}:{digest}"
+        rules.append((limit, window, bucket, f"{base}:{bucket}", f"{base}:{bucket - 1}"))
+    if not rules:
+        return RateLimitResult(allowed=True)
+
+    counts = cache.get_many([key for rule in rules for key in rule[3:]])
+
+    # Fast path: over budget on the counts as they stand, nothing to count
+    retry_after = 0
+    for limit, window, bucket, current_key, previous_key in rules:
+        current = counts.get(current_key, 0)
+        previous = counts.get(previous_key, 0)
+        elapsed = now / window - bucket
+        if current + previous * (1 - elapsed) + 1 > limit:
+            retry_after = max(retry_after, _retry_after(current, previous, limit, elapsed, window))
+    if retry_after:
+        return RateLimitResult(allowed=False, retry_after=retry_after)
+
+    # Count first, then judge on the returned counts
+    counted = []
+    for limit, window, bucket, current_key, previous_key in rules:
+        current = _increment(current_key, window)
+        counted.append(current_key)
+        previous = counts.get(previous_key, 0)
+        elapsed = now / window - bucket
+        if current + previous * (1 - elapsed) > limit:
+            retry_after = max(retry_after, _retry_after(current - 1, previous, limit, elapsed, window))
+    if retry_after:
+        for key in counted:
+            try:
+                cache.decr(key)
+            except ValueError:
+                pass
+        return RateLimitResult(allowed=False, retry_after=retry_after)
+    return RateLimitResult(allowed=True)
+
+
+def rate_limited_response(result, response=None):
+    """
+    Mark ``response`` (a JSON 429 by default) as rate limited.
+
+    Returns:
+        HttpResponse: 429 with a Retry-After header
+    """
+    if response is None:
+        response = JsonResponse(
+            {
+                "success": False,
+                "message": f"Too many requests. Please try again in {result.retry_after} seconds.",
+            },
+            status=429,
+        )
+    response.status_code = 429
+    response["Retry-After"] = str(result.retry_after)
+    return response
+
+
+def _increment(key, window):
+    """Count one request in a bucket, returning the new count"""
+    # The bucket is still read as "previous" during the next window
+    cache.add(key, 0, timeout=2 * window)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted between add and incr
+        cache.set(key, 1, timeout=2 * window)
+        return 1
+
+
+def _retry_after(current, previous, limit, elapsed, window):
+    """Seconds until one more request fits, if no other requests arrive"""
+    # Room frees up within this window as the previous bucket's weight decays
+    if current + 1 <= limit and previous:
+        fraction = 1 - elapsed - (limit - current - 1) / previous
+        return max(1, math.ceil(fraction * window))
+    # Otherwise wait for the next window, where this bucket becomes "previous"
+    wait = (1 - elapsed) * window
+    if current:
+        wait += max(0.0, 1 - (limit - 1) / current) * window
+    return max(1, math.ceil(wait))
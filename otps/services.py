@@ -3,19 +3,36 @@ Services for OTP management.
 
 This module provides the core functionality for OTP generation, validation, and delivery.
 It serves as the central OTP engine for the entire application.
+
+Delivery goes through a transactional outbox: generate_otp() writes one
+OTPDeliveryOutbox row per channel in the same transaction as the OTP and
+returns; `manage.py run_otp_worker` (otps/outbox.py) does the sending.
+
+Each purpose is stored either as OTPTransaction rows ("db", the default) or
+in the cache ("cache", see otps/cache_store.py), per the OTP_STORE_BACKENDS
+setting. generate_otp(), verify_otp() and invalidate_existing_otps() pick
+the store themselves.
 """
 
 import logging
-import sys
-import os
 from datetime import timedelta
 from django.utils import timezone
 from django.core.mail import send_mail
 from django.conf import settings
 from django.utils.crypto import get_random_string
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Case, F, Q, Subquery, Value, When
 
-from .models import OTPTransaction, OTPPurpose, OTPStatus, DeliveryMethod
+from .models import OTPTransaction, OTPPurpose, OTPStatus, DeliveryMethod, OTPDeliveryOutbox, OTPAuditEvent
+from .cache_store import (
+    CachedOTP,
+    get_store_backend,
+    invalidate_cached_otp,
+    record_audit,
+    store_otp,
+    verify_cached_otp,
+)
+from .sinks import emit_otp
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +41,13 @@ DEFAULT_OTP_LENGTH = 6
 DEFAULT_OTP_EXPIRY_MINUTES = 10
 MAX_OTP_ATTEMPTS = 3
 
+# Delivery method -> channels it is queued on
+DELIVERY_CHANNELS = {
+    DeliveryMethod.EMAIL: [DeliveryMethod.EMAIL],
+    DeliveryMethod.SMS: [DeliveryMethod.SMS],
+    DeliveryMethod.BOTH: [DeliveryMethod.EMAIL, DeliveryMethod.SMS],
+}
+
 
 def generate_otp(
     purpose, 
@@ -49,11 +73,13 @@ def generate_otp(
         expiry_minutes (int, optional): Expiry time in minutes. Defaults to 10.
         ip_address (str, optional): IP address of the requester
         user_agent (str, optional): User agent of the requester
-        deliver (bool, optional): Whether to deliver the OTP immediately. Defaults to True.
+        deliver (bool, optional): Whether to queue the OTP for delivery by the
+            outbox worker. Defaults to True.
         additional_info (dict, optional): Additional information to store
         
     Returns:
-        tuple: (OTPTransaction object, generated OTP code)
+        tuple: (OTPTransaction object, or CachedOTP for cache-stored purposes,
+            generated OTP code)
     """
     # Validate inputs
     if not email and not phone and not user:
@@ -75,28 +101,45 @@ def generate_otp(
     otp_code = get_random_string(length=length, allowed_chars='0123456789')
     expires_at = timezone.now() + timedelta(minutes=expiry_minutes)
     
-    # Create OTP transaction
-    otp_transaction = OTPTransaction.objects.create(
-        otp_code=otp_code,
-        user=user,
-        email=email,
-        phone=phone,
-        purpose=purpose,
-        status=OTPStatus.CREATED,
-        delivery_method=delivery_method,
-        expires_at=expires_at,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        additional_info=additional_info or {}
-    )
+    if get_store_backend(purpose) == "cache":
+        cached_otp = CachedOTP(
+            otp_code=otp_code,
+            purpose=purpose,
+            delivery_method=delivery_method,
+            expires_at=expires_at,
+            email=email,
+            phone=phone,
+            user_id=user.pk if user else None,
+        )
+        store_otp(cached_otp)
+        if deliver:
+            enqueue_delivery(cached_otp)
+        record_audit(OTPAuditEvent.GENERATED, purpose, email=email, phone=phone, ip_address=ip_address)
+        _log_otp_generation(cached_otp)
+        return cached_otp, otp_code
+    
+    # Create OTP transaction and its queued deliveries together, so the
+    # worker never sees a delivery without its OTP or an OTP without delivery
+    with transaction.atomic():
+        otp_transaction = OTPTransaction.objects.create(
+            otp_code=otp_code,
+            user=user,
+            email=email,
+            phone=phone,
+            purpose=purpose,
+            status=OTPStatus.CREATED,
+            delivery_method=delivery_method,
+            expires_at=expires_at,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            additional_info=additional_info or {}
+        )
+        if deliver:
+            enqueue_delivery(otp_transaction)
     
     # Log OTP generation (this helps debugging)
     _log_otp_generation(otp_transaction)
     
-    # Deliver OTP if requested
-    if deliver:
-        deliver_otp(otp_transaction)
-    
     return otp_transaction, otp_code
 
 
@@ -104,6 +147,13 @@ def verify_otp(otp_code, purpose, email=None, phone=None, user=None, invalidate_
     """
     Verify an OTP.
     
+    Checks the recipient's latest delivered OTP for this purpose. A success is
+    a single conditional UPDATE (code matches, not expired, attempts left,
+    still DELIVERED) that also counts the attempt and transitions the status,
+    so concurrent submits of the same code can verify it only once. A failure
+    is one more UPDATE that counts the attempt and expires / invalidates the
+    OTP when due.
+    
     Args:
         otp_code (str): The OTP code to verify
         purpose (str): Purpose for which OTP was generated
@@ -117,9 +167,20 @@ def verify_otp(otp_code, purpose, email=None, phone=None, user=None, invalidate_
     """
     if not otp_code:
         return False
+    
+    if get_store_backend(purpose) == "cache":
+        # Cached OTPs are keyed like generate_otp() stored them
+        if not email and not phone and user and hasattr(user, 'email'):
+            email = user.email
+        verified = verify_cached_otp(
+            otp_code, purpose, email=email, phone=phone, user=user, max_attempts=MAX_OTP_ATTEMPTS
+        )
+        event = OTPAuditEvent.VERIFIED if verified else OTPAuditEvent.FAILED
+        record_audit(event, purpose, email=email, phone=phone)
+        return verified
         
     # Build query to find the OTP
-    query = Q(otp_code=otp_code, purpose=purpose, status=OTPStatus.DELIVERED)
+    query = Q(purpose=purpose, status=OTPStatus.DELIVERED)
     
     if email:
         query &= Q(email=email)
@@ -128,43 +189,113 @@ def verify_otp(otp_code, purpose, email=None, phone=None, user=None, invalidate_
     if user:
         query &= Q(user=user)
     
-    # Find the most recently created matching OTP
-    otp_transaction = OTPTransaction.objects.filter(query).order_by('-created_at').first()
-    
-    if not otp_transaction:
-        logger.warning(f"OTP verification failed: No matching OTP found for {purpose}")
-        return False
+    # The most recently created matching OTP; the status is re-checked by the
+    # UPDATE itself, so a concurrent verify / invalidate wins cleanly
+    latest = OTPTransaction.objects.filter(query).order_by('-created_at').values('id')[:1]
+    target = OTPTransaction.objects.filter(id=Subquery(latest), status=OTPStatus.DELIVERED)
+    now = timezone.now()
+    recipient = email or phone or (f"User #{user.pk}" if user else "unknown")
     
-    # Check if OTP is expired
-    if otp_transaction.is_expired():
-        otp_transaction.status = OTPStatus.EXPIRED
-        otp_transaction.save(update_fields=['status'])
-        logger.info(f"OTP verification failed: OTP expired for {otp_transaction.email or otp_transaction.phone}")
-        return False
+    verified = target.filter(
+        otp_code=otp_code,
+        expires_at__gt=now,
+        attempts__lt=MAX_OTP_ATTEMPTS,
+    ).update(
+        attempts=F('attempts') + 1,
+        status=OTPStatus.INVALIDATED if invalidate_on_success else OTPStatus.VERIFIED,
+        verified_at=now,
+    )
+    if verified:
+        logger.info(f"OTP verified successfully for {recipient}")
+        return True
     
-    # Increment attempt counter
-    attempts = otp_transaction.increment_attempts()
+    # Wrong code, expired or out of attempts: count the attempt and retire
+    # the OTP once it can no longer succeed
+    failed = target.update(
+        attempts=F('attempts') + 1,
+        status=Case(
+            When(expires_at__lte=now, then=Value(OTPStatus.EXPIRED)),
+            When(attempts__gte=MAX_OTP_ATTEMPTS - 1, then=Value(OTPStatus.INVALIDATED)),
+            default=F('status'),
+        ),
+    )
+    if failed:
+        logger.warning(f"OTP verification failed for {recipient}: wrong code, expired or max attempts exceeded")
+    else:
+        logger.warning(f"OTP verification failed: No matching OTP found for {purpose}")
+    return False
+
+
+def enqueue_delivery(otp_transaction):
+    """
+    Queue an OTP for delivery over each channel of its delivery method.
+    Call inside the transaction that creates the OTP.
     
-    # Check if max attempts exceeded
-    if attempts > MAX_OTP_ATTEMPTS:
-        otp_transaction.invalidate()
-        logger.warning(f"OTP verification failed: Max attempts exceeded for {otp_transaction.email or otp_transaction.phone}")
-        return False
+    Args:
+        otp_transaction (OTPTransaction | CachedOTP): The OTP to deliver
     
-    # Mark as verified
-    otp_transaction.mark_as_verified()
+    Returns:
+        list: The created OTPDeliveryOutbox rows
+    """
+    channels = DELIVERY_CHANNELS.get(otp_transaction.delivery_method)
+    if not channels:
+        logger.error(f"Unknown delivery method: {otp_transaction.delivery_method}")
+        return []
+    if isinstance(otp_transaction, CachedOTP):
+        # No OTPTransaction row to point at: the row carries the payload
+        return OTPDeliveryOutbox.objects.bulk_create(
+            OTPDeliveryOutbox(
+                channel=channel,
+                purpose=otp_transaction.purpose,
+                email=otp_transaction.email,
+                phone=otp_transaction.phone,
+                otp_code=otp_transaction.otp_code,
+                expires_at=otp_transaction.expires_at,
+            )
+            for channel in channels
+        )
+    return OTPDeliveryOutbox.objects.bulk_create(
+        OTPDeliveryOutbox(otp=otp_transaction, channel=channel) for channel in channels
+    )
+
+
+def send_otp_message(otp_transaction, channel):
+    """
+    Send an OTP over one channel, without touching its status.
+    Used by the outbox worker, which records the outcome itself.
     
-    # Invalidate OTP to prevent reuse if requested
-    if invalidate_on_success:
-        otp_transaction.invalidate()
+    Args:
+        otp_transaction (OTPTransaction): The OTP transaction to send
+        channel (str): DeliveryMethod.EMAIL or DeliveryMethod.SMS
     
-    logger.info(f"OTP verified successfully for {otp_transaction.email or otp_transaction.phone}")
-    return True
+    Raises:
+        ValueError: The OTP has no address for the channel
+        Exception: Whatever the mail / SMS backend raised
+    """
+    if channel == DeliveryMethod.EMAIL:
+        if not otp_transaction.email:
+            raise ValueError("No email address provided")
+        email_subject, email_message = _email_content(otp_transaction)
+        send_mail(
+            email_subject,
+            email_message,
+            settings.DEFAULT_FROM_EMAIL,
+            [otp_transaction.email],
+            fail_silently=False,
+        )
+    elif channel == DeliveryMethod.SMS:
+        if not otp_transaction.phone:
+            raise ValueError("No phone number provided")
+        # Placeholder until an SMS provider is integrated (see _deliver_via_sms)
+        logger.warning("SMS delivery not yet implemented")
+    else:
+        raise ValueError(f"Unknown delivery channel: {channel}")
 
 
 def deliver_otp(otp_transaction):
     """
-    Deliver an OTP via the specified delivery method.
+    Deliver an OTP via the specified delivery method, synchronously.
+    generate_otp() queues deliveries instead; this is for one-off sends.
     
     Args:
         otp_transaction (OTPTransaction): The OTP transaction to deliver
@@ -196,6 +327,10 @@ def invalidate_existing_otps(purpose, email=None, phone=None, user=None):
         phone (str, optional): Phone number associated with the OTPs
         user (User, optional): User associated with the OTPs
     """
+    if get_store_backend(purpose) == "cache":
+        invalidate_cached_otp(purpose, email=email, phone=phone, user=user)
+        return
+    
     query = Q(purpose=purpose, status__in=[OTPStatus.CREATED, OTPStatus.DELIVERED])
     
     if email:
@@ -221,25 +356,9 @@ def _deliver_via_email(otp_transaction):
         logger.error("Cannot deliver OTP via email: No email address provided")
         return False
     
-    # Get purpose display name
-    purpose_display = dict(OTPPurpose.choices).get(otp_transaction.purpose, otp_transaction.purpose)
-    
-    # Format OTP message
-    email_subject = f"Your {purpose_display} OTP Code - Goalstox"
-    email_message = f"""
-*********************************************************
-*                                                       *
-*  YOUR OTP CODE: {otp_transaction.otp_code}           *
-*  Purpose: {purpose_display}                          *
-*  Valid for: {DEFAULT_OTP_EXPIRY_MINUTES} minutes     *
-*                                                       *
-*********************************************************
-
-This is an automated message from Goalstox.
-    """
+    email_subject, email_message = _email_content(otp_transaction)
     
     try:
-        print(f"DEBUG: About to send OTP email to {otp_transaction.email}")
         # Send email
         send_mail(
             email_subject,
@@ -248,18 +367,37 @@ This is an automated message from Goalstox.
             [otp_transaction.email],
             fail_silently=False,
         )
-        print(f"DEBUG: send_mail() called for {otp_transaction.email}")
         # Mark OTP as sent
         otp_transaction.mark_as_sent()
         logger.info(f"OTP sent via email to {otp_transaction.email}")
         return True
     
     except Exception as e:
-        print(f"DEBUG: Exception in send_mail: {e}")
         logger.error(f"Failed to send OTP via email: {str(e)}")
         return False
 
 
+def _email_content(otp_transaction):
+    """Subject and body of the OTP email"""
+    # Get purpose display name
+    purpose_display = dict(OTPPurpose.choices).get(otp_transaction.purpose, otp_transaction.purpose)
+    
+    # Format OTP message
+    email_subject = f"Your {purpose_display} OTP Code - Goalstox"
+    email_message = f"""
+*********************************************************
+*                                                       *
+*  YOUR OTP CODE: {otp_transaction.otp_code}           *
+*  Purpose: {purpose_display}                          *
+*  Valid for: {DEFAULT_OTP_EXPIRY_MINUTES} minutes     *
+*                                                       *
+*********************************************************
+
+This is an automated message from Goalstox.
+    """
+    return email_subject, email_message
+
+
 def _deliver_via_sms(otp_transaction):
     """Send OTP via SMS"""
     if not otp_transaction.phone:
@@ -279,48 +417,12 @@ def _deliver_via_sms(otp_transaction):
 
 def _log_otp_generation(otp_transaction):
     """
-    Log OTP generation for debugging purposes.
-    Also writes to console and LATEST_OTP.txt for visibility.
+    Log OTP generation and pass the OTP to the configured debug sinks
+    (console / LATEST_OTP.txt in development, none in production).
     """
-    # Log to Python logger
-    logger.info(
-        f"Generated OTP: {otp_transaction.otp_code} for "
+    logger.debug(
+        f"Generated OTP for "
         f"{otp_transaction.email or otp_transaction.phone or f'User #{otp_transaction.user_id}'} "
         f"(Purpose: {otp_transaction.purpose})"
     )
-    
-    # Format console message
-    border = "!" * 70
-    timestamp = timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-    recipient = otp_transaction.email or otp_transaction.phone or f"User #{otp_transaction.user_id}" if otp_transaction.user_id else "Unknown"
-    
-    # Print to console with high visibility
-    print("\n" + border, file=sys.stdout, flush=True)
-    print(f"!!! OTP GENERATED at {timestamp} !!!  Purpose: {otp_transaction.purpose}", file=sys.stdout, flush=True)
-    print(f"!!! RECIPIENT: {recipient}", file=sys.stdout, flush=True)
-    print(f"!!! OTP CODE: {otp_transaction.otp_code}", file=sys.stdout, flush=True)
-    print(border + "\n", file=sys.stdout, flush=True)
-    
-    # Create a simple box around the OTP - highly visible
-    otp_in_box = f"""
-+----------------------+
-|                      |
-|   OTP: {otp_transaction.otp_code}         |
-|   For: {recipient}   |
-|                      |
-+----------------------+
-"""
-    print(otp_in_box, flush=True)
-    
-    # Write to LATEST_OTP.txt for easy reference
-    try:
-        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        otp_file_path = os.path.join(project_dir, 'LATEST_OTP.txt')
-        with open(otp_file_path, 'w', encoding='utf-8') as f:
-            f.write(f"OTP: {otp_transaction.otp_code}\n")
-            f.write(f"Email: {otp_transaction.email or 'N/A'}\n")
-            f.write(f"Phone: {otp_transaction.phone or 'N/A'}\n")
-            f.write(f"Type: {otp_transaction.purpose}\n")
-            f.write(f"Time: {timestamp}\n")
-    except Exception as e:
-        logger.error(f"Failed to write to LATEST_OTP.txt: {str(e)}")
+    emit_otp(otp_transaction)
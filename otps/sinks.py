@@ -0,0 +1,162 @@
+"""
+Debug sinks for generated OTPs.
+
+In development it helps to see each OTP without an inbox, so generate_otp()
+hands every new OTP to the sinks named in the OTP_DEBUG_SINKS setting:
+
+    console  one block on stdout
+    file     overwrite OTP_DEBUG_FILE (LATEST_OTP.txt) with the latest OTP
+    memory   keep the last OTP_DEBUG_MEMORY_SIZE OTPs in a ring buffer, for tests
+    none     nothing
+
+A dotted path to a class with an ``emit(otp_transaction)`` method works too.
+OTP_DEBUG_SINKS defaults to ["console", "file"] when DEBUG is on and to no
+sinks otherwise, so production does no I/O for an OTP beyond its DB write.
+"""
+
+import logging
+import sys
+from collections import deque
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MEMORY_SIZE = 100
+
+
+def _recipient(otp_transaction):
+    return otp_transaction.email or otp_transaction.phone or (
+        f"User #{otp_transaction.user_id}" if otp_transaction.user_id else "Unknown"
+    )
+
+
+class ConsoleSink:
+    """Write each OTP to stdout as one block"""
+
+    def emit(self, otp_transaction):
+        border = "!" * 70
+        timestamp = timezone.now().strftime('%Y-%m-%d %H:%M:%S')
+        sys.stdout.write(
+            f"\n{border}\n"
+            f"!!! OTP GENERATED at {timestamp} !!!  Purpose: {otp_transaction.purpose}\n"
+            f"!!! RECIPIENT: {_recipient(otp_transaction)}\n"
+            f"!!! OTP CODE: {otp_transaction.otp_code}\n"
+            f"{border}\n\n"
+        )
+
+
+class FileSink:
+    """Overwrite a file with the latest OTP"""
+
+    def __init__(self, path=None):
+        self.path = path or getattr(settings, 'OTP_DEBUG_FILE', settings.BASE_DIR / 'LATEST_OTP.txt')
+
+    def emit(self, otp_transaction):
+        timestamp = timezone.now().strftime('%Y-%m-%d %H:%M:%S')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(
+                f"OTP: {otp_transaction.otp_code}\n"
+                f"Email: {otp_transaction.email or 'N/A'}\n"
+                f"Phone: {otp_transaction.phone or 'N/A'}\n"
+                f"Type: {otp_transaction.purpose}\n"
+                f"Time: {timestamp}\n"
+            )
+
+
+class MemorySink:
+    """Keep the latest OTPs in memory (for tests)"""
+
+    def __init__(self, size=None):
+        self.records = deque(maxlen=size or getattr(settings, 'OTP_DEBUG_MEMORY_SIZE', DEFAULT_MEMORY_SIZE))
+
+    def emit(self, otp_transaction):
+        self.records.append({
+            'otp_code': otp_transaction.otp_code,
+            'email': otp_transaction.email,
+            'phone': otp_transaction.phone,
+            'purpose': otp_transaction.purpose,
+            'created_at': otp_transaction.created_at,
+        })
+
+    def latest(self, email=None, phone=None):
+        """Most recent record, optionally for one email / phone"""
+        for record in reversed(self.records):
+            if email and record['email'] != email:
+                continue
+            if phone and record['phone'] != phone:
+                continue
+            return record
+        return None
+
+    def clear(self):
+        self.records.clear()
+
+
+# Sink name -> class
+SINKS = {
+    'console': ConsoleSink,
+    'file': FileSink,
+    'memory': MemorySink,
+    'none': None,
+}
+
+
+def register_sink(name, sink_class):
+    """Make ``sink_class`` available as ``name`` in OTP_DEBUG_SINKS"""
+    SINKS[name] = sink_class
+    get_sinks.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_sinks():
+    """
+    The configured sinks, built once per process.
+
+    Returns:
+        dict: Sink name -> sink instance
+    """
+    names = getattr(settings, 'OTP_DEBUG_SINKS', None)
+    if names is None:
+        names = ['console', 'file'] if settings.DEBUG else []
+
+    sinks = {}
+    for name in names:
+        if name in SINKS:
+            sink_class = SINKS[name]
+        else:
+            try:
+                sink_class = import_string(name)
+            except ImportError as e:
+                raise ImproperlyConfigured(f"Unknown OTP debug sink '{name}'") from e
+        if sink_class is not None:
+            sinks[name] = sink_class()
+    return sinks
+
+
+def get_sink(name):
+    """One configured sink by name, e.g. get_sink('memory') in tests"""
+    return get_sinks().get(name)
+
+
+def emit_otp(otp_transaction):
+    """Hand a generated OTP to every configured sink"""
+    for name, sink in get_sinks().items():
+        try:
+            sink.emit(otp_transaction)
+        except Exception as e:
+            logger.error(f"OTP debug sink '{name}' failed: {str(e)}")
+
+
+@receiver(setting_changed)
+def _reset_sinks(setting, **kwargs):
+    # Let override_settings(OTP_DEBUG_SINKS=...) take effect in tests
+    if setting.startswith('OTP_DEBUG_') or setting == 'DEBUG':
+        get_sinks.cache_clear()
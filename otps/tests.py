@@ -1,3 +1,328 @@
-from django.test import TestCase
+import threading
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .models import OTPAuditRecord, OTPDeliveryOutbox, OTPStatus, OTPTransaction, OutboxStatus
+from .outbox import (
+    OUTBOX_FAILED_RETENTION_DAYS,
+    OUTBOX_MAX_ATTEMPTS,
+    claim_deliveries,
+    new_lease_token,
+    process_delivery,
+    prune_finished_deliveries,
+)
+from .ratelimit import check_rate_limit
+from .services import generate_otp, invalidate_existing_otps, verify_otp
+from .sinks import FileSink, MemorySink, get_sink, get_sinks
+
+SEND_LIMITS = {"send": [("email", 3, 60)]}
+EMAIL = "a@example.com"
+
+
+def deliver_all():
+    """Run one inline worker pass over the outbox"""
+    token = new_lease_token()
+    return [process_delivery(delivery_id, token) for delivery_id in claim_deliveries(token)]
+
+
+def delivered_otp(email=EMAIL):
+    """A generated OTP the worker has delivered"""
+    otp_transaction, code = generate_otp("LOGIN", email=email)
+    deliver_all()
+    otp_transaction.refresh_from_db()
+    return otp_transaction, code
+
+
+# ======================================================
+# RATE LIMITS
+# ======================================================
+@override_settings(OTP_RATE_LIMITS=SEND_LIMITS)
+class RateLimitTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def send(self, email="a@example.com"):
+        return check_rate_limit("send", "LOGIN", email=email, ip="10.0.0.1")
+
+    def test_budget_then_retry_after(self):
+        results = [self.send() for _ in range(4)]
+
+        self.assertEqual([result.allowed for result in results], [True, True, True, False])
+        self.assertGreater(results[3].retry_after, 0)
+
+    def test_budgets_are_per_email(self):
+        for _ in range(3):
+            self.send()
+
+        self.assertTrue(self.send(email="b@example.com").allowed)
+
+    def test_concurrent_reads_cannot_all_pass(self):
+        # Every request reads the counts before any of them is counted
+        with mock.patch.object(cache, "get_many", return_value={}):
+            results = [self.send() for _ in range(10)]
+
+        self.assertEqual(sum(result.allowed for result in results), 3)
+
+    @override_settings(OTP_RATE_LIMITS={"send": [("email", 3, 60), ("ip", 4, 60)]})
+    def test_rejected_requests_are_not_counted(self):
+        with mock.patch.object(cache, "get_many", return_value={}):
+            results = [self.send() for _ in range(5)]
+
+        # The rejected sends gave back their count on the shared IP budget
+        self.assertEqual(sum(result.allowed for result in results), 3)
+        self.assertTrue(self.send(email="b@example.com").allowed)
+
+
+# ======================================================
+# DELIVERY OUTBOX
+# ======================================================
+@override_settings(OTP_DEBUG_SINKS=[])
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.otp_transaction, self.code = generate_otp("LOGIN", email=EMAIL)
+        self.delivery = OTPDeliveryOutbox.objects.get(otp=self.otp_transaction)
+
+    def test_send_deletes_row_and_marks_otp_delivered(self):
+        self.assertEqual(deliver_all(), [OutboxStatus.SENT])
+
+        self.otp_transaction.refresh_from_db()
+        self.assertFalse(OTPDeliveryOutbox.objects.exists())
+        self.assertEqual(self.otp_transaction.status, OTPStatus.DELIVERED)
+        self.assertIn(self.code, mail.outbox[0].body)
+
+    def test_claims_are_exclusive_until_the_lease_expires(self):
+        first, second = new_lease_token(), new_lease_token()
+
+        self.assertEqual(claim_deliveries(first), [self.delivery.id])
+        self.assertEqual(claim_deliveries(second), [])
+        self.assertIsNone(process_delivery(self.delivery.id, second))
+
+        # A worker that died mid-send loses its lease
+        OTPDeliveryOutbox.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(claim_deliveries(second), [self.delivery.id])
+
+    def test_failed_send_is_retried_with_backoff(self):
+        with mock.patch("otps.outbox.send_otp_message", side_effect=OSError("SMTP down")):
+            self.assertEqual(deliver_all(), [OutboxStatus.PENDING])
+
+        self.delivery.refresh_from_db()
+        self.assertEqual(self.delivery.attempts, 1)
+        self.assertEqual(self.delivery.last_error, "SMTP down")
+        self.assertGreater(self.delivery.next_attempt_at, timezone.now())
+        self.assertIsNone(self.delivery.locked_by)
+        # Not due again until the backoff has passed
+        self.assertEqual(deliver_all(), [])
+
+    def test_last_attempt_fails_the_row(self):
+        OTPDeliveryOutbox.objects.update(attempts=OUTBOX_MAX_ATTEMPTS - 1)
+
+        with mock.patch("otps.outbox.send_otp_message", side_effect=OSError("SMTP down")):
+            self.assertEqual(deliver_all(), [OutboxStatus.FAILED])
+
+        self.otp_transaction.refresh_from_db()
+        self.assertEqual(self.otp_transaction.status, OTPStatus.CREATED)
+        self.assertEqual(OTPDeliveryOutbox.objects.get().status, OutboxStatus.FAILED)
+
+    def test_old_failures_are_pruned(self):
+        cutoff = timezone.now() - timedelta(days=OUTBOX_FAILED_RETENTION_DAYS)
+        OTPDeliveryOutbox.objects.update(status=OutboxStatus.FAILED, next_attempt_at=cutoff + timedelta(hours=1))
+        stale = OTPDeliveryOutbox.objects.get()
+        stale.pk = None
+        stale.next_attempt_at = cutoff - timedelta(hours=1)
+        stale.save()
+
+        self.assertEqual(prune_finished_deliveries(), 1)
+        self.assertEqual(OTPDeliveryOutbox.objects.get().pk, self.delivery.pk)
+
+    def test_invalidated_otp_is_cancelled(self):
+        invalidate_existing_otps("LOGIN", email=EMAIL)
+
+        self.assertEqual(deliver_all(), [OutboxStatus.CANCELLED])
+        self.assertEqual(mail.outbox, [])
+        self.assertFalse(OTPDeliveryOutbox.objects.exists())
+
+    def test_expired_otp_is_cancelled(self):
+        OTPTransaction.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(deliver_all(), [OutboxStatus.CANCELLED])
+
+
+# ======================================================
+# VERIFY
+# ======================================================
+@override_settings(OTP_DEBUG_SINKS=[])
+class VerifyOTPTests(TestCase):
+    def test_success_consumes_the_otp(self):
+        otp_transaction, code = delivered_otp()
+
+        self.assertTrue(verify_otp(code, "LOGIN", email=EMAIL))
+        self.assertFalse(verify_otp(code, "LOGIN", email=EMAIL))
+        otp_transaction.refresh_from_db()
+        self.assertEqual(otp_transaction.status, OTPStatus.INVALIDATED)
+        self.assertEqual(otp_transaction.attempts, 1)
+
+    def test_wrong_code_uses_an_attempt(self):
+        otp_transaction, code = delivered_otp()
+
+        self.assertFalse(verify_otp("x" + code, "LOGIN", email=EMAIL))
+        otp_transaction.refresh_from_db()
+        self.assertEqual(otp_transaction.attempts, 1)
+        self.assertEqual(otp_transaction.status, OTPStatus.DELIVERED)
+        self.assertTrue(verify_otp(code, "LOGIN", email=EMAIL))
+
+    def test_exhausted_attempts_invalidate(self):
+        otp_transaction, code = delivered_otp()
+        for _ in range(3):
+            verify_otp("x" + code, "LOGIN", email=EMAIL)
+
+        self.assertFalse(verify_otp(code, "LOGIN", email=EMAIL))
+        otp_transaction.refresh_from_db()
+        self.assertEqual(otp_transaction.status, OTPStatus.INVALIDATED)
+
+    def test_expired_code_fails_and_expires(self):
+        otp_transaction, code = delivered_otp()
+        OTPTransaction.objects.filter(pk=otp_transaction.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertFalse(verify_otp(code, "LOGIN", email=EMAIL))
+        otp_transaction.refresh_from_db()
+        self.assertEqual(otp_transaction.status, OTPStatus.EXPIRED)
+
+    def test_undelivered_otp_does_not_verify(self):
+        _, code = generate_otp("LOGIN", email=EMAIL)
+
+        self.assertFalse(verify_otp(code, "LOGIN", email=EMAIL))
+
+    def test_only_the_latest_otp_verifies(self):
+        _, old_code = delivered_otp()
+        _, new_code = delivered_otp()
+
+        self.assertFalse(verify_otp(old_code, "LOGIN", email=EMAIL))
+        self.assertTrue(verify_otp(new_code, "LOGIN", email=EMAIL))
+
+
+@override_settings(OTP_DEBUG_SINKS=[])
+class ConcurrentVerifyOTPTests(TransactionTestCase):
+    SUBMITS = 4
+
+    def test_concurrent_correct_submits_verify_once(self):
+        _, code = delivered_otp()
+        barrier = threading.Barrier(self.SUBMITS)
+        results = []
+
+        def submit():
+            try:
+                barrier.wait()
+                results.append(verify_otp(code, "LOGIN", email=EMAIL))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=submit) for _ in range(self.SUBMITS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), [False] * (self.SUBMITS - 1) + [True])
+
+
+# ======================================================
+# CACHE-BACKED OTP STORE
+# ======================================================
+@override_settings(OTP_STORE_BACKENDS={"LOGIN": "cache"}, OTP_AUDIT_ASYNC=False, OTP_DEBUG_SINKS=[])
+class CacheStoreTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def resend(self, email="a@example.com"):
+        invalidate_existing_otps("LOGIN", email=email)
+        return generate_otp("LOGIN", email=email)[1]
+
+    def test_generate_and_verify_without_otp_rows(self):
+        code = self.resend()
+
+        self.assertFalse(verify_otp("x" + code, "LOGIN", email="a@example.com"))
+        self.assertTrue(verify_otp(code, "LOGIN", email="A@example.com"))
+        self.assertFalse(verify_otp(code, "LOGIN", email="a@example.com"))
+        self.assertFalse(OTPTransaction.objects.exists())
+        self.assertEqual(OTPAuditRecord.objects.count(), 4)
+
+    def test_attempts_are_limited(self):
+        code = self.resend()
+        for _ in range(3):
+            verify_otp("wrong", "LOGIN", email="a@example.com")
+
+        self.assertFalse(verify_otp(code, "LOGIN", email="a@example.com"))
+
+    def test_delivered_row_is_deleted(self):
+        code = self.resend()
+
+        self.assertEqual(deliver_all(), ["SENT"])
+        self.assertIn(code, mail.outbox[0].body)
+        self.assertFalse(OTPDeliveryOutbox.objects.exists())
+
+    def test_resend_drops_the_old_codes_delivery(self):
+        self.resend()
+        code = self.resend()
+
+        self.assertEqual(deliver_all(), ["SENT"])
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(code, mail.outbox[0].body)
+
+    def test_verified_code_is_not_delivered_again(self):
+        code = self.resend()
+
+        verify_otp(code, "LOGIN", email="a@example.com")
+
+        self.assertEqual(deliver_all(), [])
+
+
+# ======================================================
+# DEBUG SINKS
+# ======================================================
+class DebugSinkRegistryTests(SimpleTestCase):
+    @override_settings(DEBUG=False, OTP_DEBUG_SINKS=None)
+    def test_no_sinks_without_debug(self):
+        self.assertEqual(get_sinks(), {})
+
+    @override_settings(DEBUG=True, OTP_DEBUG_SINKS=None)
+    def test_console_and_file_with_debug(self):
+        self.assertEqual(sorted(get_sinks()), ["console", "file"])
+
+    def test_override_settings_rebuilds_the_sinks(self):
+        with override_settings(OTP_DEBUG_SINKS=["memory"]):
+            memory = get_sink("memory")
+            self.assertIsInstance(memory, MemorySink)
+            self.assertIs(get_sink("memory"), memory)
+
+        with override_settings(OTP_DEBUG_SINKS=["none", "otps.sinks.FileSink"]):
+            self.assertEqual(list(get_sinks()), ["otps.sinks.FileSink"])
+            self.assertIsInstance(get_sink("otps.sinks.FileSink"), FileSink)
+
+    @override_settings(OTP_DEBUG_SINKS=["inbox"])
+    def test_unknown_sink_is_a_configuration_error(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_sinks()
+
+
+@override_settings(OTP_DEBUG_SINKS=["memory"], OTP_AUDIT_ASYNC=False)
+class MemorySinkTests(TestCase):
+    def test_records_generated_codes(self):
+        _, code = generate_otp("LOGIN", email=EMAIL)
+        _, other = generate_otp("LOGIN", email="b@example.com")
+
+        self.assertEqual(get_sink("memory").latest(email=EMAIL)["otp_code"], code)
+        self.assertEqual(get_sink("memory").latest()["otp_code"], other)
+
+    @override_settings(OTP_STORE_BACKENDS={"LOGIN": "cache"})
+    def test_records_cache_stored_codes(self):
+        cache.clear()
+        _, code = generate_otp("LOGIN", email=EMAIL)
+
+        self.assertEqual(get_sink("memory").latest(email=EMAIL)["otp_code"], code)
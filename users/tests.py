@@ -1,3 +1,47 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+RATE_LIMITS = {
+    "send": [("email", 3, 60)],
+    "verify": [("email", 2, 60)],
+}
+
+
+# ======================================================
+# OTP RATE LIMITS
+# ======================================================
+@override_settings(OTP_RATE_LIMITS=RATE_LIMITS, OTP_DEBUG_SINKS=[])
+class OTPRateLimitViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def send_otp(self):
+        return self.client.post(
+            reverse("users:customer:customer_send_otp"),
+            {"email": "new@example.com", "purpose": "SIGNUP"},
+            content_type="application/json",
+        )
+
+    def test_send_over_budget_gets_429_without_db_queries(self):
+        for _ in range(3):
+            self.assertEqual(self.send_otp().status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.send_otp()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        self.assertFalse(response.json()["success"])
+
+    def test_login_over_budget_gets_429(self):
+        url = reverse("users:customer:customer_login")
+        data = {"email": "someone@example.com", "otp_code": "000000"}
+        for _ in range(2):
+            self.assertEqual(self.client.post(url, data).status_code, 400)
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        self.assertTemplateUsed(response, "users/customer_login.html")
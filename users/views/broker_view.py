@@ -12,6 +12,7 @@ from django.http import Http404, JsonResponse, HttpResponseForbidden
 from django.core.paginator import Paginator
 from otps.services import generate_otp, verify_otp, invalidate_existing_otps
 from otps.models import OTPPurpose
+from otps.ratelimit import check_rate_limit, client_ip, rate_limited_response
 
 # ✅ Only mandatory imports now used for authorization & blocking
 from config.permissions import is_broker
@@ -39,6 +40,11 @@ def send_broker_otp(request):
     if not email:
         return JsonResponse({"success": False, "message": "Email required"}, status=400)
 
+    # Before any DB work: over-budget senders cost one cache read
+    limit = check_rate_limit("send", purpose, email=email, ip=client_ip(request))
+    if not limit.allowed:
+        return rate_limited_response(limit)
+
     if purpose == "LOGIN":
         try:
             user = User.objects.get(email=email)
@@ -82,6 +88,13 @@ def broker_register(request):
         email = request.POST.get("email", "").strip()
         otp = request.POST.get("otp_code", "").strip()
         phone = request.POST.get("phone", "").strip()
+        limit = check_rate_limit("verify", OTPPurpose.SIGNUP, email=email, ip=client_ip(request))
+        if not limit.allowed:
+            messages.error(request, "Too many attempts. Please try again later.", "error")
+            return rate_limited_response(
+                limit, render(request, "users/broker_register.html", {"email": email})
+            )
+
         if User.objects.filter(email=email).exists():
             messages.error(request, "Email already exists.", "error")
             return render(
@@ -136,6 +149,13 @@ def broker_login(request):
         email = request.POST.get("email", "").strip()
         otp = request.POST.get("otp_code", "").strip()
 
+        limit = check_rate_limit("verify", OTPPurpose.LOGIN, email=email, ip=client_ip(request))
+        if not limit.allowed:
+            messages.error(request, "Too many attempts. Please try again later.", "error")
+            return rate_limited_response(
+                limit, render(request, "users/broker_login.html", {"email": email})
+            )
+
         try:
             user = User.objects.get(email=email)
         except User.DoesNotExist:
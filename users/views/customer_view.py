@@ -10,6 +10,7 @@ from django.views.decorators.http import require_POST
 from django.http import JsonResponse, HttpResponseForbidden
 from otps.services import generate_otp, verify_otp, invalidate_existing_otps
 from otps.models import OTPPurpose
+from otps.ratelimit import check_rate_limit, client_ip, rate_limited_response
 
 # ✅ Only mandatory imports for authorization & blocking
 from config.permissions import is_customer
@@ -35,6 +36,11 @@ def send_customer_otp(request):
     if not email:
         return JsonResponse({"success": False, "message": "Email required"}, status=400)
 
+    # Before any DB work: over-budget senders cost one cache read
+    limit = check_rate_limit("send", purpose, email=email, ip=client_ip(request))
+    if not limit.allowed:
+        return rate_limited_response(limit)
+
     if purpose == "LOGIN":
         try:
             user = User.objects.get(email=email)
@@ -95,6 +101,13 @@ def customer_register(request):
     broker_code = request.POST.get("broker")
     employee_id = request.POST.get("employee")
 
+    limit = check_rate_limit("verify", OTPPurpose.SIGNUP, email=email, ip=client_ip(request))
+    if not limit.allowed:
+        messages.error(request, "Too many attempts. Please try again later.", "error")
+        return rate_limited_response(
+            limit, render(request, "users/customer_register.html", {"email": email})
+        )
+
     if not verify_otp(otp, OTPPurpose.SIGNUP, email=email):
         messages.error(request, "Invalid OTP.")
         return redirect(request.path)
@@ -156,6 +169,13 @@ def customer_login(request):
         email = request.POST.get("email", "").strip()
         otp = request.POST.get("otp_code", "").strip()
 
+        limit = check_rate_limit("verify", OTPPurpose.LOGIN, email=email, ip=client_ip(request))
+        if not limit.allowed:
+            messages.error(request, "Too many attempts. Please try again later.", "error")
+            return rate_limited_response(
+                limit, render(request, "users/customer_login.html", {"email": email})
+            )
+
         try:
             user = User.objects.get(email=email)
         except User.DoesNotExist:
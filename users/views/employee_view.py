@@ -11,6 +11,7 @@ from django.http import JsonResponse, HttpResponseForbidden
 
 from otps.services import generate_otp, verify_otp, invalidate_existing_otps
 from otps.models import OTPPurpose
+from otps.ratelimit import check_rate_limit, client_ip, rate_limited_response
 
 # ✅ Only mandatory imports for authorization & blocking
 from config.permissions import is_employee
@@ -33,6 +34,11 @@ def send_employee_otp(request):
     if not email:
         return JsonResponse({"success": False, "message": "Email required"}, status=400)
 
+    # Before any DB work: over-budget senders cost one cache read
+    limit = check_rate_limit("send", purpose, email=email, ip=client_ip(request))
+    if not limit.allowed:
+        return rate_limited_response(limit)
+
     if purpose == "LOGIN":
         try:
             user = User.objects.get(email=email)
@@ -75,6 +81,13 @@ def employee_register(request):
         email = request.POST.get("email", "").strip()
         otp = request.POST.get("otp_code", "").strip()
         phone = request.POST.get("phone", "").strip()
+        limit = check_rate_limit("verify", OTPPurpose.SIGNUP, email=email, ip=client_ip(request))
+        if not limit.allowed:
+            messages.error(request, "Too many attempts. Please try again later.", "error")
+            return rate_limited_response(
+                limit, render(request, "users/employee_register.html", {"email": email})
+            )
+
         if User.objects.filter(email=email).exists():
             messages.error(request, "Email already exists.", "error")
             return render(
@@ -125,6 +138,13 @@ def employee_login(request):
         email = request.POST.get("email", "").strip()
         otp = request.POST.get("otp_code", "").strip()
 
+        limit = check_rate_limit("verify", OTPPurpose.LOGIN, email=email, ip=client_ip(request))
+        if not limit.allowed:
+            messages.error(request, "Too many attempts. Please try again later.", "error")
+            return rate_limited_response(
+                limit, render(request, "users/employee_login.html", {"email": email})
+            )
+
         try:
             user = User.objects.get(email=email)
         except User.DoesNotExist: